@@ -2,12 +2,11 @@ import logging
 import operator
 import threading
 from configparser import ConfigParser
-from typing import Any, Callable, get_type_hints
+from typing import Any, Callable, TYPE_CHECKING, get_type_hints
 
 from besser.bot.core.message import Message
 from besser.bot.core.transition import Transition
-from besser.bot.db import DB_MONITORING
-from besser.bot.db.monitoring_db import MonitoringDB
+from besser.bot.db import DB_MONITORING, DB_MONITORING_MAINTENANCE_INTERVAL, DB_MONITORING_RETENTION_DAYS
 from besser.bot.core.entity.entity import Entity
 from besser.bot.core.intent.intent import Intent
 from besser.bot.core.intent.intent_parameter import IntentParameter
@@ -22,8 +21,11 @@ from besser.bot.nlp.intent_classifier.intent_classifier_configuration import Int
     SimpleIntentClassifierConfiguration
 from besser.bot.nlp.nlp_engine import NLPEngine
 from besser.bot.platforms.platform import Platform
-from besser.bot.platforms.telegram.telegram_platform import TelegramPlatform
-from besser.bot.platforms.websocket.websocket_platform import WebSocketPlatform
+
+if TYPE_CHECKING:
+    from besser.bot.db.monitoring_db import MonitoringDB
+    from besser.bot.platforms.telegram.telegram_platform import TelegramPlatform
+    from besser.bot.platforms.websocket.websocket_platform import WebSocketPlatform
 
 
 class Bot:
@@ -62,7 +64,7 @@ class Bot:
         self._default_ic_config: IntentClassifierConfiguration = SimpleIntentClassifierConfiguration()
         self._sessions: dict[str, Session] = {}
         self._trained: bool = False
-        self._monitoring_db: MonitoringDB = None
+        self._monitoring_db: 'MonitoringDB' = None
         self.states: list[State] = []
         self.intents: list[Intent] = []
         self.entities: list[Entity] = []
@@ -302,10 +304,16 @@ class Bot:
             raise BotNotTrainedError(self)
         if self.get_property(DB_MONITORING):
             if not self._monitoring_db:
+                from besser.bot.db.monitoring_db import MonitoringDB
                 self._monitoring_db = MonitoringDB()
             self._monitoring_db.connect_to_db(self)
             if self._monitoring_db.connected:
                 self._monitoring_db.initialize_db()
+                if self.get_property(DB_MONITORING_MAINTENANCE_INTERVAL):
+                    self._monitoring_db.start_maintenance(
+                        interval=self.get_property(DB_MONITORING_MAINTENANCE_INTERVAL),
+                        retention_days=self.get_property(DB_MONITORING_RETENTION_DAYS)
+                    )
         self._run_platforms()
         if sleep:
             idle = threading.Event()
@@ -483,7 +491,7 @@ class Bot:
         """
         del self._sessions[session_id]
 
-    def use_websocket_platform(self, use_ui: bool = True) -> WebSocketPlatform:
+    def use_websocket_platform(self, use_ui: bool = True) -> 'WebSocketPlatform':
         """Use the :class:`~besser.bot.platforms.websocket.websocket_platform.WebSocketPlatform` on this bot.
 
         Args:
@@ -492,16 +500,18 @@ class Bot:
         Returns:
             WebSocketPlatform: the websocket platform
         """
+        from besser.bot.platforms.websocket.websocket_platform import WebSocketPlatform
         websocket_platform = WebSocketPlatform(self, use_ui)
         self._platforms.append(websocket_platform)
         return websocket_platform
 
-    def use_telegram_platform(self) -> TelegramPlatform:
+    def use_telegram_platform(self) -> 'TelegramPlatform':
         """Use the :class:`~besser.bot.platforms.telegram.telegram_platform.TelegramPlatform` on this bot.
 
         Returns:
             TelegramPlatform: the telegram platform
         """
+        from besser.bot.platforms.telegram.telegram_platform import TelegramPlatform
         telegram_platform = TelegramPlatform(self)
         self._platforms.append(telegram_platform)
         return telegram_platform
@@ -543,5 +553,7 @@ class Bot:
             session (Session): the session of the current user
         """
         if self.get_property(DB_MONITORING) and self._monitoring_db.connected:
+            if callable(message.content):
+                message.content = message.content()
             thread = threading.Thread(target=self._monitoring_db.insert_chat, args=(session, message))
             thread.start()
@@ -1,5 +1,43 @@
 import base64
+import io
 import json
+import mmap
+import os
+import tempfile
+import uuid
+import weakref
+from typing import BinaryIO
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+"""int: The size of the chunks (in bytes) copied when spooling a file to disk (see :meth:`File.from_stream`)."""
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file, ignoring the errors (e.g. if it was already removed).
+
+    Args:
+        path (str): the file path
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def create_spool_path(spool_dir: str = None) -> str:
+    """Create a unique path to spool a file to disk.
+
+    Args:
+        spool_dir (str, optional): the spool directory. If not set, the system temporary directory is used. It is
+            created if it does not exist
+
+    Returns:
+        str: the file path (the file is not created)
+    """
+    if spool_dir is None:
+        spool_dir = tempfile.gettempdir()
+    os.makedirs(spool_dir, exist_ok=True)
+    return os.path.join(spool_dir, f'besser_{uuid.uuid4().hex}')
 
 
 class File:
@@ -7,7 +45,10 @@ class File:
 
     Files are used to encapsulate information about the files exchanged in a bot conversation. They include
     attributes such as the file's name, type, and base64 representation.
-    Note that at least one of path, data or base64 need to be set. 
+    Note that at least one of path, data or base64 need to be set.
+
+    The file content is kept as it is given (a path, raw bytes or a base64 string). The raw bytes and the base64
+    representation are only computed when they are accessed, and the base64 representation is computed only once.
 
     Args:
         file_name (str): The name of the file.
@@ -15,22 +56,46 @@ class File:
         file_base64 (str, optional): The base64 representation of the file.
         file_path (str, optional): Path to the file.
         file_data (bytes, optional): Raw file data.
+        temporary (bool, optional): Whether the file in file_path is removed when the File object is garbage
+            collected (or :meth:`close` is called) or not.
 
     Attributes:
         _name (str): The name of the file.
         _type (str): The type of the file.
-        _base64 (str): The base64 representation of the file.
+        _base64 (str or None): The base64 representation of the file, if it has been computed.
+        _data (bytes or None): The raw file data, if it is kept in memory.
+        _path (str or None): Path to the file, if its content is read from disk.
+        _finalizer (weakref.finalize or None): The finalizer that removes the temporary file, if any.
     """
 
-    def __init__(self, file_name: str = None, file_type: str = None, file_base64: str = None, file_path: str = None, file_data: bytes = None):
+    def __init__(
+            self,
+            file_name: str = None,
+            file_type: str = None,
+            file_base64: str = None,
+            file_path: str = None,
+            file_data: bytes = None,
+            temporary: bool = False
+    ):
+        self._base64: str = None
+        self._data: bytes = None
+        self._path: str = None
+        self._finalizer: weakref.finalize = None
         if file_path:
-            with open(file_path, 'rb') as file:
-                file_data = file.read()
-                file_name = file_path.split('/')[-1]
-                file_type = file_path.split('.')[-1]
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(f"No such file: '{file_path}'")
+            self._path = file_path
+            if not file_name:
+                file_name = os.path.basename(file_path)
+            if not file_type and '.' in file_name:
+                file_type = file_name.split('.')[-1]
+            if temporary:
+                self._finalizer = weakref.finalize(self, _remove_file, file_path)
         elif file_base64:
-            file_data = base64.b64decode(file_base64)
-        elif file_data is None:
+            self._base64 = file_base64
+        elif file_data is not None:
+            self._data = file_data
+        else:
             raise ValueError("Invalid input parameters")
         if not file_name:
             file_name = 'default_filename'
@@ -38,7 +103,39 @@ class File:
             file_type = 'file'
         self._name = file_name
         self._type = file_type
-        self._base64 = base64.b64encode(file_data).decode('utf-8')
+
+    @staticmethod
+    def from_stream(
+            stream: BinaryIO,
+            file_name: str = None,
+            file_type: str = None,
+            spool_dir: str = None,
+            chunk_size: int = SPOOL_CHUNK_SIZE
+    ) -> 'File':
+        """Create a file from a binary stream, spooling its content to disk chunk by chunk (so large files are never
+        fully loaded in memory).
+
+        The spooled file is removed when the File object is garbage collected (or :meth:`close` is called).
+
+        Args:
+            stream (BinaryIO): the binary stream to read
+            file_name (str, optional): the name of the file
+            file_type (str, optional): the type of the file
+            spool_dir (str, optional): the spool directory. If not set, the system temporary directory is used
+            chunk_size (int, optional): the size of the chunks read from the stream, in bytes
+
+        Returns:
+            File: the file
+        """
+        path = create_spool_path(spool_dir)
+        try:
+            with open(path, 'wb') as spool_file:
+                while chunk := stream.read(chunk_size):
+                    spool_file.write(chunk)
+        except BaseException:
+            _remove_file(path)
+            raise
+        return File(file_name=file_name or 'default_filename', file_type=file_type, file_path=path, temporary=True)
 
     @property
     def name(self) -> str:
@@ -52,9 +149,53 @@ class File:
 
     @property
     def base64(self) -> str:
-        """Getter for the base64 representation of the file."""
+        """Getter for the base64 representation of the file. It is computed the first time it is accessed."""
+        if self._base64 is None:
+            if self._data is not None:
+                self._base64 = base64.b64encode(self._data).decode('utf-8')
+            elif self._path is not None:
+                with open(self._path, 'rb') as file:
+                    if os.fstat(file.fileno()).st_size == 0:
+                        self._base64 = ''
+                    else:
+                        # The file is encoded from a memory-mapped buffer, without reading it into a bytes object
+                        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                            self._base64 = base64.b64encode(buffer).decode('utf-8')
+            else:
+                # The temporary file was closed
+                return self._get_base64()
         return self._base64
 
+    @property
+    def data(self) -> bytes:
+        """Getter for the raw file data.
+
+        If the file was created from a path, the file is read from disk every time (use :meth:`open` to read it in
+        chunks). If it was created from a base64 string, it is decoded only once.
+        """
+        if self._data is not None:
+            return self._data
+        if self._path is not None:
+            with open(self._path, 'rb') as file:
+                return file.read()
+        self._data = base64.b64decode(self._get_base64())
+        return self._data
+
+    @property
+    def path(self) -> str or None:
+        """Getter for the path to the file, if its content is read from disk."""
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """Getter for the size of the file, in bytes."""
+        if self._data is not None:
+            return len(self._data)
+        if self._path is not None:
+            return os.path.getsize(self._path)
+        file_base64 = self._get_base64()
+        return len(file_base64) * 3 // 4 - file_base64.count('=', -2)
+
     @name.setter
     def name(self, value: str) -> None:
         """Setter for the name of the file."""
@@ -67,8 +208,42 @@ class File:
 
     @base64.setter
     def base64(self, value: str) -> None:
-        """Setter for the base64 representation of the file."""
+        """Setter for the base64 representation of the file. It replaces the file content."""
+        self.close()
         self._base64 = value
+        self._data = None
+        self._path = None
+
+    def _get_base64(self) -> str:
+        """Get the stored base64 representation of the file (when its content is neither in memory nor on disk).
+
+        Returns:
+            str: the base64 representation
+
+        Raises:
+            ValueError: if the file was closed before its base64 representation was computed
+        """
+        if self._base64 is None:
+            raise ValueError(f"The content of the closed file '{self._name}' is no longer available")
+        return self._base64
+
+    def open(self) -> BinaryIO:
+        """Open the file content as a binary stream.
+
+        Returns:
+            BinaryIO: the binary stream
+        """
+        if self._path is not None:
+            return open(self._path, 'rb')
+        return io.BytesIO(self.data)
+
+    def close(self) -> None:
+        """Remove the temporary file (see :meth:`from_stream`), if any. The file content is no longer available
+        afterwards (a ValueError is raised when accessing it), unless its base64 representation was already computed."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._path = None
 
     @staticmethod
     def decode(file_str):
@@ -88,7 +263,7 @@ class File:
         if file_name and file_type and file_base64:
             return File(file_name=file_name, file_type=file_type, file_base64=file_base64)
         return None
-    
+
     def get_json_string(self) -> str:
         """Returns a stringified dictionary containing the attributes of the File object."""
         return json.dumps({
@@ -104,7 +279,7 @@ class File:
             "type": self.type,
             "base64": self.base64,
         }
-        
+
     @staticmethod
     def from_dict(data):
         """Returns a File object generated based on the given dict object."""
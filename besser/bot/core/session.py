@@ -1,19 +1,19 @@
 import logging
 from datetime import datetime
-from typing import Any, TYPE_CHECKING
-
-from pandas import DataFrame
+from typing import Any, Iterable, TYPE_CHECKING
 
 from besser.bot.core.message import Message, MessageType, get_message_type
 from besser.bot.core.transition import Transition
 from besser.bot.core.file import File
 from besser.bot.db import DB_MONITORING
 from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
-from besser.bot.nlp.rag.rag import RAGMessage
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
+
     from besser.bot.core.bot import Bot
     from besser.bot.core.state import State
+    from besser.bot.nlp.rag.rag import RAGMessage
     from besser.bot.platforms.platform import Platform
 
 
@@ -140,7 +140,7 @@ class Session:
         """
         chat_history: list[Message] = []
         if self._bot.get_property(DB_MONITORING) and self._bot._monitoring_db.connected:
-            chat_df: DataFrame = self._bot._monitoring_db.select_chat(self, n=n)
+            chat_df: 'DataFrame' = self._bot._monitoring_db.select_chat(self, n=n)
             for i, row in chat_df.iterrows():
                 t = get_message_type(row['type'])
                 chat_history.append(Message(t=t, content=row['content'], is_user=row['is_user'], timestamp=row['timestamp']))
@@ -151,6 +151,9 @@ class Session:
     def save_message(self, message: Message) -> None:
         """Save a message in the dedicated chat DB
 
+        The message content can be a function that returns it, so that it is only computed if the message is actually
+        stored (e.g. the base64 representation of a file).
+
         Args:
             message (Message): the message to save
         """
@@ -208,7 +211,20 @@ class Session:
         # Multi-platform
         self._platform.reply(self, message)
 
-    def run_rag(self, message: str = None, llm_prompt: str = None, llm_name: str = None, k: int = None, num_previous_messages: int = None) -> RAGMessage:
+    def reply_stream(self, stream: Iterable[str]) -> str:
+        """A bot message is sent to the session platform as a stream of text chunks, which are shown to the user as
+        they are generated (e.g. by an LLM, see :meth:`~besser.bot.nlp.llm.llm.LLM.predict_stream`).
+
+        Args:
+            stream (Iterable[str]): the bot reply chunks
+
+        Returns:
+            str: the whole bot reply
+        """
+        # Multi-platform
+        return self._platform.reply_stream(self, stream)
+
+    def run_rag(self, message: str = None, llm_prompt: str = None, llm_name: str = None, k: int = None, num_previous_messages: int = None) -> 'RAGMessage':
         """Run the RAG engine.
 
         Args:
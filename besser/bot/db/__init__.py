@@ -80,3 +80,29 @@ type: ``str``
 
 default value: ``None``
 """
+
+DB_MONITORING_MAINTENANCE_INTERVAL = Property(SECTION_DB, 'db.monitoring.maintenance_interval', int, None)
+"""
+The time interval, in seconds, between executions of the monitoring database maintenance job, which runs in the
+background to incrementally aggregate the raw monitoring records into the hourly and daily rollup tables (and to prune
+old records, see ``db.monitoring.retention_days``). :obj:`None` disables the maintenance job.
+
+name: ``db.monitoring.maintenance_interval``
+
+type: ``int``
+
+default value: ``None``
+"""
+
+DB_MONITORING_RETENTION_DAYS = Property(SECTION_DB, 'db.monitoring.retention_days', int, None)
+"""
+The number of days the raw monitoring records (chat messages, intent predictions and transitions) are kept in the
+database. Older records are deleted by the maintenance job once they have been aggregated into the rollup tables.
+:obj:`None` keeps the records forever.
+
+name: ``db.monitoring.retention_days``
+
+type: ``int``
+
+default value: ``None``
+"""
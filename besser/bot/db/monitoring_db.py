@@ -1,10 +1,12 @@
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING, Any
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable
 
 import pandas as pd
 from sqlalchemy import Connection, create_engine, Column, String, Integer, UniqueConstraint, ForeignKey, DateTime, \
-    Float, MetaData, insert, Table, select, Executable, CursorResult, desc, Boolean
+    Float, MetaData, insert, Table, select, Executable, CursorResult, desc, Boolean, Index, case, delete, func, \
+    literal_column, true, update, Select, or_, false
 from sqlalchemy.orm import declarative_base
 
 from besser.bot.core.message import Message
@@ -35,6 +37,161 @@ TABLE_TRANSITION = 'transition'
 TABLE_CHAT = 'chat'
 """The name of the database table that contains the chat records"""
 
+TABLE_SCHEMA_VERSION = 'schema_version'
+"""The name of the database table that contains the applied schema migrations"""
+
+TABLE_ROLLUP_HOURLY = 'rollup_hourly'
+"""The name of the database table that contains the hourly aggregated monitoring records"""
+
+TABLE_ROLLUP_DAILY = 'rollup_daily'
+"""The name of the database table that contains the daily aggregated monitoring records"""
+
+TABLE_TRANSITION_EDGE = 'transition_edge'
+"""The name of the database table that contains the number of transitions between each pair of states (i.e., the
+edges of the bot flow graph)"""
+
+TABLE_ROLLUP_WATERMARK = 'rollup_watermark'
+"""The name of the database table that contains, for each raw table, the id of the last record aggregated into the
+rollup tables"""
+
+ROLLUP_METRIC_MESSAGES = 'messages'
+"""The rollup metric counting chat messages. Its names are ``user`` and ``bot``, depending on the message sender."""
+
+ROLLUP_METRIC_INTENT = 'intent'
+"""The rollup metric counting intent predictions. Its names are the predicted intents (fallbacks are counted under
+``fallback_intent``)."""
+
+ROLLUP_METRIC_TRANSITION = 'transition'
+"""The rollup metric counting transitions. Its names are the events that triggered the transitions."""
+
+ROLLUP_SOURCES: dict[str, str] = {
+    ROLLUP_METRIC_MESSAGES: TABLE_CHAT,
+    ROLLUP_METRIC_INTENT: TABLE_INTENT_PREDICTION,
+    ROLLUP_METRIC_TRANSITION: TABLE_TRANSITION,
+}
+"""The raw table each rollup metric is computed from."""
+
+ROLLUP_TABLES: dict[str, str] = {
+    'hour': TABLE_ROLLUP_HOURLY,
+    'day': TABLE_ROLLUP_DAILY,
+}
+"""The rollup table of each time granularity."""
+
+ROLLUP_BATCH_SIZE = 50000
+"""Maximum number of raw records aggregated in a single rollup transaction."""
+
+ROLLUP_DELAY = timedelta(minutes=1)
+"""Raw records are not aggregated until they are older than this delay, so that records inserted concurrently (whose
+ids may be committed out of order) are not skipped."""
+
+INDEXES: dict[str, list[tuple[str, list[str]]]] = {
+    TABLE_SESSION: [
+        # The (bot_name, session_id) lookup is already backed by the table's unique constraint
+        ('ix_session_bot_name_id', ['bot_name', 'id']),
+    ],
+    TABLE_CHAT: [
+        ('ix_chat_session_id_id', ['session_id', 'id']),
+        ('ix_chat_session_id_timestamp', ['session_id', 'timestamp']),
+    ],
+    TABLE_TRANSITION: [
+        ('ix_transition_session_id_id', ['session_id', 'id']),
+        ('ix_transition_session_id_timestamp', ['session_id', 'timestamp']),
+    ],
+    TABLE_INTENT_PREDICTION: [
+        ('ix_intent_prediction_session_id_id', ['session_id', 'id']),
+        ('ix_intent_prediction_session_id_timestamp', ['session_id', 'timestamp']),
+        ('ix_intent_prediction_intent', ['intent']),
+    ],
+    TABLE_PARAMETER: [
+        ('ix_parameter_intent_prediction_id', ['intent_prediction_id']),
+    ],
+}
+"""The secondary indexes of the monitoring database. Keys are table names and values are lists of (index name,
+indexed columns) tuples."""
+
+
+def _create_indexes(conn: Connection, indexes: dict[str, list[tuple[str, list[str]]]]) -> None:
+    """Create a set of indexes in the database, skipping those that already exist.
+
+    Args:
+        conn (sqlalchemy.Connection): the connection to the database
+        indexes (dict[str, list[tuple[str, list[str]]]]): the indexes to create, grouped by table name
+    """
+    metadata = MetaData()
+    for table_name, table_indexes in indexes.items():
+        table = Table(table_name, metadata, autoload_with=conn)
+        for index_name, columns in table_indexes:
+            Index(index_name, *[table.c[column] for column in columns]).create(conn, checkfirst=True)
+
+
+def _migration_add_indexes(conn: Connection) -> None:
+    """Migration 1: create the secondary indexes of the monitoring tables (see :any:`INDEXES`)."""
+    _create_indexes(conn, INDEXES)
+
+
+def _select_transition_edges(
+        conn: Connection,
+        min_id: int = None,
+        max_id: int = None,
+        bot_names: list[str] = None
+) -> Select:
+    """Get the query that counts the transitions of each bot between each pair of states, grouped by the event that
+    triggered them.
+
+    Args:
+        conn (sqlalchemy.Connection): the connection to the database
+        min_id (int): only count transitions with a greater id
+        max_id (int): only count transitions with a lower or equal id
+        bot_names (list[str]): only count the transitions of these bots. If none is provided, all bots are included
+
+    Returns:
+        sqlalchemy.Select: the query, with columns bot_name, source_state, dest_state, event, info and count
+    """
+    metadata = MetaData()
+    table = Table(TABLE_TRANSITION, metadata, autoload_with=conn)
+    table_session = Table(TABLE_SESSION, metadata, autoload_with=conn)
+    info = func.coalesce(table.c.info, literal_column("''"))
+    stmt = (
+        select(table_session.c.bot_name, table.c.source_state, table.c.dest_state, table.c.event, info.label('info'),
+               func.count().label('count'))
+        .select_from(table.join(table_session, table.c.session_id == table_session.c.id))
+        .group_by(table_session.c.bot_name, table.c.source_state, table.c.dest_state, table.c.event, info)
+    )
+    if min_id is not None:
+        stmt = stmt.where(table.c.id > min_id)
+    if max_id is not None:
+        stmt = stmt.where(table.c.id <= max_id)
+    if bot_names:
+        stmt = stmt.where(table_session.c.bot_name.in_(bot_names))
+    return stmt
+
+
+def _migration_backfill_transition_edges(conn: Connection) -> None:
+    """Migration 2: fill the transition edge table with the transitions that were aggregated into the rollup tables
+    before the transition edge table existed."""
+    metadata = MetaData()
+    table_edge = Table(TABLE_TRANSITION_EDGE, metadata, autoload_with=conn)
+    if conn.execute(select(func.count()).select_from(table_edge)).scalar():
+        return
+    table_watermark = Table(TABLE_ROLLUP_WATERMARK, metadata, autoload_with=conn)
+    last_id = conn.execute(
+        select(table_watermark.c.last_id).where(table_watermark.c.table_name == TABLE_TRANSITION)
+    ).scalar()
+    if last_id:
+        conn.execute(insert(table_edge).from_select(
+            ['bot_name', 'source_state', 'dest_state', 'event', 'info', 'count'],
+            _select_transition_edges(conn, max_id=last_id)
+        ))
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, 'Add secondary indexes to the monitoring tables', _migration_add_indexes),
+    (2, 'Backfill the transition edge table', _migration_backfill_transition_edges),
+]
+"""The schema migrations of the monitoring database, as (version, description, migration function) tuples sorted by
+version. Migrations must be idempotent, since they can be run over databases that already contain (part of) their
+changes. New migrations must be appended with a greater version number."""
+
 
 class MonitoringDB:
     """This class is an interface to connect to a database where user interactions with the bot are stored to monitor
@@ -43,11 +200,15 @@ class MonitoringDB:
     Attributes:
         conn (sqlalchemy.Connection): The connection to the monitoring database
         connected (bool): Whether there is an active connection to the monitoring database or not
+        _maintenance_thread (threading.Thread or None): The thread running the background maintenance job
+        _maintenance_stop (threading.Event): Event used to stop the background maintenance job
     """
 
     def __init__(self):
         self.conn: Connection = None
         self.connected: bool = False
+        self._maintenance_thread: threading.Thread or None = None
+        self._maintenance_stop: threading.Event = threading.Event()
 
     def connect_to_db(self, bot: 'Bot') -> None:
         """Connect to the monitoring database.
@@ -124,8 +285,96 @@ class MonitoringDB:
             is_user = Column(Boolean, nullable=False)
             timestamp = Column(DateTime, nullable=False)
 
+        class TableRollupHourly(Base):
+            __tablename__ = TABLE_ROLLUP_HOURLY
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            bucket = Column(DateTime, nullable=False)
+            bot_name = Column(String, nullable=False)
+            metric = Column(String, nullable=False)
+            name = Column(String, nullable=False)
+            count = Column(Integer, nullable=False)
+            __table_args__ = (
+                UniqueConstraint('bucket', 'bot_name', 'metric', 'name'),
+            )
+
+        class TableRollupDaily(Base):
+            __tablename__ = TABLE_ROLLUP_DAILY
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            bucket = Column(DateTime, nullable=False)
+            bot_name = Column(String, nullable=False)
+            metric = Column(String, nullable=False)
+            name = Column(String, nullable=False)
+            count = Column(Integer, nullable=False)
+            __table_args__ = (
+                UniqueConstraint('bucket', 'bot_name', 'metric', 'name'),
+            )
+
+        class TableTransitionEdge(Base):
+            __tablename__ = TABLE_TRANSITION_EDGE
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            bot_name = Column(String, nullable=False)
+            source_state = Column(String, nullable=False)
+            dest_state = Column(String, nullable=False)
+            event = Column(String, nullable=False)
+            info = Column(String, nullable=False)
+            count = Column(Integer, nullable=False)
+            __table_args__ = (
+                UniqueConstraint('bot_name', 'source_state', 'dest_state', 'event', 'info'),
+            )
+
+        class TableRollupWatermark(Base):
+            __tablename__ = TABLE_ROLLUP_WATERMARK
+            table_name = Column(String, primary_key=True)
+            last_id = Column(Integer, nullable=False)
+
+        class TableSchemaVersion(Base):
+            __tablename__ = TABLE_SCHEMA_VERSION
+            version = Column(Integer, primary_key=True, autoincrement=False)
+            description = Column(String, nullable=False)
+            timestamp = Column(DateTime, nullable=False)
+
         Base.metadata.create_all(self.conn)
         self.conn.commit()
+        self.migrate_db()
+
+    def get_schema_version(self) -> int:
+        """Get the current schema version of the monitoring database, i.e., the latest applied migration.
+
+        Returns:
+            int: the schema version, or 0 if no migration has been applied
+        """
+        table = Table(TABLE_SCHEMA_VERSION, MetaData(), autoload_with=self.conn)
+        stmt = select(table.c.version).order_by(desc(table.c.version)).limit(1)
+        version = self.conn.execute(stmt).scalar()
+        self.conn.commit()
+        return version if version is not None else 0
+
+    def migrate_db(self) -> None:
+        """Apply the pending schema migrations (see :any:`MIGRATIONS`) to the monitoring database.
+
+        Each migration runs in its own transaction, together with the record of its version in the schema version
+        table, so an interrupted migration process can be safely resumed.
+        """
+        current_version = self.get_schema_version()
+        table = Table(TABLE_SCHEMA_VERSION, MetaData(), autoload_with=self.conn)
+        for version, description, migration in MIGRATIONS:
+            if version <= current_version:
+                continue
+            try:
+                migration(self.conn)
+                self.conn.execute(insert(table).values(
+                    version=version,
+                    description=description,
+                    timestamp=datetime.now(),
+                ))
+                self.conn.commit()
+                logging.info(f'Monitoring DB migrated to version {version}: {description}')
+            except Exception as e:
+                # Another bot may be migrating the same database at the same time
+                self.conn.rollback()
+                logging.error(f'Monitoring DB migration to version {version} failed. See the attached exception:')
+                logging.error(e)
+                break
 
     def insert_session(self, session: Session) -> None:
         """Insert a new session record into the sessions table of the monitoring database.
@@ -294,8 +543,468 @@ class MonitoringDB:
         query = f"SELECT * FROM {table_name}"
         return pd.read_sql_query(query, self.conn)
 
+    def get_table_page(
+            self,
+            table_name: str,
+            after_id: int = None,
+            limit: int = 100,
+            filters: dict[str, Any] = None
+    ) -> pd.DataFrame:
+        """Gets a page of records of a database table, using keyset pagination on the id column.
+
+        The filters are translated to SQL conditions, depending on the type of the filter value:
+
+        - ``tuple`` (min, max): the column value must be between min and max (e.g., a time window on the timestamp
+          column)
+        - ``list``: the column value must be one of the list values (None matches the null values)
+        - ``str``: the column value must contain the string
+
+        Args:
+            table_name (str): the name of the table
+            after_id (int): the id of the last record of the previous page. If none is provided, the first page is
+                returned
+            limit (int): the maximum number of records of the page
+            filters (dict[str, Any]): the column filters. Keys are column names and values are the filter values
+
+        Returns:
+            pandas.DataFrame: the page records, sorted by id
+        """
+        table = Table(table_name, MetaData(), autoload_with=self.conn)
+        stmt = select(table).order_by(table.c.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(table.c.id > after_id)
+        for column_name, value in (filters or {}).items():
+            column = table.c[column_name]
+            if isinstance(value, tuple):
+                stmt = stmt.where(column.between(*value))
+            elif isinstance(value, list):
+                # NULL never matches an IN condition, so null values are checked separately
+                values = [v for v in value if v is not None]
+                conditions = [column.in_(values)] if values else []
+                if None in value:
+                    conditions.append(column.is_(None))
+                stmt = stmt.where(or_(*conditions) if conditions else false())
+            else:
+                stmt = stmt.where(column.contains(value, autoescape=True))
+        return pd.read_sql_query(stmt, self.conn)
+
+    def get_column_range(self, table_name: str, column_name: str) -> tuple[Any, Any]:
+        """Gets the minimum and maximum values of a table column.
+
+        Args:
+            table_name (str): the name of the table
+            column_name (str): the name of the column
+
+        Returns:
+            tuple[Any, Any]: the minimum and maximum values (None if the table is empty)
+        """
+        table = Table(table_name, MetaData(), autoload_with=self.conn)
+        column = table.c[column_name]
+        min_value, max_value = self.conn.execute(select(func.min(column), func.max(column))).one()
+        self.conn.commit()
+        return min_value, max_value
+
+    def get_column_values(self, table_name: str, column_name: str, limit: int = None) -> list[Any]:
+        """Gets the distinct values of a table column.
+
+        Args:
+            table_name (str): the name of the table
+            column_name (str): the name of the column
+            limit (int): the maximum number of values to get. If none is provided, all the values are returned
+
+        Returns:
+            list[Any]: the distinct values
+        """
+        table = Table(table_name, MetaData(), autoload_with=self.conn)
+        column = table.c[column_name]
+        # Not sorted in the database, so the query can finish as soon as the limit is reached
+        stmt = select(column).distinct().limit(limit)
+        values = list(self.conn.execute(stmt).scalars())
+        self.conn.commit()
+        return values
+
+    def _time_bucket(self, column: Column, granularity: str, conn: Connection = None):
+        """Get the SQL expression that truncates a timestamp column to a time bucket.
+
+        Args:
+            column (sqlalchemy.Column): the timestamp column
+            granularity (str): the bucket size, either ``hour`` or ``day``
+            conn (sqlalchemy.Connection): the connection whose dialect is used. If none is provided, the default
+                connection will be used
+
+        Returns:
+            the SQL expression of the time bucket
+        """
+        if granularity not in ROLLUP_TABLES:
+            raise ValueError(f"Invalid time granularity '{granularity}'. Use one of {list(ROLLUP_TABLES.keys())}")
+        conn = conn if conn is not None else self.conn
+        dialect = conn.dialect.name
+        if dialect == 'sqlite':
+            fmt = '%Y-%m-%d %H:00:00' if granularity == 'hour' else '%Y-%m-%d 00:00:00'
+            return func.strftime(literal_column(f"'{fmt}'"), column)
+        if dialect in ['mysql', 'mariadb']:
+            fmt = '%Y-%m-%d %H:00:00' if granularity == 'hour' else '%Y-%m-%d 00:00:00'
+            return func.date_format(column, literal_column(f"'{fmt}'"))
+        # PostgreSQL and most analytical databases
+        return func.date_trunc(literal_column(f"'{granularity}'"), column)
+
+    def _select_metric_counts(
+            self,
+            conn: Connection,
+            metric: str,
+            granularity: str,
+            min_id: int = None,
+            max_id: int = None,
+            bot_names: list[str] = None
+    ) -> pd.DataFrame:
+        """Aggregate the raw records of a rollup metric by time bucket, bot and name.
+
+        Args:
+            conn (sqlalchemy.Connection): the connection to the monitoring database
+            metric (str): the rollup metric (see :any:`ROLLUP_SOURCES`)
+            granularity (str): the bucket size, either ``hour`` or ``day``
+            min_id (int): only aggregate raw records with a greater id
+            max_id (int): only aggregate raw records with a lower or equal id
+            bot_names (list[str]): only aggregate records of these bots. If none is provided, all bots are aggregated
+
+        Returns:
+            pandas.DataFrame: the aggregated counts, with columns bucket, bot_name, name and count
+        """
+        metadata = MetaData()
+        table = Table(ROLLUP_SOURCES[metric], metadata, autoload_with=conn)
+        table_session = Table(TABLE_SESSION, metadata, autoload_with=conn)
+        if metric == ROLLUP_METRIC_MESSAGES:
+            name = case((table.c.is_user == true(), 'user'), else_='bot')
+        elif metric == ROLLUP_METRIC_INTENT:
+            name = table.c.intent
+        else:
+            name = table.c.event
+        bucket = self._time_bucket(table.c.timestamp, granularity, conn)
+        stmt = (
+            select(bucket.label('bucket'), table_session.c.bot_name, name.label('name'), func.count().label('count'))
+            .select_from(table.join(table_session, table.c.session_id == table_session.c.id))
+            .group_by(bucket, table_session.c.bot_name, name)
+        )
+        if min_id is not None:
+            stmt = stmt.where(table.c.id > min_id)
+        if max_id is not None:
+            stmt = stmt.where(table.c.id <= max_id)
+        if bot_names:
+            stmt = stmt.where(table_session.c.bot_name.in_(bot_names))
+        df = pd.read_sql_query(stmt, conn)
+        df['bucket'] = pd.to_datetime(df['bucket'])
+        return df
+
+    def _get_watermark(self, conn: Connection, table_name: str) -> int:
+        """Get the id of the last record of a raw table that has been aggregated into the rollup tables.
+
+        Args:
+            conn (sqlalchemy.Connection): the connection to the monitoring database
+            table_name (str): the name of the raw table
+
+        Returns:
+            int: the watermark id (0 if no record has been aggregated yet)
+        """
+        table = Table(TABLE_ROLLUP_WATERMARK, MetaData(), autoload_with=conn)
+        stmt = select(table.c.last_id).where(table.c.table_name == table_name)
+        last_id = conn.execute(stmt).scalar()
+        return last_id if last_id is not None else 0
+
+    def rollup(self, conn: Connection = None) -> None:
+        """Aggregate the new raw monitoring records into the hourly and daily rollup tables.
+
+        The rollup is incremental: only the records inserted since the last execution are aggregated. Each batch of
+        records is aggregated in a single transaction, together with the update of the table watermark, so concurrent
+        executions (e.g., several bots sharing the same database) never aggregate the same records twice.
+
+        Args:
+            conn (sqlalchemy.Connection): the connection to the monitoring database. If none is provided, the default
+                connection will be used
+        """
+        conn = conn if conn is not None else self.conn
+        metadata = MetaData()
+        table_watermark = Table(TABLE_ROLLUP_WATERMARK, metadata, autoload_with=conn)
+        rollup_tables = {granularity: Table(table_name, metadata, autoload_with=conn)
+                         for granularity, table_name in ROLLUP_TABLES.items()}
+        for metric, table_name in ROLLUP_SOURCES.items():
+            table = Table(table_name, metadata, autoload_with=conn)
+            while True:
+                last_id = self._get_watermark(conn, table_name)
+                stmt = select(func.max(table.c.id)).where(
+                    table.c.id > last_id,
+                    table.c.id <= last_id + ROLLUP_BATCH_SIZE,
+                    table.c.timestamp < datetime.now() - ROLLUP_DELAY
+                )
+                max_id = conn.execute(stmt).scalar()
+                if max_id is None:
+                    conn.commit()
+                    break
+                try:
+                    # Compare-and-set the watermark, so that only 1 concurrent execution can aggregate this batch
+                    if last_id == 0 and conn.execute(select(table_watermark.c.last_id).where(
+                            table_watermark.c.table_name == table_name)).scalar() is None:
+                        conn.execute(insert(table_watermark).values(table_name=table_name, last_id=max_id))
+                    else:
+                        result = conn.execute(update(table_watermark).where(
+                            table_watermark.c.table_name == table_name,
+                            table_watermark.c.last_id == last_id
+                        ).values(last_id=max_id))
+                        if result.rowcount != 1:
+                            conn.rollback()
+                            continue
+                    for granularity, rollup_table in rollup_tables.items():
+                        counts = self._select_metric_counts(conn, metric, granularity, min_id=last_id, max_id=max_id)
+                        for row in counts.itertuples(index=False):
+                            bucket = row.bucket.to_pydatetime()
+                            result = conn.execute(update(rollup_table).where(
+                                rollup_table.c.bucket == bucket,
+                                rollup_table.c.bot_name == row.bot_name,
+                                rollup_table.c.metric == metric,
+                                rollup_table.c.name == row.name
+                            ).values(count=rollup_table.c['count'] + int(row.count)))
+                            if result.rowcount == 0:
+                                conn.execute(insert(rollup_table).values(
+                                    bucket=bucket,
+                                    bot_name=row.bot_name,
+                                    metric=metric,
+                                    name=row.name,
+                                    count=int(row.count)
+                                ))
+                    if metric == ROLLUP_METRIC_TRANSITION:
+                        self._rollup_transition_edges(conn, min_id=last_id, max_id=max_id)
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    logging.error(f"An error occurred while aggregating the monitoring table '{table_name}'. "
+                                  f"See the attached exception:")
+                    logging.error(e)
+                    break
+
+    def _rollup_transition_edges(self, conn: Connection, min_id: int, max_id: int) -> None:
+        """Add a batch of transitions to the transition edge table. The transaction is not committed.
+
+        Args:
+            conn (sqlalchemy.Connection): the connection to the monitoring database
+            min_id (int): only aggregate transitions with a greater id
+            max_id (int): only aggregate transitions with a lower or equal id
+        """
+        table_edge = Table(TABLE_TRANSITION_EDGE, MetaData(), autoload_with=conn)
+        edges = conn.execute(_select_transition_edges(conn, min_id=min_id, max_id=max_id)).fetchall()
+        for bot_name, source_state, dest_state, event, info, count in edges:
+            result = conn.execute(update(table_edge).where(
+                table_edge.c.bot_name == bot_name,
+                table_edge.c.source_state == source_state,
+                table_edge.c.dest_state == dest_state,
+                table_edge.c.event == event,
+                table_edge.c.info == info
+            ).values(count=table_edge.c['count'] + count))
+            if result.rowcount == 0:
+                conn.execute(insert(table_edge).values(
+                    bot_name=bot_name,
+                    source_state=source_state,
+                    dest_state=dest_state,
+                    event=event,
+                    info=info,
+                    count=count
+                ))
+
+    def prune(self, retention_days: int, conn: Connection = None) -> None:
+        """Delete the raw monitoring records older than the retention period.
+
+        Only records that have already been aggregated into the rollup tables are deleted, so no information is lost
+        from the rollups. The parameters of the deleted intent predictions are deleted as well.
+
+        Args:
+            retention_days (int): the number of days the raw records are kept
+            conn (sqlalchemy.Connection): the connection to the monitoring database. If none is provided, the default
+                connection will be used
+        """
+        conn = conn if conn is not None else self.conn
+        limit = datetime.now() - timedelta(days=retention_days)
+        metadata = MetaData()
+        for table_name in ROLLUP_SOURCES.values():
+            table = Table(table_name, metadata, autoload_with=conn)
+            condition = (table.c.timestamp < limit) & (table.c.id <= self._get_watermark(conn, table_name))
+            try:
+                if table_name == TABLE_INTENT_PREDICTION:
+                    table_parameter = Table(TABLE_PARAMETER, metadata, autoload_with=conn)
+                    conn.execute(delete(table_parameter).where(
+                        table_parameter.c.intent_prediction_id.in_(select(table.c.id).where(condition))
+                    ))
+                result = conn.execute(delete(table).where(condition))
+                conn.commit()
+                if result.rowcount:
+                    logging.info(f"Pruned {result.rowcount} records from the monitoring table '{table_name}'")
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"An error occurred while pruning the monitoring table '{table_name}'. "
+                              f"See the attached exception:")
+                logging.error(e)
+
+    def get_metric_counts(self, metric: str, granularity: str = 'day', bot_names: list[str] = None) -> pd.DataFrame:
+        """Get the counts of a rollup metric, aggregated by time bucket, bot and name.
+
+        The counts are read from the rollup tables, plus the raw records that have not been aggregated yet, so the
+        result is always up-to-date, no matter how much history the raw tables contain.
+
+        Args:
+            metric (str): the rollup metric (see :any:`ROLLUP_SOURCES`)
+            granularity (str): the bucket size, either ``hour`` or ``day``
+            bot_names (list[str]): only get the counts of these bots. If none is provided, all bots are included
+
+        Returns:
+            pandas.DataFrame: the counts, with columns bucket, bot_name, name and count
+        """
+        table = Table(ROLLUP_TABLES[granularity], MetaData(), autoload_with=self.conn)
+        stmt = select(table.c.bucket, table.c.bot_name, table.c.name, table.c['count']).where(table.c.metric == metric)
+        if bot_names:
+            stmt = stmt.where(table.c.bot_name.in_(bot_names))
+        rollup_counts = pd.read_sql_query(stmt, self.conn)
+        rollup_counts['bucket'] = pd.to_datetime(rollup_counts['bucket'])
+        last_id = self._get_watermark(self.conn, ROLLUP_SOURCES[metric])
+        recent_counts = self._select_metric_counts(self.conn, metric, granularity, min_id=last_id, bot_names=bot_names)
+        self.conn.commit()
+        counts = [df for df in [rollup_counts, recent_counts] if not df.empty]
+        if not counts:
+            return pd.DataFrame(columns=['bucket', 'bot_name', 'name', 'count'])
+        return pd.concat(counts).groupby(['bucket', 'bot_name', 'name'], as_index=False)['count'].sum()
+
+    def _filter_by_bots(self, stmt: Select, table: Table, bot_names: list[str] = None) -> Select:
+        """Filter a query over a table referencing the sessions table, keeping only the records of the given bots.
+
+        Args:
+            stmt (sqlalchemy.Select): the query to filter
+            table (sqlalchemy.Table): the queried table. It must have a session_id column
+            bot_names (list[str]): the bot names. If none is provided, the query is not filtered
+
+        Returns:
+            sqlalchemy.Select: the filtered query
+        """
+        if not bot_names:
+            return stmt
+        table_session = Table(TABLE_SESSION, MetaData(), autoload_with=self.conn)
+        return stmt.where(table.c.session_id.in_(
+            select(table_session.c.id).where(table_session.c.bot_name.in_(bot_names))
+        ))
+
+    def get_bot_names(self) -> list[str]:
+        """Get the names of all the bots with sessions in the monitoring database.
+
+        Returns:
+            list[str]: the bot names
+        """
+        table = Table(TABLE_SESSION, MetaData(), autoload_with=self.conn)
+        stmt = select(table.c.bot_name).distinct().order_by(table.c.bot_name)
+        bot_names = list(self.conn.execute(stmt).scalars())
+        self.conn.commit()
+        return bot_names
+
+    def count_sessions(self, bot_names: list[str] = None) -> int:
+        """Count the sessions in the monitoring database.
+
+        Args:
+            bot_names (list[str]): only count the sessions of these bots. If none is provided, all bots are included
+
+        Returns:
+            int: the number of sessions
+        """
+        table = Table(TABLE_SESSION, MetaData(), autoload_with=self.conn)
+        stmt = select(func.count()).select_from(table)
+        if bot_names:
+            stmt = stmt.where(table.c.bot_name.in_(bot_names))
+        num_sessions = self.conn.execute(stmt).scalar()
+        self.conn.commit()
+        return num_sessions
+
+    def get_transition_edges(self, bot_names: list[str] = None) -> pd.DataFrame:
+        """Count the transitions between each pair of states, grouped by the event that triggered them.
+
+        The counts are read from the transition edge table (maintained by :meth:`rollup`), plus the transitions that
+        have not been aggregated yet, so the cost depends on the number of distinct edges and not on the size of the
+        transition history.
+
+        Args:
+            bot_names (list[str]): only count the transitions of these bots. If none is provided, all bots are
+                included
+
+        Returns:
+            pandas.DataFrame: the transition counts, with columns source_state, dest_state, event, info and count
+        """
+        columns = ['source_state', 'dest_state', 'event', 'info']
+        table_edge = Table(TABLE_TRANSITION_EDGE, MetaData(), autoload_with=self.conn)
+        stmt = select(*[table_edge.c[column] for column in columns], table_edge.c['count'])
+        if bot_names:
+            stmt = stmt.where(table_edge.c.bot_name.in_(bot_names))
+        edges = pd.read_sql_query(stmt, self.conn)
+        last_id = self._get_watermark(self.conn, TABLE_TRANSITION)
+        recent_edges = pd.read_sql_query(
+            _select_transition_edges(self.conn, min_id=last_id, bot_names=bot_names), self.conn
+        ).drop(columns='bot_name')
+        self.conn.commit()
+        edges = [df for df in [edges, recent_edges] if not df.empty]
+        if not edges:
+            return pd.DataFrame(columns=columns + ['count'])
+        return pd.concat(edges).groupby(columns, as_index=False)['count'].sum()
+
+    def get_intent_predictions(self, intent: str, bot_names: list[str] = None) -> pd.DataFrame:
+        """Get the intent prediction records of a specific intent.
+
+        Args:
+            intent (str): the predicted intent
+            bot_names (list[str]): only get the predictions of these bots. If none is provided, all bots are included
+
+        Returns:
+            pandas.DataFrame: the intent predictions, with columns timestamp, message, score and intent_classifier
+        """
+        table = Table(TABLE_INTENT_PREDICTION, MetaData(), autoload_with=self.conn)
+        stmt = (
+            select(table.c.timestamp, table.c.message, table.c.score, table.c.intent_classifier)
+            .where(table.c.intent == intent)
+            .order_by(table.c.id)
+        )
+        stmt = self._filter_by_bots(stmt, table, bot_names)
+        return pd.read_sql_query(stmt, self.conn)
+
+    def start_maintenance(self, interval: int, retention_days: int = None) -> None:
+        """Start the background maintenance job of the monitoring database.
+
+        The job periodically aggregates the new raw records into the rollup tables (see :meth:`rollup`) and, if a
+        retention period is set, deletes the old raw records (see :meth:`prune`). It uses its own database
+        connection.
+
+        Args:
+            interval (int): the time, in seconds, between job executions
+            retention_days (int): the number of days the raw records are kept. If none is provided, they are never
+                deleted
+        """
+        def run_maintenance() -> None:
+            conn = self.conn.engine.connect()
+            try:
+                while True:
+                    try:
+                        self.rollup(conn)
+                        if retention_days:
+                            self.prune(retention_days, conn)
+                    except Exception as e:
+                        conn.rollback()
+                        logging.error('An error occurred during the monitoring DB maintenance. See the attached '
+                                      'exception:')
+                        logging.error(e)
+                    if self._maintenance_stop.wait(interval):
+                        break
+            finally:
+                conn.close()
+
+        self._maintenance_stop.clear()
+        self._maintenance_thread = threading.Thread(target=run_maintenance, daemon=True)
+        self._maintenance_thread.start()
+
     def close_connection(self) -> None:
         """Close the connection to the monitoring database"""
+        if self._maintenance_thread is not None:
+            self._maintenance_stop.set()
+            self._maintenance_thread.join()
+            self._maintenance_thread = None
         self.conn.close()
         self.conn.engine.dispose()
         self.connected = False
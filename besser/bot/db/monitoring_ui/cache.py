@@ -0,0 +1,69 @@
+import pandas as pd
+import streamlit as st
+
+from besser.bot.db.monitoring_db import MonitoringDB, ROLLUP_METRIC_INTENT
+
+QUERY_CACHE_TTL = 10
+"""Time (in seconds) during which the results of the aggregation queries are shared among widgets and browser sessions
+before querying the database again."""
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_metric_counts(_monitoring_db: MonitoringDB, metric: str, granularity: str = 'day',
+                      bot_names: list[str] = None) -> pd.DataFrame:
+    """Get the counts of a rollup metric (see :meth:`MonitoringDB.get_metric_counts`), sharing the result among widgets
+    and browser sessions for a short time.
+
+    Args:
+        _monitoring_db (MonitoringDB): the monitoring database (not hashed by Streamlit)
+        metric (str): the rollup metric
+        granularity (str): the bucket size, either ``hour`` or ``day``
+        bot_names (list[str]): only get the counts of these bots. If none is provided, all bots are included
+
+    Returns:
+        pandas.DataFrame: the counts, with columns bucket, bot_name, name and count
+    """
+    return _monitoring_db.get_metric_counts(metric, granularity=granularity, bot_names=bot_names)
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_bot_names(_monitoring_db: MonitoringDB) -> list[str]:
+    """Get the names of the bots with sessions (see :meth:`MonitoringDB.get_bot_names`), sharing the result among
+    widgets and browser sessions for a short time.
+
+    Args:
+        _monitoring_db (MonitoringDB): the monitoring database (not hashed by Streamlit)
+
+    Returns:
+        list[str]: the bot names
+    """
+    return _monitoring_db.get_bot_names()
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def count_sessions(_monitoring_db: MonitoringDB, bot_names: list[str] = None) -> int:
+    """Count the sessions (see :meth:`MonitoringDB.count_sessions`), sharing the result among widgets and browser
+    sessions for a short time.
+
+    Args:
+        _monitoring_db (MonitoringDB): the monitoring database (not hashed by Streamlit)
+        bot_names (list[str]): only count the sessions of these bots. If none is provided, all bots are included
+
+    Returns:
+        int: the number of sessions
+    """
+    return _monitoring_db.count_sessions(bot_names=bot_names)
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_intents(_monitoring_db: MonitoringDB, bot_names: list[str] = None) -> list[str]:
+    """Get the names of the predicted intents, sharing the result among widgets and browser sessions for a short time.
+
+    Args:
+        _monitoring_db (MonitoringDB): the monitoring database (not hashed by Streamlit)
+        bot_names (list[str]): only get the intents of these bots. If none is provided, all bots are included
+
+    Returns:
+        list[str]: the intent names
+    """
+    return list(get_metric_counts(_monitoring_db, ROLLUP_METRIC_INTENT, bot_names=bot_names)['name'].unique())
@@ -2,37 +2,26 @@ import streamlit as st
 import streamlit.components.v1 as components
 from pyvis.network import Network
 
-from besser.bot.db.monitoring_db import MonitoringDB, TABLE_TRANSITION, TABLE_SESSION
+from besser.bot.db.monitoring_db import MonitoringDB
 from besser.bot.db.monitoring_ui.home import bot_filter
 
 
 def flow_graph(monitoring_db: MonitoringDB):
     st.header('Flow Graph')
     bot_names = bot_filter(monitoring_db)
-    table_transition = monitoring_db.get_table(TABLE_TRANSITION)
-    if bot_names:
-        table_session = monitoring_db.get_table(TABLE_SESSION)
-        # Filter the tables by the specified bots
-        table_session = table_session[table_session['bot_name'].isin(bot_names)]
-        table_transition = table_transition[table_transition['session_id'].isin(table_session['id'])]
+    # The transitions are counted in the DB, so we only get 1 row per distinct edge
+    transition_edges = monitoring_db.get_transition_edges(bot_names)
 
     nt = Network("700px", "100%", notebook=True, directed=True)
     state_set = set()
     transition_dict = {}
     # TODO: Initial states in another colour, set group=2 in add_node()
     # TODO: SET PHYSICS ATTRS: gravitationalConstant to -12000 and springLength to 200
-    for i, transition in table_transition.iterrows():
-        source_state = transition['source_state']
-        dest_state = transition['dest_state']
-        event = transition['event']
-        info = transition['info']
+    for source_state, dest_state, event, info, count in transition_edges.itertuples(index=False):
         if source_state not in state_set:
             state_set.add(source_state)
             nt.add_node(source_state, group=1)
-        if (source_state, dest_state, event, info) not in transition_dict:
-            transition_dict[(source_state, dest_state, event, info)] = 1
-        else:
-            transition_dict[(source_state, dest_state, event, info)] += 1
+        transition_dict[(source_state, dest_state, event, info)] = int(count)
     if transition_dict:
         max_count = max(transition_dict.values())
         for (source_state, dest_state, event, info), count in transition_dict.items():
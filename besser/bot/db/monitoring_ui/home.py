@@ -2,8 +2,9 @@ import streamlit as st
 import plotly.express as px
 
 
-from besser.bot.db.monitoring_db import MonitoringDB, TABLE_INTENT_PREDICTION, TABLE_SESSION, TABLE_CHAT, \
-    TABLE_TRANSITION
+from besser.bot.db.monitoring_db import MonitoringDB, ROLLUP_METRIC_INTENT, ROLLUP_METRIC_MESSAGES, \
+    ROLLUP_METRIC_TRANSITION
+from besser.bot.db.monitoring_ui.cache import count_sessions, get_bot_names, get_metric_counts
 
 
 def home(monitoring_db: MonitoringDB):
@@ -23,31 +24,24 @@ def home(monitoring_db: MonitoringDB):
 
 
 def event_distribution(monitoring_db, bot_names):
-    table_transition = monitoring_db.get_table(TABLE_TRANSITION)
-    if bot_names:
-        table_session = monitoring_db.get_table(TABLE_SESSION)
-        # Filter the tables by the specified bots
-        table_session = table_session[table_session['bot_name'].isin(bot_names)]
-        table_transition = table_transition[table_transition['session_id'].isin(table_session['id'])]
-    fig = px.histogram(table_transition, x='event', color='event', title='Events')
+    event_counts = get_metric_counts(monitoring_db, ROLLUP_METRIC_TRANSITION, bot_names=bot_names)
+    event_counts = event_counts.groupby('name', as_index=False)['count'].sum().rename(columns={'name': 'event'})
+    fig = px.histogram(event_counts, x='event', y='count', color='event', title='Events')
     st.plotly_chart(fig, use_container_width=True)
 
 
 def messages_data(monitoring_db, bot_names):
-    table_chat = monitoring_db.get_table(TABLE_CHAT)
-    table_session = monitoring_db.get_table(TABLE_SESSION)
-    if bot_names:
-        # Filter the tables by the specified bots
-        table_session = table_session[table_session['bot_name'].isin(bot_names)]
-        table_chat = table_chat[table_chat['session_id'].isin(table_session['id'])]
-    total_messages = len(table_chat)
-    total_sessions = len(table_session)
-    total_user_messages = len(table_chat[table_chat['is_user'] == True])
-    total_bot_messages = len(table_chat[table_chat['is_user'] == False])
+    message_counts = get_metric_counts(monitoring_db, ROLLUP_METRIC_MESSAGES, granularity='hour',
+                                       bot_names=bot_names)
+    total_user_messages = int(message_counts[message_counts['name'] == 'user']['count'].sum())
+    total_bot_messages = int(message_counts[message_counts['name'] == 'bot']['count'].sum())
+    total_messages = total_user_messages + total_bot_messages
+    total_sessions = count_sessions(monitoring_db, bot_names=bot_names)
 
     st.info(f'**Total sessions: {total_sessions}**')
     st.info(f'**Total messages: {total_messages} ({total_user_messages} user and {total_bot_messages} bot)**')
-    st.info(f'**Messages per session: {round(total_messages/total_sessions, 3)} ({round(total_user_messages/total_sessions, 3)} user and {round(total_bot_messages/total_sessions, 3)} bot)**')
+    if total_sessions:
+        st.info(f'**Messages per session: {round(total_messages/total_sessions, 3)} ({round(total_user_messages/total_sessions, 3)} user and {round(total_bot_messages/total_sessions, 3)} bot)**')
 
     data = {'names': ['User', 'Bot'], 'values': [total_user_messages, total_bot_messages]}
     # TODO: SHOW ANOTHER CHART PER TYPE OF MESSAGE (STR, FILE...)
@@ -57,26 +51,21 @@ def messages_data(monitoring_db, bot_names):
                  title='Total messages')
     st.plotly_chart(fig, use_container_width=True)
 
-    fig = px.histogram(table_chat, x='timestamp', color='is_user', title='Number of messages', nbins=40)
+    message_counts = message_counts.rename(columns={'bucket': 'timestamp', 'name': 'sender'})
+    fig = px.histogram(message_counts, x='timestamp', y='count', color='sender', title='Number of messages', nbins=40)
     st.plotly_chart(fig, use_container_width=True)
 
 
 def bot_filter(monitoring_db: MonitoringDB):
-    bots = monitoring_db.get_table(TABLE_SESSION)['bot_name'].unique()
+    bots = get_bot_names(monitoring_db)
     bot_names = st.multiselect(label='Select one or more bots', options=bots, placeholder='All bots')
     return bot_names
 
 
 def get_matched_intents_ratio(monitoring_db: MonitoringDB, bot_names=[]):
-    table_intent_prediction = monitoring_db.get_table(TABLE_INTENT_PREDICTION)
-    if bot_names:
-        table_session = monitoring_db.get_table(TABLE_SESSION)
-        # Filter the tables by the specified bots
-        table_session = table_session[table_session['bot_name'].isin(bot_names)]
-        table_intent_prediction = table_intent_prediction[table_intent_prediction['session_id'].isin(table_session['id'])]
-    value_counts = table_intent_prediction['intent'].value_counts()
-    fallback_count = value_counts['fallback_intent'] if 'fallback_intent' in value_counts else 0
-    intent_matched_count = len(table_intent_prediction) - fallback_count
+    intent_counts = get_metric_counts(monitoring_db, ROLLUP_METRIC_INTENT, bot_names=bot_names)
+    fallback_count = int(intent_counts[intent_counts['name'] == 'fallback_intent']['count'].sum())
+    intent_matched_count = int(intent_counts['count'].sum()) - fallback_count
     data = {'names': ['Matched', 'Fallback'], 'values': [intent_matched_count, fallback_count]}
     fig = px.pie(data, values='values', names='names',
                  #color_discrete_sequence=['blue', 'red'],
@@ -86,11 +75,7 @@ def get_matched_intents_ratio(monitoring_db: MonitoringDB, bot_names=[]):
 
 
 def intent_histogram(monitoring_db: MonitoringDB, bot_names=[]):
-    table_intent_prediction = monitoring_db.get_table(TABLE_INTENT_PREDICTION)
-    if bot_names:
-        table_session = monitoring_db.get_table(TABLE_SESSION)
-        # Filter the tables by the specified bots
-        table_session = table_session[table_session['bot_name'].isin(bot_names)]
-        table_intent_prediction = table_intent_prediction[table_intent_prediction['session_id'].isin(table_session['id'])]
-    fig = px.histogram(table_intent_prediction, x='intent', color='intent', title='Histogram of Intents')
+    intent_counts = get_metric_counts(monitoring_db, ROLLUP_METRIC_INTENT, bot_names=bot_names)
+    intent_counts = intent_counts.groupby('name', as_index=False)['count'].sum().rename(columns={'name': 'intent'})
+    fig = px.histogram(intent_counts, x='intent', y='count', color='intent', title='Histogram of Intents')
     st.plotly_chart(fig, use_container_width=True)
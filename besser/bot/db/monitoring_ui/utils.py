@@ -1,85 +1,123 @@
+from datetime import datetime, time
+
 import pandas as pd
 import streamlit as st
+from sqlalchemy import Boolean, DateTime, Float, Integer, MetaData, Numeric, Table
+
+from besser.bot.db.monitoring_db import MonitoringDB
+from besser.bot.db.monitoring_ui.cache import QUERY_CACHE_TTL
+
+PAGE_SIZES = [25, 100, 500]
+"""The page sizes that can be selected in the table views"""
+
+MAX_CATEGORIES = 10
+"""Columns with fewer distinct values than this are filtered as categorical columns"""
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_column_range(_monitoring_db: MonitoringDB, table_name: str, column_name: str):
+    return _monitoring_db.get_column_range(table_name, column_name)
 
-from pandas.api.types import (
-    is_datetime64_any_dtype,
-    is_numeric_dtype,
-    is_object_dtype,
-)
 
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_column_values(_monitoring_db: MonitoringDB, table_name: str, column_name: str):
+    return sorted(_monitoring_db.get_column_values(table_name, column_name, limit=MAX_CATEGORIES),
+                  key=lambda value: (value is None, value))
 
-def filter_df(df: pd.DataFrame, key=None) -> pd.DataFrame:
+
+def filter_table(monitoring_db: MonitoringDB, table_name: str) -> pd.DataFrame:
     """
-    Adds a UI on top of a dataframe to let viewers filter columns
+    Adds a UI on top of a database table to let viewers filter columns and navigate through its pages.
+
+    The filters are translated to SQL conditions and the pages are retrieved with keyset pagination, so only the
+    visible page is transferred from the database.
 
     Args:
-        df (pd.DataFrame): Original dataframe
+        monitoring_db (MonitoringDB): the monitoring database
+        table_name (str): the name of the table
 
     Returns:
-        pd.DataFrame: Filtered dataframe
+        pd.DataFrame: The visible page of the filtered table
     """
-    # SOURCE: https://blog.streamlit.io/auto-generate-a-dataframe-filtering-ui-in-streamlit-with-filter_dataframe/
-    modify = st.toggle("Filter", key=key)
-
-    if not modify:
-        return df
-
-    df = df.copy()
-
-    # Try to convert datetimes into a standard format (datetime, no timezone)
-    for col in df.columns:
-        if is_object_dtype(df[col]):
-            try:
-                df[col] = pd.to_datetime(df[col])
-            except Exception:
-                pass
-
-        if is_datetime64_any_dtype(df[col]):
-            df[col] = df[col].dt.tz_localize(None)
-
-    modification_container = st.container()
-
-    with modification_container:
-        to_filter_columns = st.multiselect("Filter table on", df.columns)
-        for column in to_filter_columns:
-            left, right = st.columns((1, 20))
-            left.write('↳')
-            # Treat columns with < 10 unique values as categorical
-            if is_numeric_dtype(df[column]):
-                _min = float(df[column].min())
-                _max = float(df[column].max())
-                step = (_max - _min) / 100
-                user_num_input = right.slider(
-                    f"Values for {column}",
-                    min_value=_min,
-                    max_value=_max,
-                    value=(_min, _max),
-                    step=step,
-                )
-                df = df[df[column].between(*user_num_input)]
-            elif isinstance(df[column], pd.CategoricalDtype) or df[column].nunique() < 10:
-                user_cat_input = right.multiselect(
-                    f"Values for {column}",
-                    df[column].unique(),
-                    default=list(df[column].unique()),
-                )
-                df = df[df[column].isin(user_cat_input)]
-            elif is_datetime64_any_dtype(df[column]):
-                user_date_input = right.date_input(
-                    f"Values for {column}",
-                    value=(
-                        df[column].min(),
-                        df[column].max(),
-                    ),
-                )
-                if len(user_date_input) == 2:
-                    user_date_input = tuple(map(pd.to_datetime, user_date_input))
-                    start_date, end_date = user_date_input
-                    df = df.loc[df[column].between(start_date, end_date)]
-            else:
-                user_text_input = right.text_input(
-                    f"Substring or regex in {column}",
-                )
-                if user_text_input:
-                    df = df[df[column].astype(str).str.contains(user_text_input)]
-    return df
\ No newline at end of file
+    # Based on: https://blog.streamlit.io/auto-generate-a-dataframe-filtering-ui-in-streamlit-with-filter_dataframe/
+    table = Table(table_name, MetaData(), autoload_with=monitoring_db.conn)
+    filters = {}
+    modify = st.toggle("Filter", key=table_name)
+
+    if modify:
+        modification_container = st.container()
+
+        with modification_container:
+            to_filter_columns = st.multiselect("Filter table on", table.columns.keys(), key=f'{table_name}_columns')
+            for column in to_filter_columns:
+                left, right = st.columns((1, 20))
+                left.write('↳')
+                column_type = table.c[column].type
+                key = f'{table_name}_{column}'
+                if isinstance(column_type, DateTime):
+                    _min, _max = get_column_range(monitoring_db, table_name, column)
+                    if _min is None:
+                        continue
+                    user_date_input = right.date_input(
+                        f"Time window for {column}",
+                        value=(_min.date(), _max.date()),
+                        key=key
+                    )
+                    if len(user_date_input) == 2:
+                        start_date, end_date = user_date_input
+                        filters[column] = (datetime.combine(start_date, time.min), datetime.combine(end_date, time.max))
+                elif isinstance(column_type, (Integer, Float, Numeric)):
+                    _min, _max = get_column_range(monitoring_db, table_name, column)
+                    if _min is None:
+                        continue
+                    _min = float(_min)
+                    _max = float(_max)
+                    step = (_max - _min) / 100
+                    user_num_input = right.slider(
+                        f"Values for {column}",
+                        min_value=_min,
+                        max_value=_max,
+                        value=(_min, _max),
+                        step=step if step else None,
+                        key=key
+                    )
+                    filters[column] = user_num_input
+                else:
+                    values = get_column_values(monitoring_db, table_name, column)
+                    # Treat columns with < 10 unique values as categorical
+                    if isinstance(column_type, Boolean) or len(values) < MAX_CATEGORIES:
+                        user_cat_input = right.multiselect(
+                            f"Values for {column}",
+                            values,
+                            default=values,
+                            key=key
+                        )
+                        filters[column] = user_cat_input
+                    else:
+                        user_text_input = right.text_input(
+                            f"Substring in {column}",
+                            key=key
+                        )
+                        if user_text_input:
+                            filters[column] = user_text_input
+
+    # Keyset pagination: we keep the id of the last record of each previous page
+    pages_key = f'{table_name}_pages'
+    filters_key = f'{table_name}_filters'
+    if st.session_state.get(filters_key) != filters or pages_key not in st.session_state:
+        # The filters changed, go back to the first page
+        st.session_state[filters_key] = filters
+        st.session_state[pages_key] = []
+    pages: list[int] = st.session_state[pages_key]
+    left, middle, right = st.columns((2, 2, 6))
+    page_size = right.selectbox('Page size', PAGE_SIZES, key=f'{table_name}_page_size', label_visibility='collapsed')
+    page = monitoring_db.get_table_page(table_name, after_id=pages[-1] if pages else None, limit=page_size,
+                                        filters=filters)
+    if left.button('Previous page', key=f'{table_name}_previous', disabled=not pages, use_container_width=True):
+        pages.pop()
+        st.rerun()
+    if middle.button('Next page', key=f'{table_name}_next', disabled=len(page) < page_size, use_container_width=True):
+        pages.append(int(page['id'].iloc[-1]))
+        st.rerun()
+    st.caption(f'Page {len(pages) + 1}')
+    return page
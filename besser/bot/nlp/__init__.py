@@ -51,7 +51,8 @@ NLP_PRE_PROCESSING = Property(SECTION_NLP, 'nlp.pre_processing', bool, True)
 Whether to use text pre-processing or not. `Stemming <https://en.wikipedia.org/wiki/Stemming>`_ is the process of reducing
 inflected (or sometimes derived) words to their word stem, base or root form.
 
-Currently, only :class:`~besser.bot.nlp.intent_classifier.simple_intent_classifier.SimpleIntentClassifier` and
+Currently, only :class:`~besser.bot.nlp.intent_classifier.simple_intent_classifier.SimpleIntentClassifier`,
+:class:`~besser.bot.nlp.intent_classifier.embedding_intent_classifier.EmbeddingIntentClassifier` and
 :class:`~besser.bot.nlp.ner.simple_ner.SimpleNER` use this property. If
 :class:`~besser.bot.nlp.intent_classifier.llm_intent_classifier.LLMIntentClassifier` is used, this property is ignored.
 
@@ -66,6 +67,34 @@ type: ``bool``
 default value: ``True``
 """
 
+NLP_TOKENIZER_RESOURCES_PATH = Property(SECTION_NLP, 'nlp.tokenizer.resources_path', str, None)
+"""
+The directory containing the tokenizer resources (the `NLTK punkt <https://www.nltk.org/data.html>`_ models, i.e.
+``<path>/tokenizers/punkt``), for offline deployments. If set, the tokenizer resources are only looked up in this
+directory and they are never downloaded.
+
+The resources are resolved the first time a text is tokenized, not at startup. If they are not available, a simpler
+tokenizer (which splits words and punctuation signs) is used.
+
+name: ``nlp.tokenizer.resources_path``
+
+type: ``str``
+
+default value: ``None``
+"""
+
+NLP_TOKENIZER_DOWNLOAD = Property(SECTION_NLP, 'nlp.tokenizer.download', bool, True)
+"""
+Whether to download the tokenizer resources (the NLTK punkt models) if they are not installed. Disable it in
+environments without internet access.
+
+name: ``nlp.tokenizer.download``
+
+type: ``bool``
+
+default value: ``True``
+"""
+
 NLP_INTENT_THRESHOLD = Property(SECTION_NLP, 'nlp.intent_threshold', float, 0.4)
 """
 The threshold for the Intent Classification problem. If none of its predictions have a score greater than the threshold,
@@ -78,6 +107,48 @@ type: ``float``
 default value: ``0.4``
 """
 
+NLP_INTENT_CACHE_SIZE = Property(SECTION_NLP, 'nlp.intent_cache.size', int, 1024)
+"""
+The maximum number of intent predictions cached by the NLP engine. The best intent prediction of a message in a state is
+cached, so the same message received again in the same state (e.g. "hi", "yes" or "help") is not classified again. When
+the cache is full, the least recently used predictions are removed. Set it to 0 to disable the cache.
+
+The cache is emptied when the bot is trained.
+
+name: ``nlp.intent_cache.size``
+
+type: ``int``
+
+default value: ``1024``
+"""
+
+NLP_INTENT_CACHE_TTL = Property(SECTION_NLP, 'nlp.intent_cache.ttl', float, 600.0)
+"""
+The time, in seconds, an intent prediction is kept in the NLP engine's cache. If None, the predictions never expire.
+
+Note that the parameters of the cached predictions are also reused. The predictions with parameters whose value depends
+on the current time (i.e. date-time entities, e.g. "tomorrow") are never cached, but a custom entity whose value
+depends on time or on external data would be reused until it expires.
+
+name: ``nlp.intent_cache.ttl``
+
+type: ``float``
+
+default value: ``600.0``
+"""
+
+NLP_INTENT_CACHE_MAX_MESSAGE_LENGTH = Property(SECTION_NLP, 'nlp.intent_cache.max_message_length', int, 64)
+"""
+The maximum length (in characters) of the messages whose intent predictions are cached by the NLP engine. Longer
+messages are rarely repeated, so they are always classified.
+
+name: ``nlp.intent_cache.max_message_length``
+
+type: ``int``
+
+default value: ``64``
+"""
+
 NLP_STT_HF_MODEL = Property(SECTION_NLP, 'nlp.speech2text.hf.model', str, None)
 """
 The name of the Hugging Face model for the HFSpeech2Text bot component. If none is provided, the component will not be 
@@ -90,6 +161,53 @@ type: ``str``
 default value: ``None``
 """
 
+NLP_STT_HF_MAX_BATCH_SIZE = Property(SECTION_NLP, 'nlp.speech2text.hf.max_batch_size', int, 8)
+"""
+The maximum number of audios the HFSpeech2Text bot component transcribes together, in a single model inference.
+
+name: ``nlp.speech2text.hf.max_batch_size``
+
+type: ``int``
+
+default value: ``8``
+"""
+
+NLP_STT_HF_MAX_BATCH_WAIT = Property(SECTION_NLP, 'nlp.speech2text.hf.max_batch_wait', float, 0.01)
+"""
+The maximum time, in seconds, an audio waits for other audios to be transcribed together by the HFSpeech2Text bot
+component.
+
+name: ``nlp.speech2text.hf.max_batch_wait``
+
+type: ``float``
+
+default value: ``0.01``
+"""
+
+NLP_STT_HF_WINDOW_LENGTH = Property(SECTION_NLP, 'nlp.speech2text.hf.window_length', float, 30.0)
+"""
+The length, in seconds, of the windows the HFSpeech2Text bot component splits the audios into. Each window is
+transcribed separately, so it must not be longer than the model input (30 seconds for Whisper models).
+
+name: ``nlp.speech2text.hf.window_length``
+
+type: ``float``
+
+default value: ``30.0``
+"""
+
+NLP_STT_HF_WINDOW_OVERLAP = Property(SECTION_NLP, 'nlp.speech2text.hf.window_overlap', float, 5.0)
+"""
+The overlap, in seconds, between consecutive audio windows of the HFSpeech2Text bot component, so the words at the
+window boundaries are not lost. The words repeated in the overlaps are removed from the transcription.
+
+name: ``nlp.speech2text.hf.window_overlap``
+
+type: ``float``
+
+default value: ``5.0``
+"""
+
 NLP_STT_SR_ENGINE = Property(SECTION_NLP, 'nlp.speech2text.sr.engine', str, None)
 """
 The name of the transcription engine for the Speech Recognition bot component. If none is provided, the component will
@@ -102,6 +220,19 @@ type: ``str``
 default value: ``None``
 """
 
+NLP_STT_MAX_WORKERS = Property(SECTION_NLP, 'nlp.speech2text.max_workers', int, 1)
+"""
+The number of threads that run the speech-to-text transcriptions requested through
+:meth:`~besser.bot.nlp.nlp_engine.NLPEngine.speech2text_async` (e.g. by the Telegram platform). The transcriptions
+requested while all the threads are busy wait in a queue.
+
+name: ``nlp.speech2text.max_workers``
+
+type: ``int``
+
+default value: ``1``
+"""
+
 OPENAI_API_KEY = Property(SECTION_NLP, 'nlp.openai.api_key', str, None)
 """
 The OpenAI API key, necessary to use an OpenAI LLM.
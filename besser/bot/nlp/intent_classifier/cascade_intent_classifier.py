@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from besser.bot import nlp
+from besser.bot.nlp.intent_classifier.intent_classifier import IntentClassifier
+from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
+
+if TYPE_CHECKING:
+    from besser.bot.core.state import State
+    from besser.bot.nlp.intent_classifier.intent_classifier_configuration import IntentClassifierConfiguration
+    from besser.bot.nlp.nlp_engine import NLPEngine
+
+
+class CascadeTierMetrics:
+    """The metrics of a tier of a :class:`CascadeIntentClassifier`.
+
+    Args:
+        name (str): the tier name (its intent classifier class)
+
+    Attributes:
+        name (str): The tier name
+        calls (int): The number of messages classified by the tier
+        accepted (int): The number of messages whose predictions of the tier were accepted (i.e. not escalated)
+        total_latency (float): The total time spent by the tier classifying messages, in seconds
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.accepted: int = 0
+        self.total_latency: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The fraction of the messages classified by the tier whose predictions were accepted."""
+        return self.accepted / self.calls if self.calls else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """float: The mean time spent by the tier classifying a message, in seconds."""
+        return self.total_latency / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, str or int or float]:
+        """Returns the tier metrics in a dictionary.
+
+        Returns:
+            dict[str, str or int or float]: the tier metrics
+        """
+        return {
+            'tier': self.name,
+            'calls': self.calls,
+            'accepted': self.accepted,
+            'hit_rate': self.hit_rate,
+            'mean_latency': self.mean_latency,
+            'total_latency': self.total_latency,
+        }
+
+
+class CascadeIntentClassifier(IntentClassifier):
+    """A Cascade Intent Classifier.
+
+    It runs a sequence of intent classifiers (tiers), usually from the cheapest to the most expensive one (e.g. a
+    :class:`~besser.bot.nlp.intent_classifier.simple_intent_classifier.SimpleIntentClassifier` and then an
+    :class:`~besser.bot.nlp.intent_classifier.llm_intent_classifier.LLMIntentClassifier`). A message is only
+    escalated to the next tier when the predictions of the current one are not confident enough, i.e. when its best
+    score is below a minimum score or the :obj:`~besser.bot.nlp.NLP_INTENT_THRESHOLD` (a fallback), or too close to
+    the second best score. If a tier returns no predictions, the ones of the previous tier are kept.
+
+    The number of messages classified and accepted by each tier, and their latency, are recorded (see :meth:`stats`).
+
+    Args:
+        nlp_engine (NLPEngine): the NLPEngine that handles the NLP processes of the bot
+        state (State): the state the intent classifier belongs to
+        ic_config (IntentClassifierConfiguration or None): the intent classifier configuration. If None, the state's
+            configuration is used
+
+    Attributes:
+        _tiers (list[IntentClassifier]): The intent classifiers of the cascade, in order
+        _metrics (list[CascadeTierMetrics]): The metrics of each tier
+        _lock (threading.Lock): Lock to update the metrics
+
+    See Also:
+        :class:`~besser.bot.nlp.intent_classifier.intent_classifier_configuration.CascadeIntentClassifierConfiguration`.
+    """
+
+    def __init__(
+            self,
+            nlp_engine: 'NLPEngine',
+            state: 'State',
+            ic_config: 'IntentClassifierConfiguration' = None
+    ):
+        super().__init__(nlp_engine, state, ic_config)
+        self._tiers: list[IntentClassifier] = []
+        for tier_config in self._ic_config.tiers:
+            intent_classifier = self._nlp_engine._create_intent_classifier(state, tier_config)
+            if intent_classifier is None:
+                raise ValueError(f'Unsupported intent classifier configuration in the cascade of state {state.name}: '
+                                 f'{tier_config.__class__.__name__}')
+            self._tiers.append(intent_classifier)
+        if not self._tiers:
+            raise ValueError(f'The cascade intent classifier of state {state.name} has no tiers')
+        self._metrics: list[CascadeTierMetrics] = [CascadeTierMetrics(tier.__class__.__name__) for tier in self._tiers]
+        self._lock: threading.Lock = threading.Lock()
+
+    def train(self) -> None:
+        for tier in self._tiers:
+            tier.train()
+
+    def predict(self, message: str) -> list[IntentClassifierPrediction]:
+        intent_classifier_results: list[IntentClassifierPrediction] = []
+        for i, (tier, metrics) in enumerate(zip(self._tiers, self._metrics)):
+            start = time.perf_counter()
+            predictions = tier.predict(message)
+            latency = time.perf_counter() - start
+            accepted = bool(predictions) and (i == len(self._tiers) - 1 or not self._escalate(predictions))
+            with self._lock:
+                metrics.calls += 1
+                metrics.total_latency += latency
+                if accepted:
+                    metrics.accepted += 1
+            if predictions:
+                intent_classifier_results = predictions
+            if accepted:
+                break
+        return intent_classifier_results
+
+    def _escalate(self, predictions: list[IntentClassifierPrediction]) -> bool:
+        """Check if the predictions of a tier are not confident enough, so the message must be escalated to the next
+        tier.
+
+        Args:
+            predictions (list[IntentClassifierPrediction]): the predictions of the tier
+
+        Returns:
+            bool: true if the message must be escalated, false otherwise
+        """
+        scores = sorted((prediction.score for prediction in predictions), reverse=True)
+        min_score = max(self._ic_config.min_score, self._nlp_engine.get_property(nlp.NLP_INTENT_THRESHOLD))
+        if scores[0] < min_score:
+            return True
+        second_score = scores[1] if len(scores) > 1 else 0
+        return scores[0] - second_score < self._ic_config.min_margin
+
+    def stats(self) -> list[dict[str, str or int or float]]:
+        """Get the metrics of each tier: the number of messages it classified and accepted, its hit rate and its mean
+        and total latency (in seconds).
+
+        Returns:
+            list[dict[str, str or int or float]]: the metrics of each tier, in order
+        """
+        with self._lock:
+            return [metrics.to_dict() for metrics in self._metrics]
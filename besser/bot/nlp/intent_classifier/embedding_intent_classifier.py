@@ -0,0 +1,222 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Callable, TYPE_CHECKING
+
+import numpy as np
+
+from besser.bot.nlp.intent_classifier.intent_classifier import IntentClassifier
+from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
+from besser.bot.nlp.ner.ner_prediction import NERPrediction
+from besser.bot.nlp.preprocessing.text_preprocessing import process_text
+
+if TYPE_CHECKING:
+    from besser.bot.core.state import State
+    from besser.bot.nlp.intent_classifier.intent_classifier_configuration import IntentClassifierConfiguration
+    from besser.bot.nlp.nlp_engine import NLPEngine
+
+
+class HFSentenceEmbedder:
+    """A sentence embedder based on a Hugging Face model.
+
+    The embedding of a sentence is the mean of its token embeddings (the usual pooling of
+    `sentence-transformers <https://www.sbert.net/>`_ models).
+
+    Args:
+        model_name (str): the Hugging Face model name
+        batch_size (int): the maximum number of sentences embedded in a single model inference
+
+    Attributes:
+        _tokenizer (): the model tokenizer
+        _model (): the embedding model
+        _batch_size (int): the maximum number of sentences embedded in a single model inference
+    """
+
+    def __init__(self, model_name: str, batch_size: int = 32):
+        from transformers import AutoTokenizer, TFAutoModel
+        self._tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self._model = TFAutoModel.from_pretrained(model_name)
+        self._batch_size: int = batch_size
+
+    def __call__(self, sentences: list[str]) -> np.ndarray:
+        """Embed a list of sentences.
+
+        Args:
+            sentences (list[str]): the sentences
+
+        Returns:
+            np.ndarray: the sentence embeddings (one row per sentence)
+        """
+        embeddings = []
+        for start in range(0, len(sentences), self._batch_size):
+            inputs = self._tokenizer(sentences[start:start + self._batch_size], padding=True, truncation=True,
+                                     return_tensors='np')
+            tokens = self._model(**inputs).last_hidden_state.numpy()
+            mask = inputs['attention_mask'][..., np.newaxis].astype(np.float32)
+            embeddings.append((tokens * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9))
+        return np.concatenate(embeddings)
+
+
+hf_embedders: dict[str, HFSentenceEmbedder] = {}
+"""The Hugging Face sentence embedders, shared by all the intent classifiers that use the same model."""
+
+hf_embedders_lock: threading.Lock = threading.Lock()
+
+
+def get_hf_embedder(model_name: str, batch_size: int = 32) -> HFSentenceEmbedder:
+    """Get the sentence embedder of a Hugging Face model, loading the model if it was not loaded yet.
+
+    Args:
+        model_name (str): the Hugging Face model name
+        batch_size (int): the maximum number of sentences embedded in a single model inference
+
+    Returns:
+        HFSentenceEmbedder: the sentence embedder
+    """
+    with hf_embedders_lock:
+        if model_name not in hf_embedders:
+            hf_embedders[model_name] = HFSentenceEmbedder(model_name, batch_size)
+        return hf_embedders[model_name]
+
+
+class EmbeddingIntentClassifier(IntentClassifier):
+    """An Embedding-based Intent Classifier.
+
+    It embeds the training sentences of the state's intents once, when it is trained, into a matrix. To predict the
+    intent of a message, it embeds the message and finds the most similar training sentences (with the cosine
+    similarity, computed against the whole matrix at once). Each intent is scored with the similarity of its most
+    similar training sentence among the ``top_k`` most similar ones.
+
+    No neural network is trained, and the training sentence embeddings can be persisted to disk to skip the
+    embedding in the next trainings.
+
+    Args:
+        nlp_engine (NLPEngine): the NLPEngine that handles the NLP processes of the bot
+        state (State): the state the intent classifier belongs to
+        ic_config (IntentClassifierConfiguration or None): the intent classifier configuration. If None, the state's
+            configuration is used
+
+    Attributes:
+        _embedder (Callable[[list[str]], np.ndarray]): The function that embeds the sentences
+        _embeddings (np.ndarray): The normalized embeddings of all the training sentences (one row per sentence)
+        _labels (np.ndarray): The label (the index of the intent in the state's intents) of each training sentence
+        _training_sentences (dict[str, int]): The processed training sentences, with their labels
+
+    See Also:
+        :class:`~besser.bot.nlp.intent_classifier.intent_classifier_configuration.EmbeddingIntentClassifierConfiguration`.
+    """
+
+    def __init__(
+            self,
+            nlp_engine: 'NLPEngine',
+            state: 'State',
+            ic_config: 'IntentClassifierConfiguration' = None
+    ):
+        super().__init__(nlp_engine, state, ic_config)
+        self._embedder: Callable[[list[str]], np.ndarray] = self._ic_config.embedder
+        if self._embedder is None:
+            self._embedder = get_hf_embedder(self._ic_config.model_name, self._ic_config.batch_size)
+        self._embeddings: np.ndarray = None
+        self._labels: np.ndarray = None
+        self._training_sentences: dict[str, int] = {}
+
+    def _embed(self, sentences: list[str]) -> np.ndarray:
+        """Embed a list of sentences, normalizing the embeddings (so their dot product is their cosine similarity).
+
+        Args:
+            sentences (list[str]): the sentences
+
+        Returns:
+            np.ndarray: the normalized sentence embeddings (one row per sentence)
+        """
+        embeddings = np.asarray(self._embedder(sentences), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+    def _load_or_embed(self, sentences: list[str]) -> np.ndarray:
+        """Embed the training sentences, or load their embeddings if they were persisted in a previous training.
+
+        The embeddings are persisted in a file named after a hash of the embedding model and the sentences, so they
+        are only reused if none of them has changed.
+
+        Args:
+            sentences (list[str]): the training sentences
+
+        Returns:
+            np.ndarray: the normalized sentence embeddings (one row per sentence)
+        """
+        embeddings_dir = self._ic_config.embeddings_dir
+        if embeddings_dir is None:
+            return self._embed(sentences)
+        key = hashlib.sha256('\0'.join([self._ic_config.model_name] + sentences).encode()).hexdigest()
+        path = os.path.join(embeddings_dir, f'{key}.npy')
+        try:
+            embeddings = np.load(path)
+            if embeddings.shape[0] == len(sentences):
+                logging.info(f'Training sentence embeddings of state {self._state.name} loaded from {path}')
+                return embeddings
+        except (OSError, ValueError):
+            pass
+        embeddings = self._embed(sentences)
+        os.makedirs(embeddings_dir, exist_ok=True)
+        # Write to a temporary file first, so other processes never load an incomplete file
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            np.save(f, embeddings)
+        os.replace(temp_path, path)
+        return embeddings
+
+    def train(self) -> None:
+        sentences: list[str] = []
+        labels: list[int] = []
+        self._training_sentences = {}
+        for index_intent, intent in enumerate(self._state.intents):
+            intent.process_training_sentences(self._nlp_engine)
+            for sentence in intent.processed_training_sentences:
+                sentences.append(sentence)
+                labels.append(index_intent)
+                self._training_sentences.setdefault(sentence, index_intent)
+        self._labels = np.array(labels, dtype=np.int64)
+        if sentences:
+            self._embeddings = self._load_or_embed(sentences)
+        else:
+            self._embeddings = np.zeros((0, 0), dtype=np.float32)
+
+    def predict(self, message: str) -> list[IntentClassifierPrediction]:
+        message = process_text(message, self._nlp_engine)
+        intent_classifier_results: list[IntentClassifierPrediction] = []
+
+        # We try to replace all potential entity value with the corresponding entity name
+        ner_prediction: NERPrediction = self._state.bot.nlp_engine.ner.predict(self._state, message)
+        ner_sentences = list(ner_prediction.ner_sentences.items())
+        if not ner_sentences:
+            return intent_classifier_results
+        # All the NER sentences are embedded and compared with the training sentences at once
+        if len(self._labels):
+            similarities = self._embed([ner_sentence for ner_sentence, _ in ner_sentences]) @ self._embeddings.T
+        else:
+            similarities = np.zeros((len(ner_sentences), 0), dtype=np.float32)
+        k = min(self._ic_config.top_k, similarities.shape[1])
+        for (ner_sentence, intents), sentence_similarities in zip(ner_sentences, similarities):
+            prediction = np.zeros(len(self._state.intents), dtype=np.float32)
+            exact_match_label = self._training_sentences.get(ner_sentence)
+            if self._ic_config.check_exact_prediction_match and exact_match_label is not None \
+                    and self._state.intents[exact_match_label] in intents:
+                prediction[exact_match_label] = 1.0
+            elif k > 0:
+                top = np.argpartition(-sentence_similarities, k - 1)[:k]
+                # Each intent gets the similarity of its most similar training sentence among the top k
+                np.maximum.at(prediction, self._labels[top], np.clip(sentence_similarities[top], 0, 1))
+
+            for intent in intents:
+                # It is impossible to have a duplicated intent in another ner_sentence
+                intent_index = self._state.intents.index(intent)
+                intent_classifier_results.append(IntentClassifierPrediction(
+                    intent,
+                    float(prediction[intent_index]),
+                    ner_sentence,
+                    ner_prediction.intent_matched_parameters[intent]
+                ))
+
+        return intent_classifier_results
@@ -5,6 +5,7 @@ from besser.bot.exceptions.exceptions import IntentClassifierWithoutIntentsError
 from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
 
 if TYPE_CHECKING:
+    from besser.bot.nlp.intent_classifier.intent_classifier_configuration import IntentClassifierConfiguration
     from besser.bot.nlp.nlp_engine import NLPEngine
     from besser.bot.core.state import State
 
@@ -23,21 +24,26 @@ class IntentClassifier(ABC):
     Args:
         nlp_engine (NLPEngine): the NLPEngine that handles the NLP processes of the bot
         state (State): the state the intent classifier belongs to
+        ic_config (IntentClassifierConfiguration or None): the intent classifier configuration. If None, the state's
+            configuration is used
 
     Attributes:
         _nlp_engine (NLPEngine): The NLPEngine that handles the NLP processes of the bot.
         _state (State): The state the intent classifier belongs to.
+        _ic_config (IntentClassifierConfiguration): The intent classifier configuration.
     """
 
     def __init__(
             self,
             nlp_engine: 'NLPEngine',
-            state: 'State'
+            state: 'State',
+            ic_config: 'IntentClassifierConfiguration' = None
     ):
         if not state.intents:
             raise IntentClassifierWithoutIntentsError(state, self)
         self._nlp_engine: 'NLPEngine' = nlp_engine
         self._state = state
+        self._ic_config: 'IntentClassifierConfiguration' = ic_config if ic_config is not None else state.ic_config
 
     @abstractmethod
     def train(self) -> None:
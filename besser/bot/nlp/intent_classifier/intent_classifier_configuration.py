@@ -1,4 +1,8 @@
 from abc import ABC
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class IntentClassifierConfiguration(ABC):
@@ -109,3 +113,83 @@ class LLMIntentClassifierConfiguration(IntentClassifierConfiguration):
         self.use_training_sentences: bool = use_training_sentences
         self.use_entity_descriptions: bool = use_entity_descriptions
         self.use_entity_synonyms: bool = use_entity_synonyms
+
+
+class EmbeddingIntentClassifierConfiguration(IntentClassifierConfiguration):
+    """The Embedding Intent Classifier Configuration class.
+
+    It allows the customization of a
+    :class:`~besser.bot.nlp.intent_classifier.embedding_intent_classifier.EmbeddingIntentClassifier`.
+
+    Args:
+        model_name (str): the name of the Hugging Face sentence embedding model. If a custom embedder is provided, it
+            identifies the embedder (to reuse the persisted embeddings)
+        embedder (Callable[[list[str]], numpy.ndarray] or None): a custom function that embeds a list of sentences
+            into a matrix (one row per sentence). If None, the Hugging Face model is used
+        top_k (int): the number of most similar training sentences considered to score the intents
+        batch_size (int): the maximum number of sentences embedded together
+        embeddings_dir (str or None): the directory where the embeddings of the training sentences are persisted, to
+            reuse them in the next trainings. If None, they are not persisted
+        check_exact_prediction_match (bool): Whether to check for exact match between the sentence to predict and one of
+            the training sentences or not
+
+    Attributes:
+        model_name (str): the name of the Hugging Face sentence embedding model, or the custom embedder name
+        embedder (Callable[[list[str]], numpy.ndarray] or None): a custom function that embeds a list of sentences
+        top_k (int): the number of most similar training sentences considered to score the intents
+        batch_size (int): the maximum number of sentences embedded together
+        embeddings_dir (str or None): the directory where the embeddings of the training sentences are persisted
+        check_exact_prediction_match (bool): Whether to check for exact match between the sentence to predict and one of
+            the training sentences or not
+    """
+
+    def __init__(
+            self,
+            model_name: str = 'sentence-transformers/all-MiniLM-L6-v2',
+            embedder: Callable[[list[str]], 'np.ndarray'] = None,
+            top_k: int = 5,
+            batch_size: int = 32,
+            embeddings_dir: str = None,
+            check_exact_prediction_match: bool = True
+    ):
+        super().__init__()
+        self.model_name: str = model_name
+        self.embedder: Callable[[list[str]], 'np.ndarray'] = embedder
+        self.top_k: int = top_k
+        self.batch_size: int = batch_size
+        self.embeddings_dir: str = embeddings_dir
+        self.check_exact_prediction_match: bool = check_exact_prediction_match
+
+
+class CascadeIntentClassifierConfiguration(IntentClassifierConfiguration):
+    """The Cascade Intent Classifier Configuration class.
+
+    It allows the customization of a
+    :class:`~besser.bot.nlp.intent_classifier.cascade_intent_classifier.CascadeIntentClassifier`.
+
+    Args:
+        tiers (list[IntentClassifierConfiguration]): the configurations of the intent classifiers of the cascade, from
+            the first one to run (usually the cheapest) to the last one (e.g. an LLM Intent Classifier)
+        min_score (float): the minimum score of the best intent prediction of a tier to accept it. Below it (or if the
+            prediction is below the :obj:`~besser.bot.nlp.NLP_INTENT_THRESHOLD`), the message is escalated to the next
+            tier
+        min_margin (float): the minimum difference between the scores of the 2 best intent predictions of a tier to
+            accept them. Below it, the message is escalated to the next tier
+
+    Attributes:
+        tiers (list[IntentClassifierConfiguration]): the configurations of the intent classifiers of the cascade
+        min_score (float): the minimum score of the best intent prediction of a tier to accept it
+        min_margin (float): the minimum difference between the scores of the 2 best intent predictions of a tier to
+            accept them
+    """
+
+    def __init__(
+            self,
+            tiers: list[IntentClassifierConfiguration],
+            min_score: float = 0.8,
+            min_margin: float = 0.0
+    ):
+        super().__init__()
+        self.tiers: list[IntentClassifierConfiguration] = tiers
+        self.min_score: float = min_score
+        self.min_margin: float = min_margin
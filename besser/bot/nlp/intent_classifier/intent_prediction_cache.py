@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from besser.bot.library.entity.base_entities import BaseEntities
+from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
+
+if TYPE_CHECKING:
+    from besser.bot.core.state import State
+
+time_relative_entities: set[str] = {BaseEntities.DATETIME.value}
+"""The entities whose values depend on the time they are matched (e.g. "tomorrow"), so their predictions are not
+cached."""
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a user message to be used as a cache key, removing leading, trailing and repeated whitespaces.
+
+    Args:
+        message (str): the user message
+
+    Returns:
+        str: the normalized message
+    """
+    return ' '.join(message.split())
+
+
+def is_time_relative(prediction: IntentClassifierPrediction) -> bool:
+    """Check if an intent prediction has parameters whose values depend on the time they were matched (e.g. a date
+    matched from "tomorrow"), so the prediction would be wrong if it was reused later.
+
+    Args:
+        prediction (IntentClassifierPrediction): the intent prediction
+
+    Returns:
+        bool: true if the prediction has time-relative parameters, false otherwise
+    """
+    if not prediction.matched_parameters:
+        return False
+    matched_names = {matched_parameter.name for matched_parameter in prediction.matched_parameters}
+    return any(parameter.name in matched_names and parameter.entity.name in time_relative_entities
+               for parameter in prediction.intent.parameters)
+
+
+class IntentPredictionCache:
+    """A LRU (Least Recently Used) cache of intent predictions, indexed by the state and the (normalized) user message.
+
+    It stores the best intent prediction of the state's intent classifier for a message (or None, if no intent was
+    predicted with enough confidence), so repeated messages are not classified again. The entries expire after a
+    time-to-live, and the least recently used entries are evicted when the cache is full. Only short messages are
+    cached, so the cache memory is bounded by its size. The predictions with time-relative parameters (see
+    :func:`is_time_relative`) are never cached.
+
+    Args:
+        max_size (int): the maximum number of entries
+        ttl (float or None): the time-to-live of the entries, in seconds. :obj:`None` disables the expiration
+        max_message_length (int): the maximum length (in characters) of the cached messages
+
+    Attributes:
+        _max_size (int): The maximum number of entries
+        _ttl (float or None): The time-to-live of the entries, in seconds
+        _max_message_length (int): The maximum length of the cached messages
+        _entries (OrderedDict[tuple[State, str], tuple[IntentClassifierPrediction or None, float]]): The cache
+            entries, from the least to the most recently used. Values are the predictions and their expiration times
+        _lock (threading.Lock): Lock to access the entries and the metrics
+        hits (int): The number of lookups that found a valid entry
+        misses (int): The number of lookups that did not find a valid entry
+        evictions (int): The number of entries evicted because the cache was full
+        expirations (int): The number of entries removed because they had expired
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = None, max_message_length: int = 64):
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._max_message_length: int = max_message_length
+        self._entries: OrderedDict[tuple['State', str], tuple[IntentClassifierPrediction or None, float]] = \
+            OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The fraction of lookups that found a valid entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def cacheable(self, message: str) -> bool:
+        """Check if the predictions of a message can be cached.
+
+        Args:
+            message (str): the normalized user message
+
+        Returns:
+            bool: true if the message can be cached, false otherwise
+        """
+        return self._max_size > 0 and len(message) <= self._max_message_length
+
+    def get(self, state: 'State', message: str) -> tuple[bool, IntentClassifierPrediction or None]:
+        """Get the cached intent prediction of a message.
+
+        Args:
+            state (State): the state where the message was received
+            message (str): the normalized user message
+
+        Returns:
+            tuple[bool, IntentClassifierPrediction or None]: whether the message was found in the cache, and its
+            prediction (a copy, so it can be modified without affecting the cache)
+        """
+        key = (state, message)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        prediction = entry[0]
+        if prediction is None:
+            return True, None
+        return True, IntentClassifierPrediction(
+            intent=prediction.intent,
+            score=prediction.score,
+            matched_sentence=prediction.matched_sentence,
+            matched_parameters=list(prediction.matched_parameters)
+        )
+
+    def put(self, state: 'State', message: str, prediction: IntentClassifierPrediction or None) -> None:
+        """Store the intent prediction of a message.
+
+        Args:
+            state (State): the state where the message was received
+            message (str): the normalized user message
+            prediction (IntentClassifierPrediction or None): the best intent prediction, or None if no intent was
+                predicted with enough confidence. It is not stored if it has time-relative parameters
+        """
+        if prediction is not None and is_time_relative(prediction):
+            return
+        expiration = time.monotonic() + self._ttl if self._ttl is not None else float('inf')
+        key = (state, message)
+        with self._lock:
+            self._entries[key] = (prediction, expiration)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the cache entries (e.g. when the intent classifiers are retrained). The metrics are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int or float]:
+        """Get the cache metrics.
+
+        Returns:
+            dict[str, int or float]: the number of entries, hits, misses, evictions and expirations, and the hit rate
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hit_rate,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,6 +1,9 @@
+import functools
+import inspect
+import json
 import logging
 import traceback
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
 from besser.bot.nlp import NLP_LANGUAGE
 from besser.bot.nlp.intent_classifier.intent_classifier import IntentClassifier
@@ -9,6 +12,7 @@ from besser.bot.nlp.ner.matched_parameter import MatchedParameter
 
 if TYPE_CHECKING:
     from besser.bot.core.state import State
+    from besser.bot.nlp.intent_classifier.intent_classifier_configuration import IntentClassifierConfiguration
     from besser.bot.nlp.nlp_engine import NLPEngine
 
 
@@ -21,9 +25,14 @@ class LLMIntentClassifier(IntentClassifier):
     Args:
         nlp_engine (NLPEngine): the NLPEngine that handles the NLP processes of the bot
         state (State): the state the intent classifier belongs to
+        ic_config (IntentClassifierConfiguration or None): the intent classifier configuration. If None, the state's
+            configuration is used
 
     Attributes:
-
+        __intents_dict (dict): The definitions of the state's intents, provided to the LLM
+        __entities_dict (dict): The definitions of the entities of the state's intents, provided to the LLM
+        _prompt_prefix (str): The static part of the prompt (instructions, intents and entities), generated when the
+            intent classifier is trained (or when the first message is predicted, if it was not trained)
 
     See Also:
         :class:`~besser.bot.nlp.intent_classifier.intent_classifier_configuration.LLMIntentClassifierConfiguration`.
@@ -32,20 +41,23 @@ class LLMIntentClassifier(IntentClassifier):
     def __init__(
             self,
             nlp_engine: 'NLPEngine',
-            state: 'State'
+            state: 'State',
+            ic_config: 'IntentClassifierConfiguration' = None
     ):
-        super().__init__(nlp_engine, state)
+        super().__init__(nlp_engine, state, ic_config)
         self.__intents_dict: dict = {}
         self.__entities_dict: dict = {}
+        self._prompt_prefix: str = None
 
-    def _generate_prompt(self, message: str) -> str:
-        """Generates the prompt for the LLM giving instructions for the intent classification task.
+    def _generate_prompt_prefix(self) -> str:
+        """Generates the static part of the prompt for the LLM, giving instructions for the intent classification task
+        and the definitions of the state's intents and entities (as compact JSON).
 
-        Args:
-            message (str): the user message on which the LLM must detect the intent
+        It is generated once, when the intent classifier is trained, and it is sent as the system message of every
+        prediction. Since it does not change between predictions, LLM providers can cache it.
 
         Returns:
-            str: the generated prompt
+            str: the generated prompt prefix
         """
         example_output = {
             'intent1': {
@@ -67,24 +79,24 @@ problem:
 For each intent:
 
 {'- A brief description of its purpose'
-if self._state.ic_config.use_intent_descriptions else ''}
+if self._ic_config.use_intent_descriptions else ''}
 {'- A set of training sentences, that you must take as examples of what the user message should look like.'
 '  Note that the similarity between a message and the training sentences can exist in terms of'
 '  orthographic similarity (i.e. common or similar words) and semantic similarity (with similar meanings)'
-if self._state.ic_config.use_training_sentences else ''}
+if self._ic_config.use_training_sentences else ''}
 - Some intents may have parameters. You will also have them. Each parameter is composed by a name,
 {'  an entity and a fragment. The fragment is the part of the training sentences where the parameters are expected to be.'
 '  In the training sentences, the words with all characters uppercased (e.g. CITY) probably belong to intent parameters (their fragments).'
-if self._state.ic_config.use_training_sentences else '  and an entity.'} Finding parameters in the message may be hints to detect its intent as well.
+if self._ic_config.use_training_sentences else '  and an entity.'} Finding parameters in the message may be hints to detect its intent as well.
 
 For each entity:
 
 {'- A brief description of its purpose'
-if self._state.ic_config.use_entity_descriptions else ''}
+if self._ic_config.use_entity_descriptions else ''}
 - All the values associated to the entity (if any).
 {'- For each value, there may be a list of synonyms. Use them as a reference, but if you find one in the'
 '  user message, always get the "main" value'
-if self._state.ic_config.use_entity_synonyms else ''}
+if self._ic_config.use_entity_synonyms else ''}
 A special kind of entities, called base entities, have no values associated. They can match any value of its
 category. For example, the base entity 'number' can match any number in a sentence.
 
@@ -103,7 +115,7 @@ not a good sign).
 
 Once you finish the problem, you must provide a result with the following JSON structure:
 
-{example_output}
+{_compact_json(example_output)}
 
 Return this JSON for all the intents, not only the winner.
 
@@ -112,54 +124,91 @@ Below 0.5 means that you have reasons to believe that that intent is not the app
 
 The following JSON contains all the intent definitions:
 
-{self.__intents_dict}
+{_compact_json(self.__intents_dict)}
 
 The following JSON contains all the entity definitions:
 
-{self.__entities_dict}
+{_compact_json(self.__entities_dict)}
 
-Given all the previous instructions and training data, run the intent classification and named entity
-recognition processes on this sentence: 
-
-'{message}'
+You will receive the sentence on which you must run the intent classification and named entity recognition processes.
 
 Only write the JSON answer. Do not write other things. Use double quotes to enclose the property names.
 The output format is JSON, not List.
 """
         return prompt
 
-    def train(self) -> None:
+    def _generate_prompt(self, message: str) -> str:
+        """Generates the variable part of the prompt for the LLM, containing the user message. It is sent after the
+        prompt prefix (see :meth:`_generate_prompt_prefix`).
+
+        Args:
+            message (str): the user message on which the LLM must detect the intent
+
+        Returns:
+            str: the generated prompt
+        """
+        return f"Run the intent classification and named entity recognition processes on this sentence:\n\n'{message}'"
+
+    def _get_prompt_prefix(self) -> str:
+        """Get the prompt prefix (see :meth:`_generate_prompt_prefix`), generating it and the intent and entity
+        definitions if they were not generated yet.
+
+        Returns:
+            str: the prompt prefix
+        """
+        if self._prompt_prefix is None:
+            self._load_definitions()
+            self._prompt_prefix = self._generate_prompt_prefix()
+        return self._prompt_prefix
+
+    def _load_definitions(self) -> None:
+        """Load the definitions of the state's intents and entities provided to the LLM, according to the intent
+        classifier configuration."""
         self.__intents_dict = {}
         self.__entities_dict = {}
         for intent in self._state.intents:
             self.__intents_dict[intent.name] = intent.to_json()
-            if not self._state.ic_config.use_intent_descriptions:
+            if not self._ic_config.use_intent_descriptions:
                 del self.__intents_dict[intent.name]['description']
-            if not self._state.ic_config.use_training_sentences:
+            if not self._ic_config.use_training_sentences:
                 del self.__intents_dict[intent.name]['training_sentences']
             for parameter in intent.parameters:
                 if parameter.entity.name not in self.__entities_dict:
                     self.__entities_dict[parameter.entity.name] = parameter.entity.to_json()
-                    if not self._state.ic_config.use_entity_descriptions:
+                    if not self._ic_config.use_entity_descriptions:
                         del self.__entities_dict[parameter.entity.name]['description']
-                    if not self._state.ic_config.use_entity_synonyms:
+                    if not self._ic_config.use_entity_synonyms:
                         for entry in self.__entities_dict[parameter.entity.name]['entries']:
                             del entry['synonyms']
 
+    def train(self) -> None:
+        self._prompt_prefix = None
+        self._get_prompt_prefix()
+
     def predict(self, message: str) -> list[IntentClassifierPrediction]:
         try:
             prompt = self._generate_prompt(message)
-            llm_name = self._state.ic_config.llm_name
-            parameters = self._state.ic_config.parameters
+            llm_name = self._ic_config.llm_name
+            parameters = self._ic_config.parameters
             llm = self._nlp_engine._llms[llm_name]
-            intent_classifier_results: list[IntentClassifierPrediction] = llm.intent_classification(
-                intent_classifier=self,
-                message=prompt,
-                parameters=parameters
-            )
+            prompt_prefix = self._get_prompt_prefix()
+            if _accepts_system_message(type(llm).intent_classification):
+                intent_classifier_results: list[IntentClassifierPrediction] = llm.intent_classification(
+                    intent_classifier=self,
+                    message=prompt,
+                    parameters=parameters,
+                    system_message=prompt_prefix
+                )
+            else:
+                # LLMs implementing intent_classification without a system message get the whole prompt
+                intent_classifier_results: list[IntentClassifierPrediction] = llm.intent_classification(
+                    intent_classifier=self,
+                    message=f'{prompt_prefix}\n\n{prompt}',
+                    parameters=parameters
+                )
         except Exception as _:
             logging.error(f"An error occurred while predicting the intent in state '{self._state.name}' with LLM "
-                          f"Intent Classifier '{self._state.ic_config.llm_name}'. See the attached exception:")
+                          f"Intent Classifier '{self._ic_config.llm_name}'. See the attached exception:")
             traceback.print_exc()
             intent_classifier_results: list[IntentClassifierPrediction] = []
         return intent_classifier_results
@@ -212,3 +261,31 @@ The output format is JSON, not List.
                     ))
                     break
         return intent_classifier_results
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_system_message(function: Callable) -> bool:
+    """Check if an implementation of :meth:`~besser.bot.nlp.llm.llm.LLM.intent_classification` accepts a system
+    message (LLMs defined before it was added to the method do not).
+
+    Args:
+        function (Callable): the intent_classification function of an LLM class
+
+    Returns:
+        bool: true if the function accepts the system_message argument, false otherwise
+    """
+    parameters = inspect.signature(function).parameters.values()
+    return any(parameter.name == 'system_message' or parameter.kind == inspect.Parameter.VAR_KEYWORD
+               for parameter in parameters)
+
+
+def _compact_json(obj: dict) -> str:
+    """Serialize an object to JSON without unnecessary whitespaces, to reduce the number of prompt tokens.
+
+    Args:
+        obj (dict): the object to serialize
+
+    Returns:
+        str: the JSON string
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
@@ -15,6 +15,7 @@ from besser.bot.nlp.preprocessing.text_preprocessing import process_text
 
 if TYPE_CHECKING:
     from besser.bot.core.state import State
+    from besser.bot.nlp.intent_classifier.intent_classifier_configuration import IntentClassifierConfiguration
     from besser.bot.nlp.nlp_engine import NLPEngine
 
 
@@ -26,6 +27,8 @@ class SimpleIntentClassifier(IntentClassifier):
     Args:
         nlp_engine (NLPEngine): the NLPEngine that handles the NLP processes of the bot
         state (State): the state the intent classifier belongs to
+        ic_config (IntentClassifierConfiguration or None): the intent classifier configuration. If None, the state's
+            configuration is used
 
     Attributes:
         _tokenizer (`TextVectorization <https://www.tensorflow.org/api_docs/python/tf/keras/layers/TextVectorization>`_):
@@ -40,21 +43,22 @@ class SimpleIntentClassifier(IntentClassifier):
     def __init__(
             self,
             nlp_engine: 'NLPEngine',
-            state: 'State'
+            state: 'State',
+            ic_config: 'IntentClassifierConfiguration' = None
     ):
-        super().__init__(nlp_engine, state)
+        super().__init__(nlp_engine, state, ic_config)
         self._tokenizer = TextVectorization(
-            max_tokens=self._state.ic_config.num_words,
+            max_tokens=self._ic_config.num_words,
             standardize='lower_and_strip_punctuation',
-            output_sequence_length=self._state.ic_config.input_max_num_tokens
+            output_sequence_length=self._ic_config.input_max_num_tokens
         )
         self._model: Sequential = Sequential([
-            Embedding(input_dim=self._state.ic_config.num_words,
-                      output_dim=self._state.ic_config.embedding_dim),
+            Embedding(input_dim=self._ic_config.num_words,
+                      output_dim=self._ic_config.embedding_dim),
             GlobalAveragePooling1D(),
-            Dense(24, activation=self._state.ic_config.activation_hidden_layers),
-            Dense(24, activation=self._state.ic_config.activation_hidden_layers),
-            Dense(len(self._state.intents), activation=self._state.ic_config.activation_last_layer)
+            Dense(24, activation=self._ic_config.activation_hidden_layers),
+            Dense(24, activation=self._ic_config.activation_hidden_layers),
+            Dense(len(self._state.intents), activation=self._ic_config.activation_last_layer)
         ])
         self.__total_training_sentences: list[str] = []
         """All the processed training sentences of all intents of the intent classifier's state."""
@@ -86,14 +90,14 @@ class SimpleIntentClassifier(IntentClassifier):
         )
         self._model.compile(
             loss=SparseCategoricalCrossentropy(),
-            optimizer=Adam(learning_rate=self._state.ic_config.lr),
+            optimizer=Adam(learning_rate=self._ic_config.lr),
             metrics=['accuracy']
         )
 
         history = self._model.fit(
             np.array(self.__total_training_sequences),
             np.array(self.__total_labels_training_sentences),
-            epochs=self._state.ic_config.num_epochs, verbose=0
+            epochs=self._ic_config.num_epochs, verbose=0
         )
 
     def predict(self, message: str) -> list[IntentClassifierPrediction]:
@@ -108,17 +112,17 @@ class SimpleIntentClassifier(IntentClassifier):
             sequences = self._tokenizer(sentences)
             padded = pad_sequences(
                 sequences,
-                maxlen=self._state.ic_config.input_max_num_tokens,
+                maxlen=self._ic_config.input_max_num_tokens,
                 padding='post',
                 truncating='post'
             )
             run_full_prediction: bool = True
-            if self._state.ic_config.discard_oov_sentences and all(i in [0, 1] for i in sequences[0]):
+            if self._ic_config.discard_oov_sentences and all(i in [0, 1] for i in sequences[0]):
                 # The sentence to predict consists of only out of vocabulary tokens,
                 # so we can automatically assign a zero probability to all classes
                 prediction = np.zeros(len(self._state.intents))
                 run_full_prediction = False  # no need to go ahead with the full NN-based prediction
-            elif self._state.ic_config.check_exact_prediction_match:
+            elif self._ic_config.check_exact_prediction_match:
                 # We check if there is an exact match with one of the training sentences
                 for i, training_sequence in enumerate(self.__total_training_sequences):
                     intent_label = self.__total_labels_training_sentences[i]
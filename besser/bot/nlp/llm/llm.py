@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 
 from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
 
@@ -73,6 +73,24 @@ class LLM(ABC):
         """
         pass
 
+    def predict_stream(self, message: str, parameters: dict = None, session: 'Session' = None,
+                       system_message: str = None) -> Iterator[str]:
+        """Make a prediction, i.e., generate an output, yielding it in chunks as they are generated.
+
+        LLMs that do not support streaming yield the whole output at once.
+
+        Args:
+            message (Any): the LLM input text
+            session (Session): the ongoing session, can be None if no context needs to be applied
+            parameters (dict): the LLM parameters to use in the prediction. If none is provided, the default LLM
+                parameters will be used
+            system_message (str): system message to give high priority context to the LLM
+
+        Returns:
+            Iterator[str]: the LLM output chunks
+        """
+        yield self.predict(message, parameters=parameters, session=session, system_message=system_message)
+
     def chat(self, session: 'Session', parameters: dict = None, system_message: str = None) -> str:
         """Make a prediction, i.e., generate an output.
 
@@ -90,11 +108,30 @@ class LLM(ABC):
         logging.warning(f'Chat not implemented in {self.__class__.__name__}')
         return None
 
+    def chat_stream(self, session: 'Session', parameters: dict = None, system_message: str = None) -> Iterator[str]:
+        """Make a prediction using the chat history (see :meth:`chat`), yielding the output in chunks as they are
+        generated.
+
+        LLMs that do not support streaming yield the whole output at once.
+
+        Args:
+            session (Session): the user session
+            parameters (dict): the LLM parameters. If none is provided, the RAG's default value will be used
+            system_message (str): system message to give high priority context to the LLM
+
+        Returns:
+            Iterator[str]: the LLM output chunks
+        """
+        answer = self.chat(session, parameters=parameters, system_message=system_message)
+        if answer is not None:
+            yield answer
+
     def intent_classification(
             self,
             intent_classifier: 'LLMIntentClassifier',
             message: str,
-            parameters: dict = None
+            parameters: dict = None,
+            system_message: str = None
     ) -> list[IntentClassifierPrediction]:
         """Predict the intent of a given message.
 
@@ -106,6 +143,8 @@ class LLM(ABC):
                 process
             message (str): the message to predict the intent
             parameters (dict): the LLM parameters. If none is provided, the RAG's default value will be used
+            system_message (str): the system message, containing the static part of the prompt (the instructions and
+                the intent definitions). It must be sent before the message, so the LLM providers can cache it
 
         Returns:
             list[IntentClassifierPrediction]: the list of predictions made by the LLM.
@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING
+import threading
+from typing import Iterator, TYPE_CHECKING
 
-from transformers import pipeline
+from transformers import TextIteratorStreamer, pipeline
 
 from besser.bot.core.message import MessageType, Message
 from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction
@@ -58,34 +59,37 @@ class LLMHuggingFace(LLM):
     def initialize(self) -> None:
         self.pipe = pipeline("text-generation", model=self.name)
 
-    def predict(self, message: str, parameters: dict = None, session: 'Session' = None,
-                system_message: str = None) -> str:
-        if not parameters:
-            parameters = self.parameters
+    def _get_context_messages(self, session: 'Session' = None, system_message: str = None) -> list[dict]:
+        """Get the system messages containing the LLM context.
+
+        Args:
+            session (Session): the ongoing session, can be None if no user context needs to be applied
+            system_message (str): system message to give high priority context to the LLM
+
+        Returns:
+            list[dict]: the context messages
+        """
         context_messages = []
         if self._global_context:
             context_messages.append({'role': 'system', 'content': f"{self._global_context}\n"})
         if session and session.id in self._user_context:
             context_messages.append({'role': 'system', 'content': f"{self._user_context[session.id]}\n"})
         if system_message:
-            context_messages = context_messages + f"{system_message}\n"
-        messages = merge_llm_consecutive_messages(context_messages + [{'role': 'user', 'content': message}])
-        outputs = self.pipe(messages, return_full_text=False, **parameters)
-        answer = outputs[0]['generated_text']
-        return answer
+            context_messages.append({'role': 'system', 'content': f"{system_message}\n"})
+        return context_messages
 
-    def chat(self, session: 'Session', parameters: dict = None, system_message: str = None) -> str:
-        if not parameters:
-            parameters = self.parameters
+    def _get_chat_messages(self, session: 'Session', system_message: str = None) -> list[dict]:
+        """Get the messages (context and chat history) to send to the LLM in the chat functionality.
+
+        Args:
+            session (Session): the user session
+            system_message (str): system message to give high priority context to the LLM
+
+        Returns:
+            list[dict]: the messages
+        """
         if self.num_previous_messages <= 0:
             raise ValueError('The number of previous messages to send to the LLM must be > 0')
-        context_messages = []
-        if self._global_context:
-            context_messages.append({'role': 'system', 'content': f"{self._global_context}\n"})
-        if session and session.id in self._user_context:
-            context_messages.append({'role': 'system', 'content': f"{self._user_context[session.id]}\n"})
-        if system_message:
-            context_messages.append({'role': 'system', 'content': f"{system_message}\n"})
         chat_history: list[Message] = session.get_chat_history(n=self.num_previous_messages)
         messages = [
             {'role': 'user' if message.is_user else 'assistant', 'content': message.content}
@@ -94,20 +98,72 @@ class LLMHuggingFace(LLM):
         ]
         if not messages:
             messages.append({'role': 'user', 'content': session.message})
-        messages = merge_llm_consecutive_messages(context_messages + messages)
+        return merge_llm_consecutive_messages(self._get_context_messages(session, system_message) + messages)
+
+    def _stream(self, messages: list[dict], parameters: dict) -> Iterator[str]:
+        """Run the LLM pipeline in another thread, yielding the output chunks as they are generated.
+
+        Args:
+            messages (list[dict]): the messages to send to the LLM
+            parameters (dict): the LLM parameters
+
+        Returns:
+            Iterator[str]: the LLM output chunks
+        """
+        streamer = TextIteratorStreamer(self.pipe.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        thread = threading.Thread(
+            target=self.pipe,
+            args=(messages,),
+            kwargs={'return_full_text': False, 'streamer': streamer, **parameters}
+        )
+        thread.start()
+        for chunk in streamer:
+            if chunk:
+                yield chunk
+        thread.join()
+
+    def predict(self, message: str, parameters: dict = None, session: 'Session' = None,
+                system_message: str = None) -> str:
+        if not parameters:
+            parameters = self.parameters
+        context_messages = self._get_context_messages(session, system_message)
+        messages = merge_llm_consecutive_messages(context_messages + [{'role': 'user', 'content': message}])
+        outputs = self.pipe(messages, return_full_text=False, **parameters)
+        answer = outputs[0]['generated_text']
+        return answer
+
+    def predict_stream(self, message: str, parameters: dict = None, session: 'Session' = None,
+                       system_message: str = None) -> Iterator[str]:
+        if not parameters:
+            parameters = self.parameters
+        context_messages = self._get_context_messages(session, system_message)
+        messages = merge_llm_consecutive_messages(context_messages + [{'role': 'user', 'content': message}])
+        yield from self._stream(messages, parameters)
+
+    def chat(self, session: 'Session', parameters: dict = None, system_message: str = None) -> str:
+        if not parameters:
+            parameters = self.parameters
+        messages = self._get_chat_messages(session, system_message)
         outputs = self.pipe(messages, return_full_text=False, **parameters)
         answer = outputs[0]['generated_text']
         return answer
 
+    def chat_stream(self, session: 'Session', parameters: dict = None, system_message: str = None) -> Iterator[str]:
+        if not parameters:
+            parameters = self.parameters
+        messages = self._get_chat_messages(session, system_message)
+        yield from self._stream(messages, parameters)
+
     def intent_classification(
             self,
             intent_classifier: 'LLMIntentClassifier',
             message: str,
-            parameters: dict = None
+            parameters: dict = None,
+            system_message: str = None
     ) -> list[IntentClassifierPrediction]:
         if not parameters:
             parameters = self.parameters
-        answer = self.predict(message, parameters)
+        answer = self.predict(message, parameters, system_message=system_message)
         response_json = find_json(answer)
         return intent_classifier.default_json_to_intent_classifier_predictions(
             message=message,
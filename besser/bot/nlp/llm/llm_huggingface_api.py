@@ -101,9 +101,10 @@ class LLMHuggingFaceAPI(LLM):
             self,
             intent_classifier: 'LLMIntentClassifier',
             message: str,
-            parameters: dict = None
+            parameters: dict = None,
+            system_message: str = None
     ) -> list[IntentClassifierPrediction]:
-        answer = self.predict(message, parameters)
+        answer = self.predict(message, parameters, system_message=system_message)
         response_json = find_json(answer)
         return intent_classifier.default_json_to_intent_classifier_predictions(
             message=message,
@@ -1,5 +1,5 @@
 import json
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 
 from openai import OpenAI
 
@@ -62,14 +62,68 @@ class LLMOpenAI(LLM):
     def initialize(self) -> None:
         self.client = OpenAI(api_key=self._nlp_engine.get_property(nlp.OPENAI_API_KEY))
 
-    def predict(self, message: str, parameters: dict = None, session: 'Session' = None, system_message: str = None) -> str:
-        messages = []
+    def _get_context_messages(self, session: 'Session' = None, system_message: str = None) -> list[dict]:
+        """Get the system messages containing the LLM context.
+
+        Args:
+            session (Session): the ongoing session, can be None if no user context needs to be applied
+            system_message (str): system message to give high priority context to the LLM
+
+        Returns:
+            list[dict]: the context messages
+        """
+        context_messages = []
         if self._global_context:
-            messages.append({"role": "system", "content": self._global_context})
+            context_messages.append({"role": "system", "content": self._global_context})
         if session and session.id in self._user_context:
-            messages.append({"role": "system", "content": self._user_context[session.id]})
+            context_messages.append({"role": "system", "content": self._user_context[session.id]})
         if system_message:
-            messages.append({"role": "system", "content": system_message})
+            context_messages.append({"role": "system", "content": system_message})
+        return context_messages
+
+    def _get_chat_messages(self, session: 'Session') -> list[dict]:
+        """Get the messages of the chat history to send to the LLM.
+
+        Args:
+            session (Session): the user session
+
+        Returns:
+            list[dict]: the chat messages
+        """
+        if self.num_previous_messages <= 0:
+            raise ValueError('The number of previous messages to send to the LLM must be > 0')
+        chat_history: list[Message] = session.get_chat_history(n=self.num_previous_messages)
+        messages = [
+            {'role': 'user' if message.is_user else 'assistant', 'content': message.content}
+            for message in chat_history
+            if message.type in [MessageType.STR, MessageType.LOCATION]
+        ]
+        if not messages:
+            messages.append({'role': 'user', 'content': session.message})
+        return messages
+
+    def _stream(self, messages: list[dict], parameters: dict) -> Iterator[str]:
+        """Send messages to the LLM, yielding the output chunks as they are generated.
+
+        Args:
+            messages (list[dict]): the messages to send to the LLM
+            parameters (dict): the LLM parameters
+
+        Returns:
+            Iterator[str]: the LLM output chunks
+        """
+        response = self.client.chat.completions.create(
+            model=self.name,
+            messages=messages,
+            stream=True,
+            **parameters,
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def predict(self, message: str, parameters: dict = None, session: 'Session' = None, system_message: str = None) -> str:
+        messages = self._get_context_messages(session, system_message)
         messages.append({"role": "user", "content": message})
         if not parameters:
             parameters = self.parameters
@@ -80,44 +134,46 @@ class LLMOpenAI(LLM):
         )
         return response.choices[0].message.content
 
+    def predict_stream(self, message: str, parameters: dict = None, session: 'Session' = None,
+                       system_message: str = None) -> Iterator[str]:
+        messages = self._get_context_messages(session, system_message)
+        messages.append({"role": "user", "content": message})
+        if not parameters:
+            parameters = self.parameters
+        yield from self._stream(messages, parameters)
+
     def chat(self, session: 'Session', parameters: dict = None, system_message: str = None) -> str:
         if not parameters:
             parameters = self.parameters
-        if self.num_previous_messages <= 0:
-            raise ValueError('The number of previous messages to send to the LLM must be > 0')
-        chat_history: list[Message] = session.get_chat_history(n=self.num_previous_messages)
-        messages = [
-            {'role': 'user' if message.is_user else 'assistant', 'content': message.content}
-            for message in chat_history
-            if message.type in [MessageType.STR, MessageType.LOCATION]
-        ]
-        if not messages:
-            messages.append({'role': 'user', 'content': session.message})
-        context_messages = []
-        if self._global_context:
-            context_messages.append({"role": "system", "content": self._global_context})
-        if session and session.id in self._user_context:
-            context_messages.append({"role": "system", "content": self._user_context[session.id]})
-        if system_message:
-            context_messages.append({"role": "system", "content": system_message})
+        messages = self._get_chat_messages(session)
         response = self.client.chat.completions.create(
             model=self.name,
-            messages=context_messages + messages,
+            messages=self._get_context_messages(session, system_message) + messages,
             **parameters,
         )
         return response.choices[0].message.content
 
+    def chat_stream(self, session: 'Session', parameters: dict = None, system_message: str = None) -> Iterator[str]:
+        if not parameters:
+            parameters = self.parameters
+        messages = self._get_chat_messages(session)
+        yield from self._stream(self._get_context_messages(session, system_message) + messages, parameters)
+
     def intent_classification(
             self,
             intent_classifier: 'LLMIntentClassifier',
             message: str,
-            parameters: dict = None
+            parameters: dict = None,
+            system_message: str = None
     ) -> list[IntentClassifierPrediction]:
         if not parameters:
             parameters = self.parameters
         response = self.client.chat.completions.create(
             model=self.name,
             messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": message}
+            ] if system_message else [
                 {"role": "user", "content": message}
             ],
             response_format={"type": "json_object"},
@@ -86,13 +86,15 @@ class LLMReplicate(LLM):
             self,
             intent_classifier: 'LLMIntentClassifier',
             message: str,
-            parameters: dict = None
+            parameters: dict = None,
+            system_message: str = None
     ) -> list[IntentClassifierPrediction]:
         if not parameters:
             parameters = self.parameters.copy()
         else:
             parameters = parameters.copy()
-        parameters['prompt'] = message
+        # The system message is prepended, so the prompt keeps the same prefix in all the predictions
+        parameters['prompt'] = f'{system_message}\n{message}' if system_message else message
         answer = replicate.run(
             self.name,
             input=parameters,
@@ -2,31 +2,30 @@ import os
 
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # Hide Tensorflow logs
 
+import asyncio
 import logging
-from typing import Any, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, TYPE_CHECKING
 
 from besser.bot import nlp
 from besser.bot.core.property import Property
 from besser.bot.core.session import Session
 from besser.bot.nlp.intent_classifier.intent_classifier import IntentClassifier
-from besser.bot.nlp.intent_classifier.intent_classifier_configuration import LLMIntentClassifierConfiguration, \
+from besser.bot.nlp.intent_classifier.intent_classifier_configuration import CascadeIntentClassifierConfiguration, \
+    EmbeddingIntentClassifierConfiguration, IntentClassifierConfiguration, LLMIntentClassifierConfiguration, \
     SimpleIntentClassifierConfiguration
 from besser.bot.nlp.intent_classifier.intent_classifier_prediction import IntentClassifierPrediction, \
     fallback_intent_prediction
-from besser.bot.nlp.intent_classifier.llm_intent_classifier import LLMIntentClassifier
-from besser.bot.nlp.intent_classifier.simple_intent_classifier import SimpleIntentClassifier
+from besser.bot.nlp.intent_classifier.intent_prediction_cache import IntentPredictionCache, normalize_message
 from besser.bot.nlp.llm.llm import LLM
 from besser.bot.nlp.ner.ner import NER
 from besser.bot.nlp.ner.simple_ner import SimpleNER
-from besser.bot.nlp.preprocessing.pipelines import lang_map
-from besser.bot.nlp.rag.rag import RAG
-from besser.bot.nlp.speech2text.hf_speech2text import HFSpeech2Text
-from besser.bot.nlp.speech2text.api_speech2text import APISpeech2Text
 from besser.bot.nlp.speech2text.speech2text import Speech2Text
 
 if TYPE_CHECKING:
     from besser.bot.core.bot import Bot
     from besser.bot.core.state import State
+    from besser.bot.nlp.rag.rag import RAG
 
 
 class NLPEngine:
@@ -44,6 +43,9 @@ class NLPEngine:
             There is one for each bot state (only states with transitions triggered by intent matching)
         _ner (NER or None): The NER (Named Entity Recognition) system of the NLPEngine
         _speech2text (Speech2Text or None): The Speech-to-Text System of the NLPEngine
+        _speech2text_executor (ThreadPoolExecutor or None): The thread pool (and queue) where the asynchronous
+            speech-to-text transcriptions run
+        _intent_prediction_cache (IntentPredictionCache or None): The cache of the intent predictions
     """
 
     def __init__(self, bot: 'Bot'):
@@ -52,7 +54,14 @@ class NLPEngine:
         self._intent_classifiers: dict['State', IntentClassifier] = {}
         self._ner: NER or None = None
         self._speech2text: Speech2Text or None = None
-        self._rag: RAG = None
+        self._speech2text_executor: ThreadPoolExecutor or None = None
+        self._intent_prediction_cache: IntentPredictionCache or None = None
+        self._rag: 'RAG' = None
+
+    @property
+    def intent_prediction_cache(self) -> IntentPredictionCache or None:
+        """IntentPredictionCache or None: The cache of the intent predictions (with its hit/miss metrics)."""
+        return self._intent_prediction_cache
 
     @property
     def ner(self):
@@ -60,7 +69,12 @@ class NLPEngine:
         return self._ner
 
     def initialize(self) -> None:
-        """Initialize the NLPEngine."""
+        """Initialize the NLPEngine.
+
+        The NLP backends (e.g. Keras, Transformers) are only imported here when the bot uses a component that needs
+        them.
+        """
+        from besser.bot.nlp.preprocessing.pipelines import lang_map
         if self.get_property(nlp.NLP_LANGUAGE) in lang_map.values():
             # Set the language to ISO 639-1 format (e.g., 'english' => 'en')
             self._bot.set_property(
@@ -71,16 +85,68 @@ class NLPEngine:
             self._llms[llm_name].initialize()
         for state in self._bot.states:
             if state not in self._intent_classifiers and state.intents:
-                if isinstance(state.ic_config, SimpleIntentClassifierConfiguration):
-                    self._intent_classifiers[state] = SimpleIntentClassifier(self, state)
-                elif isinstance(state.ic_config, LLMIntentClassifierConfiguration):
-                    self._intent_classifiers[state] = LLMIntentClassifier(self, state)
+                intent_classifier = self._create_intent_classifier(state, state.ic_config)
+                if intent_classifier is not None:
+                    self._intent_classifiers[state] = intent_classifier
         # TODO: Only instantiate the NER if asked (maybe a bot does not need NER), via bot properties
         self._ner = SimpleNER(self, self._bot)
         if self.get_property(nlp.NLP_STT_HF_MODEL):
+            from besser.bot.nlp.speech2text.hf_speech2text import HFSpeech2Text
             self._speech2text = HFSpeech2Text(self)
         elif self.get_property(nlp.NLP_STT_SR_ENGINE):
+            from besser.bot.nlp.speech2text.api_speech2text import APISpeech2Text
             self._speech2text = APISpeech2Text(self)
+        if self._intent_prediction_cache is None:
+            self._intent_prediction_cache = IntentPredictionCache(
+                max_size=self.get_property(nlp.NLP_INTENT_CACHE_SIZE),
+                ttl=self.get_property(nlp.NLP_INTENT_CACHE_TTL),
+                max_message_length=self.get_property(nlp.NLP_INTENT_CACHE_MAX_MESSAGE_LENGTH)
+            )
+        if self._speech2text is not None and self._speech2text_executor is None:
+            self._speech2text_executor = ThreadPoolExecutor(
+                max_workers=self.get_property(nlp.NLP_STT_MAX_WORKERS),
+                thread_name_prefix=f'{self._bot.name}_speech2text'
+            )
+
+    def _create_intent_classifier(
+            self,
+            state: 'State',
+            ic_config: IntentClassifierConfiguration
+    ) -> IntentClassifier or None:
+        """Create the intent classifier of a state for an intent classifier configuration. The intent classifier module
+        (and its backend) is only imported when it is used.
+
+        Args:
+            state (State): the state the intent classifier belongs to
+            ic_config (IntentClassifierConfiguration): the intent classifier configuration
+
+        Returns:
+            IntentClassifier or None: the intent classifier, or None if the configuration is not supported
+        """
+        if isinstance(ic_config, SimpleIntentClassifierConfiguration):
+            from besser.bot.nlp.intent_classifier.simple_intent_classifier import SimpleIntentClassifier
+            return SimpleIntentClassifier(self, state, ic_config)
+        if isinstance(ic_config, LLMIntentClassifierConfiguration):
+            from besser.bot.nlp.intent_classifier.llm_intent_classifier import LLMIntentClassifier
+            return LLMIntentClassifier(self, state, ic_config)
+        if isinstance(ic_config, EmbeddingIntentClassifierConfiguration):
+            from besser.bot.nlp.intent_classifier.embedding_intent_classifier import EmbeddingIntentClassifier
+            return EmbeddingIntentClassifier(self, state, ic_config)
+        if isinstance(ic_config, CascadeIntentClassifierConfiguration):
+            from besser.bot.nlp.intent_classifier.cascade_intent_classifier import CascadeIntentClassifier
+            return CascadeIntentClassifier(self, state, ic_config)
+        return None
+
+    def get_intent_classifier(self, state: 'State') -> IntentClassifier or None:
+        """Get the intent classifier of a state (e.g. to read its metrics).
+
+        Args:
+            state (State): the state
+
+        Returns:
+            IntentClassifier or None: the intent classifier of the state, or None if it has no intent classifier
+        """
+        return self._intent_classifiers.get(state)
 
     def get_property(self, prop: Property) -> Any:
         """Get a NLP property's value from the NLPEngine's bot.
@@ -99,6 +165,9 @@ class NLPEngine:
         """Train the NLP components of the NLPEngine."""
         self._ner.train()
         logging.info(f"NER successfully trained.")
+        if self._intent_prediction_cache is not None:
+            # The cached predictions may differ from the ones of the retrained classifiers
+            self._intent_prediction_cache.clear()
         for state, intent_classifier in self._intent_classifiers.items():
             if not state.intents:
                 logging.info(f"Intent classifier in {state.name} not trained (no intents found).")
@@ -109,6 +178,9 @@ class NLPEngine:
     def predict_intent(self, session: Session) -> IntentClassifierPrediction:
         """Predict the intent of a user message.
 
+        The best predictions of short messages are cached (see :obj:`~besser.bot.nlp.NLP_INTENT_CACHE_SIZE`), so
+        repeated messages are not classified again.
+
         Args:
             session (Session): the user session
 
@@ -119,9 +191,18 @@ class NLPEngine:
         fallback_intent = fallback_intent_prediction(session.message)
         if not session.current_state.intents:
             return fallback_intent
-        intent_classifier = self._intent_classifiers[session.current_state]
-        intent_classifier_predictions: list[IntentClassifierPrediction] = intent_classifier.predict(message)
-        best_intent_prediction = self.get_best_intent_prediction(intent_classifier_predictions)
+        cache = self._intent_prediction_cache
+        cache_message = normalize_message(message)
+        cacheable = cache is not None and cache.cacheable(cache_message)
+        found = False
+        if cacheable:
+            found, best_intent_prediction = cache.get(session.current_state, cache_message)
+        if not found:
+            intent_classifier = self._intent_classifiers[session.current_state]
+            intent_classifier_predictions: list[IntentClassifierPrediction] = intent_classifier.predict(message)
+            best_intent_prediction = self.get_best_intent_prediction(intent_classifier_predictions)
+            if cacheable:
+                cache.put(session.current_state, cache_message, best_intent_prediction)
         if best_intent_prediction is None:
             best_intent_prediction = fallback_intent
         return best_intent_prediction
@@ -164,3 +245,35 @@ class NLPEngine:
         text = self._speech2text.speech2text(speech)
         logging.info(f"[Speech2Text] Transcribed audio message: '{text}'")
         return text
+
+    def speech2text_stream(self, speech: bytes) -> Iterator[str]:
+        """Transcribe a voice audio incrementally, yielding the transcription in parts as it is generated (e.g. for
+        each window of a long audio, see :meth:`~besser.bot.nlp.speech2text.speech2text.Speech2Text.speech2text_stream`).
+
+        Args:
+            speech (bytes): the recorded voice that wants to be transcribed
+
+        Returns:
+            Iterator[str]: the parts of the speech transcription
+        """
+        for text in self._speech2text.speech2text_stream(speech):
+            logging.info(f"[Speech2Text] Transcribed audio message part: '{text}'")
+            yield text
+
+    async def speech2text_async(self, speech: bytes) -> str:
+        """Transcribe a voice audio into its corresponding text representation, without blocking the event loop.
+
+        The transcription is submitted to the Speech2Text component (see
+        :meth:`~besser.bot.nlp.speech2text.speech2text.Speech2Text.submit`), with the NLPEngine's speech-to-text thread
+        pool (see :obj:`~besser.bot.nlp.NLP_STT_MAX_WORKERS`) for the blocking work, so the event loop can keep
+        handling other users while it waits.
+
+        Args:
+            speech (bytes): the recorded voice that wants to be transcribed
+
+        Returns:
+            str: the speech transcription
+        """
+        text = await asyncio.wrap_future(self._speech2text.submit(speech, self._speech2text_executor))
+        logging.info(f"[Speech2Text] Transcribed audio message: '{text}'")
+        return text
@@ -1,10 +1,10 @@
 import logging
+import re
+import threading
 
-import nltk
 import snowballstemmer
 
 lang_map_stemmers = snowballstemmer._languages
-lang_map_tokenizers = nltk.SnowballStemmer.languages
 lang_map = {
     'en': 'english',
     'es': 'spanish',
@@ -19,11 +19,28 @@ lang_map = {
 }
 stemmers: dict[str, snowballstemmer.stemmer] = {}
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    # "punkt" is not installed, download it
-    nltk.download('punkt')
+# Whether the NLTK punkt tokenizer is available (None until it is resolved, on the first tokenization)
+punkt_available: bool = None
+punkt_lock: threading.Lock = threading.Lock()
+
+simple_tokenizer_pattern: re.Pattern = re.compile(r"\w+(?:['’.,-]\w+)*|[^\w\s]")
+
+
+def __getattr__(name: str):
+    # lang_map_tokenizers is computed on first access, so that NLTK is not imported with this module
+    if name == 'lang_map_tokenizers':
+        return get_lang_map_tokenizers()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def get_lang_map_tokenizers() -> tuple[str, ...]:
+    """Get the languages with an NLTK tokenizer. NLTK is imported the first time this function is called.
+
+    Returns:
+        tuple[str, ...]: the languages
+    """
+    import nltk
+    return nltk.SnowballStemmer.languages
 
 
 def create_or_get_stemmer(lang: str = 'english') -> snowballstemmer:
@@ -33,3 +50,83 @@ def create_or_get_stemmer(lang: str = 'english') -> snowballstemmer:
     stemmers[lang] = stemmer
     logging.info(f'Stemmer added: {lang}')
     return stemmer
+
+
+def load_punkt(resources_path: str = None, download: bool = True) -> bool:
+    """Resolve the NLTK punkt tokenizer models. They are only looked up (and downloaded, if necessary) the first time
+    this function is called.
+
+    Args:
+        resources_path (str or None): the directory containing the tokenizer resources. If set, the models are only
+            looked up in this directory and they are never downloaded
+        download (bool): whether to download the models if they are not installed
+
+    Returns:
+        bool: whether the punkt tokenizer is available or not
+    """
+    global punkt_available
+    with punkt_lock:
+        if punkt_available is None:
+            punkt_available = _find_punkt(resources_path, download)
+        return punkt_available
+
+
+def _find_punkt(resources_path: str = None, download: bool = True) -> bool:
+    """Look up the NLTK punkt tokenizer models, downloading them if necessary and allowed.
+
+    Args:
+        resources_path (str or None): the directory containing the tokenizer resources
+        download (bool): whether to download the models if they are not installed
+
+    Returns:
+        bool: whether the punkt tokenizer is available or not
+    """
+    import nltk
+    try:
+        nltk.data.find('tokenizers/punkt', paths=[resources_path] if resources_path else None)
+        if resources_path and resources_path not in nltk.data.path:
+            nltk.data.path.insert(0, resources_path)
+        return True
+    except LookupError:
+        pass
+    if resources_path is None and download:
+        logging.info('Downloading the NLTK punkt tokenizer')
+        if nltk.download('punkt', quiet=True):
+            return True
+    logging.warning('The NLTK punkt tokenizer is not available, a simple tokenizer will be used instead')
+    return False
+
+
+def simple_tokenize(text: str) -> list[str]:
+    """Split a text into words and punctuation signs. It is used when the NLTK punkt tokenizer is not available.
+
+    Args:
+        text (str): the text to tokenize
+
+    Returns:
+        list[str]: the tokens
+    """
+    return simple_tokenizer_pattern.findall(text)
+
+
+def tokenize(text: str, language: str = 'english', resources_path: str = None, download: bool = True) -> list[str]:
+    """Split a text into tokens, with the NLTK punkt tokenizer if it is available, or with :func:`simple_tokenize`
+    otherwise.
+
+    Args:
+        text (str): the text to tokenize
+        language (str): the text language (e.g. 'english')
+        resources_path (str or None): the directory containing the tokenizer resources
+        download (bool): whether to download the tokenizer resources if they are not installed
+
+    Returns:
+        list[str]: the tokens
+    """
+    if load_punkt(resources_path, download):
+        from nltk.tokenize import word_tokenize
+        try:
+            return word_tokenize(text, language=language)
+        except LookupError:
+            # The punkt model of this language is not installed
+            pass
+    return simple_tokenize(text)
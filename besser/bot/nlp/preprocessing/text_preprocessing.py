@@ -1,8 +1,7 @@
 from typing import TYPE_CHECKING
-from nltk.tokenize import word_tokenize
 
 from besser.bot import nlp
-from besser.bot.nlp.preprocessing.pipelines import create_or_get_stemmer, lang_map, lang_map_tokenizers
+from besser.bot.nlp.preprocessing.pipelines import create_or_get_stemmer, get_lang_map_tokenizers, lang_map, tokenize
 
 if TYPE_CHECKING:
     from besser.bot.nlp.nlp_engine import NLPEngine
@@ -17,7 +16,12 @@ def process_text(text: str, nlp_engine: 'NLPEngine') -> str:
     if pre_processing:
         # TODO: remove punctuation signs
         if language != "lb":
-            preprocessed_sentence = stem_text(preprocessed_sentence, language)
+            preprocessed_sentence = stem_text(
+                preprocessed_sentence,
+                language,
+                resources_path=nlp_engine.get_property(nlp.NLP_TOKENIZER_RESOURCES_PATH),
+                download=nlp_engine.get_property(nlp.NLP_TOKENIZER_DOWNLOAD)
+            )
         else:
             # as luxembourgish is the only time we use a lemmatize, we decided to go with the
             # easy path to just make one exception
@@ -25,14 +29,14 @@ def process_text(text: str, nlp_engine: 'NLPEngine') -> str:
     return preprocessed_sentence
 
 
-def stem_text(text: str, language: str) -> str:
+def stem_text(text: str, language: str, resources_path: str = None, download: bool = True) -> str:
     stemmer_language: str = 'english'  # default set to english
     if language in lang_map:
         stemmer_language = lang_map[language]
     stemmer = create_or_get_stemmer(stemmer_language)
     # not every stemming language has a corresponsing tokenizer, should we simply use a basic tokenizer for languages that do not possess the fitting tokenizer?
-    if language in lang_map_tokenizers:
-        tokens: list[str] = word_tokenize(text, language=stemmer_language)
+    if language in get_lang_map_tokenizers():
+        tokens: list[str] = tokenize(text, stemmer_language, resources_path, download)
     else:
         tokens: list[str] = text.split()
     stemmed_sentence: list[str] = []
@@ -0,0 +1,167 @@
+"""Audio decoding utilities for the Speech2Text components.
+
+PCM WAV audios (the most common format of voice messages recorded by web browsers) are decoded directly with the
+:mod:`wave` module and NumPy. Other formats are decoded with `soundfile <https://github.com/bastibe/python-soundfile>`_
+or, as a last resort, `librosa <https://librosa.org/>`_, which are only imported when they are needed.
+"""
+
+import io
+import math
+import wave
+from typing import Iterator
+
+import numpy as np
+
+
+def pcm_to_float(frames: bytes, sample_width: int, channels: int) -> np.ndarray:
+    """Convert PCM frames to a mono float audio, with samples between -1 and 1.
+
+    Args:
+        frames (bytes): the PCM frames (little-endian)
+        sample_width (int): the number of bytes of each sample (1, 2, 3 or 4)
+        channels (int): the number of channels. They are averaged
+
+    Returns:
+        np.ndarray: the audio (float32)
+    """
+    if sample_width == 1:
+        # 8-bit samples are unsigned
+        audio = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        audio = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 2 ** 15
+    elif sample_width == 3:
+        # 24-bit samples are extended to 32 bits (the lowest byte is left empty, so the sign is kept)
+        samples = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(samples), 4), dtype=np.uint8)
+        padded[:, 1:] = samples
+        audio = padded.view('<i4').reshape(-1).astype(np.float32) / 2 ** 31
+    elif sample_width == 4:
+        audio = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2 ** 31
+    else:
+        raise ValueError(f'Unsupported PCM sample width: {sample_width} bytes')
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Resample an audio with linear interpolation. When downsampling, the audio is first low-pass filtered with a
+    moving average, to reduce aliasing.
+
+    This is much faster than high-quality resamplers, and accurate enough for speech recognition.
+
+    Args:
+        audio (np.ndarray): the audio
+        orig_sr (int): the sampling rate of the audio
+        target_sr (int): the target sampling rate
+
+    Returns:
+        np.ndarray: the resampled audio (float32)
+    """
+    if orig_sr == target_sr or len(audio) == 0:
+        return audio.astype(np.float32, copy=False)
+    ratio = orig_sr / target_sr
+    if ratio > 1:
+        width = math.ceil(ratio)
+        audio = np.convolve(audio, np.full(width, 1 / width, dtype=np.float32), mode='same')
+    length = max(round(len(audio) / ratio), 1)
+    positions = np.arange(length, dtype=np.float64) * ratio
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def split_windows(audio: np.ndarray, sampling_rate: int, window_length: float,
+                  window_overlap: float) -> Iterator[np.ndarray]:
+    """Split a decoded audio in overlapping windows.
+
+    Args:
+        audio (np.ndarray): the audio
+        sampling_rate (int): the audio sampling rate
+        window_length (float): the length of the windows, in seconds
+        window_overlap (float): the overlap between consecutive windows, in seconds
+
+    Returns:
+        Iterator[np.ndarray]: the audio windows (views of the audio)
+    """
+    for start, window in _window_positions(len(audio), sampling_rate, window_length, window_overlap):
+        yield audio[start:start + window]
+
+
+def _window_positions(frames: int, sampling_rate: int, window_length: float,
+                      window_overlap: float) -> Iterator[tuple[int, int]]:
+    """Get the positions of the overlapping windows of an audio.
+
+    Args:
+        frames (int): the number of frames of the audio
+        sampling_rate (int): the audio sampling rate
+        window_length (float): the length of the windows, in seconds
+        window_overlap (float): the overlap between consecutive windows, in seconds
+
+    Returns:
+        Iterator[tuple[int, int]]: the first frame and the number of frames of each window
+    """
+    if frames == 0:
+        return
+    window = math.ceil(window_length * sampling_rate)
+    step = window - math.ceil(window_overlap * sampling_rate)
+    for start in range(0, max(frames - window, 0) + step, step):
+        yield start, window
+
+
+def decode_windows(speech: bytes, sampling_rate: int, window_length: float,
+                   window_overlap: float) -> Iterator[np.ndarray]:
+    """Decode an audio in overlapping windows, resampled to a given sampling rate. The windows are decoded one by one,
+    so the whole audio is never decoded in memory (except for the formats only supported by librosa).
+
+    Args:
+        speech (bytes): the audio file content
+        sampling_rate (int): the target sampling rate
+        window_length (float): the length of the windows, in seconds
+        window_overlap (float): the overlap between consecutive windows, in seconds
+
+    Returns:
+        Iterator[np.ndarray]: the audio windows (mono, float32)
+    """
+    try:
+        wav_file = wave.open(io.BytesIO(speech), 'rb')
+    except (wave.Error, EOFError):
+        # Not a PCM WAV audio
+        wav_file = None
+    if wav_file is not None:
+        with wav_file:
+            rate = wav_file.getframerate()
+            for start, window in _window_positions(wav_file.getnframes(), rate, window_length, window_overlap):
+                wav_file.setpos(start)
+                audio = pcm_to_float(wav_file.readframes(window), wav_file.getsampwidth(), wav_file.getnchannels())
+                yield resample(audio, rate, sampling_rate)
+        return
+    yield from _decode_windows_fallback(speech, sampling_rate, window_length, window_overlap)
+
+
+def _decode_windows_fallback(speech: bytes, sampling_rate: int, window_length: float,
+                             window_overlap: float) -> Iterator[np.ndarray]:
+    """Decode an audio that is not a PCM WAV in overlapping windows, with soundfile or, if soundfile does not support
+    its format, librosa.
+
+    Args:
+        speech (bytes): the audio file content
+        sampling_rate (int): the target sampling rate
+        window_length (float): the length of the windows, in seconds
+        window_overlap (float): the overlap between consecutive windows, in seconds
+
+    Returns:
+        Iterator[np.ndarray]: the audio windows (mono, float32)
+    """
+    import soundfile
+    try:
+        audio_file = soundfile.SoundFile(io.BytesIO(speech))
+    except RuntimeError:
+        import librosa
+        audio, _ = librosa.load(io.BytesIO(speech), sr=sampling_rate)
+        yield from split_windows(audio, sampling_rate, window_length, window_overlap)
+        return
+    with audio_file:
+        rate = audio_file.samplerate
+        for start, window in _window_positions(audio_file.frames, rate, window_length, window_overlap):
+            audio_file.seek(start)
+            audio = audio_file.read(window, dtype='float32', always_2d=True).mean(axis=1)
+            yield resample(audio, rate, sampling_rate)
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class BatchScheduler:
+    """A micro-batching scheduler.
+
+    It collects the requests submitted (from any thread) during a short time and processes them together, in a
+    single call to the batch function (e.g. a single model inference), in a background thread.
+
+    A batch is processed when it has ``max_batch_size`` requests, or ``max_wait`` seconds after its first request was
+    submitted (so a request never waits more than ``max_wait`` seconds for other requests).
+
+    Args:
+        process_batch (Callable[[list], list]): the function that processes a batch of requests. It must return a
+            result for each request, in the same order. If a result is an :class:`Exception`, it is raised to the
+            request submitter
+        max_batch_size (int): the maximum number of requests processed together
+        max_wait (float): the maximum time a request waits for other requests to fill its batch, in seconds
+        name (str): the name of the scheduler thread
+
+    Attributes:
+        _process_batch (Callable[[list], list]): The function that processes a batch of requests
+        _max_batch_size (int): The maximum number of requests processed together
+        _max_wait (float): The maximum time a request waits for other requests, in seconds
+        _requests (deque[tuple[Any, Future, float]]): The pending requests, with their futures and submission times
+        _condition (threading.Condition): Condition to wait for requests
+        _closed (bool): Whether the scheduler is closed or not
+        _thread (threading.Thread): The thread that processes the batches
+    """
+
+    def __init__(
+            self,
+            process_batch: Callable[[list], list],
+            max_batch_size: int = 8,
+            max_wait: float = 0.01,
+            name: str = 'batch_scheduler'
+    ):
+        self._process_batch: Callable[[list], list] = process_batch
+        self._max_batch_size: int = max(max_batch_size, 1)
+        self._max_wait: float = max_wait
+        self._requests: deque[tuple[Any, Future, float]] = deque()
+        self._condition: threading.Condition = threading.Condition()
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, request: Any) -> Future:
+        """Submit a request.
+
+        Args:
+            request (Any): the request
+
+        Returns:
+            Future: the future result of the request
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The batch scheduler is closed')
+            self._requests.append((request, future, time.monotonic()))
+            self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Close the scheduler. The pending requests are processed before its thread finishes."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _next_batch(self) -> list[tuple[Any, Future, float]]:
+        """Wait for the next batch of requests.
+
+        Returns:
+            list[tuple[Any, Future, float]]: the requests (empty if the scheduler is closed)
+        """
+        with self._condition:
+            while not self._requests:
+                if self._closed:
+                    return []
+                self._condition.wait()
+            # Wait for more requests, until the batch is full or the first request has waited long enough
+            deadline = self._requests[0][2] + self._max_wait
+            while len(self._requests) < self._max_batch_size and not self._closed:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                self._condition.wait(timeout)
+            count = min(len(self._requests), self._max_batch_size)
+            return [self._requests.popleft() for _ in range(count)]
+
+    def _run(self) -> None:
+        """Process the batches of requests until the scheduler is closed."""
+        while batch := self._next_batch():
+            batch = [(request, future) for request, future, _ in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                results = self._process_batch([request for request, _ in batch])
+            except Exception as e:
+                logging.error(f'Batch of {len(batch)} requests failed: {e}')
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
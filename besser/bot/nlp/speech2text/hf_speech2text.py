@@ -1,11 +1,13 @@
-import io
-from typing import TYPE_CHECKING
+from concurrent.futures import Executor, Future
+from typing import Iterator, TYPE_CHECKING
 
-import librosa
+import numpy as np
 from transformers import AutoProcessor, TFAutoModelForSpeechSeq2Seq, logging
 
 from besser.bot import nlp
-from besser.bot.nlp.speech2text.speech2text import Speech2Text
+from besser.bot.nlp.speech2text.audio import decode_windows
+from besser.bot.nlp.speech2text.batch_scheduler import BatchScheduler
+from besser.bot.nlp.speech2text.speech2text import Speech2Text, merge_overlap
 
 if TYPE_CHECKING:
     from besser.bot.nlp.nlp_engine import NLPEngine
@@ -18,6 +20,15 @@ class HFSpeech2Text(Speech2Text):
 
     It loads a Speech2Text Hugging Face model to perform the Speech2Text task.
 
+    The audios to transcribe are micro-batched: the ones received at the same time (e.g. voice messages from different
+    users) are padded into a single batch and transcribed in a single model inference (see
+    :obj:`~besser.bot.nlp.NLP_STT_HF_MAX_BATCH_SIZE` and :obj:`~besser.bot.nlp.NLP_STT_HF_MAX_BATCH_WAIT`).
+
+    Long audios are split into overlapping windows (see :obj:`~besser.bot.nlp.NLP_STT_HF_WINDOW_LENGTH` and
+    :obj:`~besser.bot.nlp.NLP_STT_HF_WINDOW_OVERLAP`), which are decoded and submitted to the batches one by one, and
+    their transcriptions are merged removing the words repeated in the overlaps. This way, a long audio never delays the
+    short ones received at the same time, and only a couple of its windows are decoded in memory.
+
     .. warning::
 
         Only tested with ``openai/whisper-*`` models
@@ -32,6 +43,10 @@ class HFSpeech2Text(Speech2Text):
         _sampling_rate (int): the sampling rate of audio data, it must coincide with the sampling rate used to train the
             model
         _forced_decoder_ids (list): the decoder ids
+        _max_batch_size (int): the maximum number of audio windows transcribed in a single model inference
+        _window_length (float): the length of the audio windows, in seconds
+        _window_overlap (float): the overlap between consecutive audio windows, in seconds
+        _scheduler (BatchScheduler): the scheduler that groups the audios to transcribe into batches
     """
 
     def __init__(self, nlp_engine: 'NLPEngine'):
@@ -46,11 +61,126 @@ class HFSpeech2Text(Speech2Text):
         self._forced_decoder_ids = self._processor.get_decoder_prompt_ids(
             language=self._nlp_engine.get_property(nlp.NLP_LANGUAGE), task="transcribe"
         )
+        self._max_batch_size: int = self._nlp_engine.get_property(nlp.NLP_STT_HF_MAX_BATCH_SIZE)
+        self._window_length: float = self._nlp_engine.get_property(nlp.NLP_STT_HF_WINDOW_LENGTH)
+        self._window_overlap: float = self._nlp_engine.get_property(nlp.NLP_STT_HF_WINDOW_OVERLAP)
+        if not 0 <= self._window_overlap < self._window_length:
+            raise ValueError('The speech-to-text window overlap must be shorter than the window length')
+        self._scheduler: BatchScheduler = BatchScheduler(
+            self.speech2text_batch,
+            max_batch_size=self._max_batch_size,
+            max_wait=self._nlp_engine.get_property(nlp.NLP_STT_HF_MAX_BATCH_WAIT),
+            name=f'{self._model_name}_scheduler'
+        )
 
     def speech2text(self, speech: bytes):
-        wav_stream = io.BytesIO(speech)
-        audio, sampling_rate = librosa.load(wav_stream, sr=self._sampling_rate)
-        input_features = self._processor(audio, sampling_rate=self._sampling_rate, return_tensors="tf").input_features
+        return ' '.join(self.speech2text_stream(speech))
+
+    def speech2text_stream(self, speech: bytes) -> Iterator[str]:
+        """Transcribe a voice audio window by window, yielding the transcription of each window (without the words
+        repeated from the previous window).
+
+        Only the window being transcribed and the next one are decoded in memory at the same time.
+
+        Args:
+            speech (bytes): the recorded voice that wants to be transcribed
+
+        Returns:
+            Iterator[str]: the transcriptions of the audio windows
+        """
+        previous: str = None
+        pending: Future = None
+        for window in self._decode_windows(speech):
+            # The next window is decoded while the previous one is transcribed
+            future = self._scheduler.submit(window)
+            if pending is not None:
+                text, previous = self._merge_window(pending.result(), previous)
+                if text:
+                    yield text
+            pending = future
+        if pending is not None:
+            text, previous = self._merge_window(pending.result(), previous)
+            if text:
+                yield text
+
+    @staticmethod
+    def _merge_window(transcription: str, previous: str or None) -> tuple[str, str]:
+        """Merge the transcription of an audio window with the transcription of the previous window.
+
+        Args:
+            transcription (str): the transcription of the window
+            previous (str or None): the transcription of the previous window, if any
+
+        Returns:
+            tuple[str, str]: the words of the transcription that are not repeated from the previous window, and the
+            transcription itself
+        """
+        if previous is None:
+            return transcription.strip(), transcription
+        return merge_overlap(previous, transcription), transcription
+
+    def submit(self, speech: bytes | np.ndarray, executor: Executor = None) -> Future:
+        """Submit a voice audio to be transcribed, without waiting for the transcription.
+
+        An already decoded audio window is submitted to the next batch. An audio is decoded window by window in the
+        executor (or in the calling thread if there is none), submitting each window to the batches (see
+        :meth:`speech2text_stream`), so the decoding never runs in the scheduler thread.
+
+        Args:
+            speech (bytes or np.ndarray): the recorded voice that wants to be transcribed, or an already decoded audio
+                window (sampled at the model sampling rate)
+            executor (Executor or None): the executor where the audio is decoded
+
+        Returns:
+            Future: the future speech transcription
+        """
+        if isinstance(speech, np.ndarray):
+            return self._scheduler.submit(speech)
+        if executor is not None:
+            return executor.submit(self.speech2text, speech)
+        future = Future()
+        try:
+            future.set_result(self.speech2text(speech))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _decode_windows(self, speech: bytes) -> Iterator[np.ndarray]:
+        """Decode an audio in overlapping windows, resampled to the model sampling rate (see
+        :func:`~besser.bot.nlp.speech2text.audio.decode_windows`).
+
+        Args:
+            speech (bytes): the recorded voice
+
+        Returns:
+            Iterator[np.ndarray]: the audio windows (mono)
+        """
+        return decode_windows(speech, self._sampling_rate, self._window_length, self._window_overlap)
+
+    def speech2text_batch(self, windows: list[np.ndarray]) -> list[str]:
+        """Transcribe a batch of audio windows (of the same or different audios), run by the batch scheduler.
+
+        Args:
+            windows (list[np.ndarray]): the audio windows, sampled at the model sampling rate
+
+        Returns:
+            list[str]: the transcriptions of the windows
+        """
+        transcriptions = []
+        for start in range(0, len(windows), self._max_batch_size):
+            transcriptions.extend(self._transcribe(windows[start:start + self._max_batch_size]))
+        return transcriptions
+
+    def _transcribe(self, windows: list[np.ndarray]) -> list[str]:
+        """Transcribe a batch of audio windows in a single model inference.
+
+        Args:
+            windows (list[np.ndarray]): the audio windows, sampled at the model sampling rate
+
+        Returns:
+            list[str]: the transcriptions of the windows
+        """
+        # The processor pads all the audio windows to the model input length
+        input_features = self._processor(windows, sampling_rate=self._sampling_rate, return_tensors="tf").input_features
         predicted_ids = self._model.generate(input_features, forced_decoder_ids=self._forced_decoder_ids)
-        transcriptions = self._processor.batch_decode(predicted_ids, skip_special_tokens=True)
-        return transcriptions[0]
+        return self._processor.batch_decode(predicted_ids, skip_special_tokens=True)
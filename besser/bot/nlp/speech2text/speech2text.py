@@ -1,10 +1,45 @@
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from concurrent.futures import Executor, Future
+from typing import Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from besser.bot.nlp.nlp_engine import NLPEngine
 
 
+def _normalize_words(text: str) -> list[str]:
+    """Split a text into words, lowercased and without punctuation, to compare them.
+
+    Args:
+        text (str): the text
+
+    Returns:
+        list[str]: the normalized words
+    """
+    return [re.sub(r'[^\w]', '', word.lower()) for word in text.split()]
+
+
+def merge_overlap(previous: str, text: str, max_words: int = 20) -> str:
+    """Remove from the beginning of a transcription the words that are repeated from the end of the previous one (e.g.
+    when both are the transcriptions of overlapping audio windows).
+
+    Args:
+        previous (str): the previous transcription
+        text (str): the transcription to merge
+        max_words (int): the maximum number of repeated words to look for
+
+    Returns:
+        str: the words of the transcription that are not repeated
+    """
+    previous_words = _normalize_words(previous)
+    normalized_words = _normalize_words(text)
+    words = text.split()
+    for length in range(min(max_words, len(previous_words), len(words)), 0, -1):
+        if previous_words[-length:] == normalized_words[:length]:
+            return ' '.join(words[length:])
+    return ' '.join(words)
+
+
 class Speech2Text(ABC):
     """The Speech2Text abstract class.
 
@@ -35,3 +70,33 @@ class Speech2Text(ABC):
             str: the speech transcription
         """
         pass
+
+    def speech2text_stream(self, speech: bytes) -> Iterator[str]:
+        """Transcribe a voice audio incrementally, yielding the transcription in parts as it is generated (e.g. a part
+        for each audio window of a long audio).
+
+        By default, the whole transcription is yielded at once. Speech2Text implementations that can transcribe
+        incrementally override this method.
+
+        Args:
+            speech (bytes): the recorded voice that wants to be transcribed
+
+        Returns:
+            Iterator[str]: the parts of the speech transcription
+        """
+        yield self.speech2text(speech)
+
+    def submit(self, speech: bytes, executor: Executor) -> Future:
+        """Submit a voice audio to be transcribed, without waiting for the transcription.
+
+        By default, the transcription runs in the given executor. Speech2Text implementations that schedule their
+        transcriptions (e.g. in batches) override this method.
+
+        Args:
+            speech (bytes): the recorded voice that wants to be transcribed
+            executor (Executor): the executor where the blocking work can run
+
+        Returns:
+            Future: the future speech transcription
+        """
+        return executor.submit(self.speech2text, speech)
@@ -0,0 +1,125 @@
+"""Fast encoding and decoding of :class:`~besser.bot.platforms.payload.Payload` objects.
+
+If `orjson <https://github.com/ijl/orjson>`_ is installed, it is used to serialize and parse JSON. Otherwise, the
+standard library :mod:`json` module is used. The objects orjson cannot serialize (e.g. integers larger than 64 bits)
+are serialized with :mod:`json`. Datetimes and dataclasses, which orjson could serialize, are also left to :mod:`json`
+(which rejects them), so they fail whether orjson is installed or not.
+
+The remaining differences when orjson is installed: NaN and infinite floats are serialized as ``null`` (valid JSON)
+instead of the non-standard ``NaN`` and ``Infinity``, and numpy values, UUIDs and enums are serialized instead of
+raising a :class:`TypeError`.
+"""
+
+import json
+
+from besser.bot.platforms.payload import PAYLOAD_ACTIONS, Payload
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    # Like json, accept non-str dict keys (e.g. integers) and reject datetimes and dataclasses. Also accept numpy values
+    # (e.g. in plots and dataframes)
+    orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | \
+        orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(obj) -> str:
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: the object to serialize
+
+        Returns:
+            str: the JSON string
+        """
+        try:
+            return orjson.dumps(obj, option=orjson_options).decode('utf-8')
+        except TypeError:
+            return json.dumps(obj)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize an object to a JSON string, encoded in UTF-8.
+
+        Args:
+            obj: the object to serialize
+
+        Returns:
+            bytes: the JSON string
+        """
+        try:
+            return orjson.dumps(obj, option=orjson_options)
+        except TypeError:
+            return json.dumps(obj).encode('utf-8')
+
+    loads = orjson.loads
+else:
+    def dumps(obj) -> str:
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: the object to serialize
+
+        Returns:
+            str: the JSON string
+        """
+        return json.dumps(obj)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize an object to a JSON string, encoded in UTF-8.
+
+        Args:
+            obj: the object to serialize
+
+        Returns:
+            bytes: the JSON string
+        """
+        return json.dumps(obj).encode('utf-8')
+
+    loads = json.loads
+
+
+def encode_payload(payload: Payload) -> str:
+    """Encode a payload into a JSON string.
+
+    Args:
+        payload (Payload): the payload
+
+    Returns:
+        str: the JSON payload string
+    """
+    return dumps({'action': payload.action, 'message': payload.message})
+
+
+def decode_payload(payload: str | bytes | dict) -> Payload or None:
+    """Decode a JSON payload string (or an already parsed payload dictionary) into a :class:`Payload` object.
+
+    Args:
+        payload (str or bytes or dict): the JSON payload string, or the payload dictionary
+
+    Returns:
+        Payload or None: the Payload object, or None if its action is unknown
+    """
+    payload_dict = payload if isinstance(payload, dict) else loads(payload)
+    action = PAYLOAD_ACTIONS.get(payload_dict['action'])
+    if action is None:
+        return None
+    return Payload(action, payload_dict['message'])
+
+
+def decode_payloads(payload_str: str | bytes) -> list[Payload]:
+    """Decode a WebSocket message containing a JSON payload or a JSON array of payloads (see
+    :obj:`~besser.bot.platforms.websocket.WEBSOCKET_MAX_BATCH_SIZE`).
+
+    Args:
+        payload_str (str or bytes): the WebSocket message
+
+    Returns:
+        list[Payload]: the payloads (the payloads with unknown actions are discarded)
+    """
+    payloads = loads(payload_str)
+    if not isinstance(payloads, list):
+        payloads = [payloads]
+    return [payload for payload in map(decode_payload, payloads) if payload is not None]
@@ -20,6 +20,32 @@ class PayloadAction(Enum):
     bot.
     """
 
+    USER_FILE_UPLOAD_BEGIN = 'user_file_upload_begin'
+    """PayloadAction: Indicates that the payload's purpose is to begin a chunked file upload. The message is a
+    dictionary containing the upload id, the file name and type and, optionally, the file size (in bytes).
+    """
+
+    USER_FILE_UPLOAD_CHUNK = 'user_file_upload_chunk'
+    """PayloadAction: Indicates that the payload's purpose is to send a chunk of a file upload. The message is a
+    dictionary containing the upload id and the chunk sequence number. The chunk data is sent in a binary frame (or as
+    a base64 string in the message, in the `data` key).
+    """
+
+    USER_FILE_UPLOAD_END = 'user_file_upload_end'
+    """PayloadAction: Indicates that the payload's purpose is to end a chunked file upload. The message is a dictionary
+    containing the upload id and, optionally, the SHA-256 hex digest of the file (in the `checksum` key).
+    """
+
+    FILE_UPLOAD_ERROR = 'file_upload_error'
+    """PayloadAction: Indicates that the payload's purpose is to notify the client that a chunked file upload failed.
+    The message is a dictionary containing the upload id and the error.
+    """
+
+    SESSION_TOKEN = 'session_token'
+    """PayloadAction: Indicates that the payload's purpose is to send the token a client can use to resume its session
+    after a reconnection.
+    """
+
     BOT_REPLY_STR = 'bot_reply_str'
     """PayloadAction: Indicates that the payload's purpose is to send a bot reply containing a :class:`str` object."""
 
@@ -49,6 +75,21 @@ class PayloadAction(Enum):
     :class:`plotly.graph_objs.Figure` object.
     """
 
+    BOT_REPLY_STREAM_START = 'bot_reply_stream_start'
+    """PayloadAction: Indicates that the payload's purpose is to start a streamed bot reply, i.e. a text message sent in
+    chunks as it is generated. The message is a dictionary containing the stream id.
+    """
+
+    BOT_REPLY_STREAM_CHUNK = 'bot_reply_stream_chunk'
+    """PayloadAction: Indicates that the payload's purpose is to send a chunk of a streamed bot reply. The message is a
+    dictionary containing the stream id and the text chunk.
+    """
+
+    BOT_REPLY_STREAM_END = 'bot_reply_stream_end'
+    """PayloadAction: Indicates that the payload's purpose is to finish a streamed bot reply. The message is a
+    dictionary containing the stream id.
+    """
+
     BOT_REPLY_OPTIONS = 'bot_reply_options'
     """PayloadAction: Indicates that the payload's purpose is to send a bot reply containing a list of strings, where 
     the user should select 1 of them.
@@ -66,6 +107,10 @@ class PayloadAction(Enum):
     """
 
 
+PAYLOAD_ACTIONS: dict[str, PayloadAction] = {action.value: action for action in PayloadAction}
+"""dict[str, PayloadAction]: The payload actions, indexed by their value."""
+
+
 class Payload:
     """Represents a payload object used for encoding and decoding messages between a bot and any other external agent.
     """
@@ -75,19 +120,18 @@ class Payload:
         """Decode a JSON payload string into a :class:`Payload` object.
 
         Args:
-            payload_str (str or dict): A JSON-encoded payload string.
+            payload_str (str or bytes or dict): A JSON-encoded payload string (or an already parsed payload
+                dictionary).
 
         Returns:
             Payload or None: A Payload object if the decoding is successful,
             None otherwise.
         """
-        payload_dict = json.loads(payload_str)
-        payload_action = payload_dict['action']
-        payload_message = payload_dict['message']
-        for action in PayloadAction:
-            if action.value == payload_action:
-                return Payload(action, payload_message)
-        return None
+        payload_dict = payload_str if isinstance(payload_str, dict) else json.loads(payload_str)
+        action = PAYLOAD_ACTIONS.get(payload_dict['action'])
+        if action is None:
+            return None
+        return Payload(action, payload_dict['message'])
 
     def __init__(self, action: PayloadAction, message: str or dict = None):
         self.action: str = action.value
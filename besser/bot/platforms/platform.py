@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 from besser.bot.platforms.payload import Payload
 
@@ -61,3 +61,20 @@ class Platform(ABC):
             message (str): the message to send to the user
         """
         pass
+
+    def reply_stream(self, session: 'Session', stream: Iterable[str]) -> str:
+        """Send a bot reply, i.e. a text message, to a specific user, as a stream of text chunks (e.g. the tokens
+        generated by an LLM, see :meth:`~besser.bot.nlp.llm.llm.LLM.predict_stream`).
+
+        Platforms that do not support streaming wait for the whole message and send it as a regular reply.
+
+        Args:
+            session (Session): the user session
+            stream (Iterable[str]): the message chunks to send to the user
+
+        Returns:
+            str: the whole message
+        """
+        message = ''.join(stream)
+        self.reply(session, message)
+        return message
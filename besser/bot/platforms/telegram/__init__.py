@@ -12,3 +12,39 @@ type: ``str``
 
 default value: ``None``
 """
+
+TELEGRAM_GLOBAL_RATE_LIMIT = Property(SECTION_TELEGRAM, 'telegram.global_rate_limit', float, 30.0)
+"""
+The maximum number of messages the bot sends to Telegram per second, for all the chats (Telegram limits bots to about
+30 messages per second). :obj:`None` disables the limit.
+
+name: ``telegram.global_rate_limit``
+
+type: ``float``
+
+default value: ``30.0``
+"""
+
+TELEGRAM_CHAT_RATE_LIMIT = Property(SECTION_TELEGRAM, 'telegram.chat_rate_limit', float, None)
+"""
+The maximum number of messages the bot sends to each chat per second (Telegram recommends about 1 message per second
+in a chat, and limits groups to 20 messages per minute). :obj:`None` disables the limit.
+
+name: ``telegram.chat_rate_limit``
+
+type: ``float``
+
+default value: ``None``
+"""
+
+TELEGRAM_MAX_RETRIES = Property(SECTION_TELEGRAM, 'telegram.max_retries', int, 3)
+"""
+The maximum number of times a message is sent again when Telegram answers that the rate limit was exceeded (after
+waiting the time Telegram asks for).
+
+name: ``telegram.max_retries``
+
+type: ``int``
+
+default value: ``3``
+"""
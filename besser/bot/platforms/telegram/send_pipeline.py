@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from telegram.error import RetryAfter
+
+
+class SendPipeline:
+    """The pipeline of requests (messages, files...) sent to Telegram by a bot.
+
+    The requests are submitted from any thread without waiting for them to be sent. They are sent by the event loop
+    of the Telegram Application, in order for each chat (the requests to different chats are sent concurrently). The
+    pending requests of a chat are sent in a single task, one after another, as soon as the rate limits allow it.
+
+    The requests are paced to respect the Telegram rate limits (a global one, and an optional one for each chat). If
+    Telegram still answers that the limit was exceeded, the request is retried after the time it asks to wait.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): the event loop that sends the requests
+        global_rate_limit (float or None): the maximum number of requests sent per second, for all the chats.
+            :obj:`None` disables the limit
+        chat_rate_limit (float or None): the maximum number of requests sent per second to each chat. :obj:`None`
+            disables the limit
+        max_retries (int): the maximum number of times a request is retried when Telegram's rate limit is exceeded
+
+    Attributes:
+        _loop (asyncio.AbstractEventLoop): The event loop that sends the requests
+        _global_interval (float): The minimum time between 2 requests, in seconds
+        _chat_interval (float): The minimum time between 2 requests to the same chat, in seconds
+        _max_retries (int): The maximum number of times a request is retried
+        _queues (dict[str, deque[tuple[Callable[[], Awaitable], Future]]]): The pending requests of each chat (only
+            the chats with a running sender task)
+        _next_global_slot (float): The earliest time (from :func:`time.monotonic`) the next request can be sent
+        _next_chat_slots (dict[str, float]): The earliest time the next request to each chat can be sent
+    """
+
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            global_rate_limit: float = None,
+            chat_rate_limit: float = None,
+            max_retries: int = 3
+    ):
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._global_interval: float = 1 / global_rate_limit if global_rate_limit else 0
+        self._chat_interval: float = 1 / chat_rate_limit if chat_rate_limit else 0
+        self._max_retries: int = max_retries
+        self._queues: dict[str, deque[tuple[Callable[[], Awaitable], Future]]] = {}
+        self._next_global_slot: float = 0
+        self._next_chat_slots: dict[str, float] = {}
+
+    def submit(self, chat_id: str, request: Callable[[], Awaitable]) -> Future:
+        """Submit a request to be sent to a chat. It can be called from any thread.
+
+        Args:
+            chat_id (str): the chat id
+            request (Callable[[], Awaitable]): the function that creates the request coroutine (it may be called more
+                than once, if the request is retried)
+
+        Returns:
+            Future: the future result of the request
+        """
+        future = Future()
+        self._loop.call_soon_threadsafe(self._enqueue, str(chat_id), request, future)
+        return future
+
+    def _enqueue(self, chat_id: str, request: Callable[[], Awaitable], future: Future) -> None:
+        """Add a request to the queue of a chat, starting its sender task if it is not running. It runs in the event
+        loop.
+
+        Args:
+            chat_id (str): the chat id
+            request (Callable[[], Awaitable]): the function that creates the request coroutine
+            future (Future): the future result of the request
+        """
+        queue = self._queues.get(chat_id)
+        if queue is None:
+            queue = self._queues[chat_id] = deque()
+            self._loop.create_task(self._send_all(chat_id, queue))
+        queue.append((request, future))
+
+    async def _send_all(self, chat_id: str, queue: deque[tuple[Callable[[], Awaitable], Future]]) -> None:
+        """Send the pending requests of a chat, in order, until its queue is empty.
+
+        Args:
+            chat_id (str): the chat id
+            queue (deque[tuple[Callable[[], Awaitable], Future]]): the pending requests of the chat
+        """
+        while queue:
+            request, future = queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = await self._send(chat_id, request)
+            except Exception as e:
+                logging.error(f'The request to the Telegram chat {chat_id} failed: {e}')
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        del self._queues[chat_id]
+        if self._next_chat_slots.get(chat_id, 0) <= time.monotonic():
+            self._next_chat_slots.pop(chat_id, None)
+
+    async def _send(self, chat_id: str, request: Callable[[], Awaitable]) -> Any:
+        """Send a request when the rate limits allow it, retrying it if Telegram asks to.
+
+        Args:
+            chat_id (str): the chat id
+            request (Callable[[], Awaitable]): the function that creates the request coroutine
+
+        Returns:
+            Any: the request result
+        """
+        retries = 0
+        while True:
+            await self._wait_slot(chat_id)
+            try:
+                return await request()
+            except RetryAfter as e:
+                if retries >= self._max_retries:
+                    raise
+                retries += 1
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logging.warning(f'Telegram rate limit exceeded, retrying in {retry_after} seconds')
+                self._next_global_slot = max(self._next_global_slot, time.monotonic() + retry_after)
+
+    async def _wait_slot(self, chat_id: str) -> None:
+        """Wait until the rate limits allow sending a request to a chat, and reserve the slot.
+
+        Args:
+            chat_id (str): the chat id
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_global_slot, self._next_chat_slots.get(chat_id, 0))
+        self._next_global_slot = max(self._next_global_slot, slot) + self._global_interval
+        if self._chat_interval:
+            self._next_chat_slots[chat_id] = slot + self._chat_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -4,7 +4,7 @@ import logging
 import threading
 from concurrent.futures import Future
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 from telegram import Update
 from telegram.ext import Application, ApplicationBuilder, BaseHandler, CommandHandler, ContextTypes, MessageHandler, \
@@ -12,11 +12,12 @@ from telegram.ext import Application, ApplicationBuilder, BaseHandler, CommandHa
 
 from besser.bot.core.message import Message, MessageType
 from besser.bot.core.session import Session
-from besser.bot.core.file import File
+from besser.bot.core.file import File, create_spool_path
 from besser.bot.exceptions.exceptions import PlatformMismatchError
 from besser.bot.platforms import telegram
 from besser.bot.platforms.payload import Payload, PayloadAction
 from besser.bot.platforms.platform import Platform
+from besser.bot.platforms.telegram.send_pipeline import SendPipeline
 
 if TYPE_CHECKING:
     from besser.bot.core.bot import Bot
@@ -49,6 +50,8 @@ class TelegramPlatform(Platform):
         _telegram_app (telegram.ext.Application): The Telegram Application
         _event_loop (asyncio.AbstractEventLoop): The event loop that runs the asynchronous tasks of the Telegram
             Application
+        _send_pipeline (SendPipeline): The pipeline that sends the bot replies without blocking the bot, in order for
+            each chat
         _handlers (list[telegram.ext.BaseHandler]): List of telegram bot handlers
     """
     def __init__(self, bot: 'Bot'):
@@ -56,6 +59,7 @@ class TelegramPlatform(Platform):
         self._bot: 'Bot' = bot
         self._telegram_app: Application = None
         self._event_loop: asyncio.AbstractEventLoop = None
+        self._send_pipeline: SendPipeline = None
         self._handlers: list[BaseHandler] = []
 
         # Handler for text messages
@@ -82,7 +86,8 @@ class TelegramPlatform(Platform):
             session = await asyncio.to_thread(self._bot.get_or_create_session, session_id, self)
             voice_file = await context.bot.get_file(update.message.voice.file_id)
             voice_data = await voice_file.download_as_bytearray()
-            text = self._bot.nlp_engine.speech2text(bytes(voice_data))
+            # The transcription runs in the NLPEngine's thread pool, so other chats are not blocked
+            text = await self._bot.nlp_engine.speech2text_async(bytes(voice_data))
             await asyncio.to_thread(self._bot.receive_message, session.id, text)
 
         voice_handler = MessageHandler(filters.VOICE, voice, block=False)
@@ -93,11 +98,12 @@ class TelegramPlatform(Platform):
             session_id = str(update.effective_chat.id)
             session = await asyncio.to_thread(self._bot.get_or_create_session, session_id, self)
             file_object = await context.bot.get_file(update.message.document.file_id)
-            file_data = await file_object.download_as_bytearray()
-            base64_data = base64.b64encode(file_data).decode()
+            # The document is downloaded to disk, so it is not kept in memory
+            file_path = create_spool_path()
+            await file_object.download_to_drive(file_path)
             f = File(
                 file_name=update.message.document.file_name, file_type=update.message.document.mime_type,
-                file_base64=base64_data
+                file_path=file_path, temporary=True
             )
             await asyncio.to_thread(self._bot.receive_file, session.id, file=f)
 
@@ -110,10 +116,9 @@ class TelegramPlatform(Platform):
             session = await asyncio.to_thread(self._bot.get_or_create_session, session_id, self)
             image_object = await context.bot.get_file(update.message.photo[-1].file_id)
             image_data = await image_object.download_as_bytearray()
-            base64_data = base64.b64encode(image_data).decode()
             f = File(
                 file_name=update.message.photo[-1].file_id + ".jpg", file_type="image/jpeg",
-                file_base64=base64_data
+                file_data=bytes(image_data)
             )
             await asyncio.to_thread(self._bot.receive_file, session.id, file=f)
 
@@ -124,14 +129,32 @@ class TelegramPlatform(Platform):
         """All methods in :class:`telegram.ext._extbot.ExtBot` (that extends :class:`telegram._bot.Bot`) can be used
         from the TelegramPlatform.
 
+        The ``send_*`` methods (e.g. ``send_audio``) are sent through the send pipeline, without waiting for them to be
+        sent: they return a :class:`~concurrent.futures.Future`, unless they are called with ``wait=True``. The other
+        methods wait for their result, unless they are called with ``wait=False``.
+
         Args:
             name (str): the name of the function to call
         """
-        def method_proxy(*args, **kwargs):
+        def method_proxy(*args, wait: bool = None, **kwargs):
             # Forward the method call to the (telegram) bot
             method = getattr(self._telegram_app.bot, name, None)
             if method:
-                future = asyncio.run_coroutine_threadsafe(method(*args, **kwargs), self._event_loop)
+                if name.startswith('send_'):
+                    # Messages go through the send pipeline, so they keep their order with the bot replies
+                    if 'chat_id' in kwargs:
+                        chat_id = kwargs['chat_id']
+                    elif args:
+                        chat_id = args[0]
+                    else:
+                        raise TypeError(f"{name}() missing required argument: 'chat_id'")
+                    future = self._send_pipeline.submit(chat_id, lambda: method(*args, **kwargs))
+                    if not wait:
+                        return future
+                else:
+                    future = asyncio.run_coroutine_threadsafe(method(*args, **kwargs), self._event_loop)
+                    if wait is False:
+                        return future
                 _wait_future(future)
                 return future.result()
             else:
@@ -151,6 +174,12 @@ class TelegramPlatform(Platform):
         self._telegram_app.add_handlers(self._handlers)
         self._event_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._event_loop)
+        self._send_pipeline = SendPipeline(
+            self._event_loop,
+            global_rate_limit=self._bot.get_property(telegram.TELEGRAM_GLOBAL_RATE_LIMIT),
+            chat_rate_limit=self._bot.get_property(telegram.TELEGRAM_CHAT_RATE_LIMIT),
+            max_retries=self._bot.get_property(telegram.TELEGRAM_MAX_RETRIES)
+        )
 
     def start(self) -> None:
         logging.info(f'{self._bot.name}\'s TelegramPlatform starting')
@@ -162,105 +191,140 @@ class TelegramPlatform(Platform):
         self.running = False
         logging.info(f'{self._bot.name}\'s TelegramPlatform stopped')
 
-    def _send(self, session_id: str, payload: Payload) -> None:
+    def _send(self, session_id: str, payload: Payload, data: bytes = None, wait: bool = False) -> Future | Any:
+        """Send a payload to a user, through the send pipeline.
+
+        Args:
+            session_id (str): the session id (i.e. the Telegram chat id)
+            payload (Payload): the payload to send
+            data (bytes, optional): the file (or image) data, if the payload contains one
+            wait (bool): whether to wait until the payload is sent or not
+
+        Returns:
+            Future or Any: if wait is True, the sent Telegram message. Otherwise, its future
+        """
         session = self._bot.get_or_create_session(session_id=session_id, platform=self)
         payload.message = self._bot.process(is_user_message=False, session=session, message=payload.message)
+        bot = self._telegram_app.bot
         if payload.action == PayloadAction.BOT_REPLY_STR.value:
-            future = asyncio.run_coroutine_threadsafe(
-                self._telegram_app.bot.send_message(
+            def request():
+                return bot.send_message(
                     chat_id=session_id,
                     text=payload.message
-                ),
-                self._event_loop
-            )
+                )
         elif payload.action == PayloadAction.BOT_REPLY_FILE.value:
-            future = asyncio.run_coroutine_threadsafe(
-                self._telegram_app.bot.send_document(
+            document = data if data is not None else base64.b64decode(payload.message["base64"])
+
+            def request():
+                return bot.send_document(
                     chat_id=session_id,
-                    document=base64.b64decode(payload.message["base64"]),
+                    document=document,
                     filename=payload.message["name"],
                     caption=payload.message["caption"]
-                ),
-                self._event_loop
-            )
+                )
         elif payload.action == PayloadAction.BOT_REPLY_IMAGE.value:
-            future = asyncio.run_coroutine_threadsafe(
-                self._telegram_app.bot.send_photo(
+            photo = data if data is not None else base64.b64decode(payload.message["base64"])
+
+            def request():
+                return bot.send_photo(
                     chat_id=session_id,
-                    photo=base64.b64decode(payload.message["base64"]),
+                    photo=photo,
                     caption=payload.message["caption"]
-                ),
-                self._event_loop
-            )
+                )
         elif payload.action == PayloadAction.BOT_REPLY_LOCATION.value:
-            future = asyncio.run_coroutine_threadsafe(
-                self._telegram_app.bot.send_location(
+            def request():
+                return bot.send_location(
                     chat_id=session_id,
                     latitude=payload.message['latitude'],
                     longitude=payload.message['longitude'],
-                ),
-                self._event_loop
-            )
+                )
         else:
-            future = None
-        if future is not None:
+            return None
+        future = self._send_pipeline.submit(session_id, request)
+        if wait:
             _wait_future(future)
+            return future.result()
+        return future
+
+    def reply(self, session: Session, message: str, wait: bool = False) -> Future | Any:
+        """Send a text reply to a specific user.
+
+        Args:
+            session (Session): the user session
+            message (str): the message to send
+            wait (bool): whether to wait until the message is sent or not
 
-    def reply(self, session: Session, message: str) -> None:
+        Returns:
+            Future or Any: if wait is True, the sent Telegram message. Otherwise, its future
+        """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
         session.save_message(Message(t=MessageType.STR, content=message, is_user=False, timestamp=datetime.now()))
         payload = Payload(action=PayloadAction.BOT_REPLY_STR,
                           message=message)
-        self._send(session.id, payload)
+        return self._send(session.id, payload, wait=wait)
 
-    def reply_file(self, session: Session, file: File, message: str = None) -> None:
+    def reply_file(self, session: Session, file: File, message: str = None, wait: bool = False) -> Future | Any:
         """Send a file reply to a specific user
 
         Args:
             session (Session): the user session
             file (File): the file to send
             message (str, optional): message to be attached to file, 1024 char limit
+            wait (bool): whether to wait until the file is sent or not
+
+        Returns:
+            Future or Any: if wait is True, the sent Telegram message. Otherwise, its future
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
-        session.save_message(Message(t=MessageType.FILE, content=file.get_json_string(), is_user=False, timestamp=datetime.now()))
-        file_dict = file.to_dict()
+        session.save_message(Message(t=MessageType.FILE, content=file.get_json_string, is_user=False, timestamp=datetime.now()))
+        # The file is sent as raw bytes, so its base64 representation is not needed in the payload
+        file_dict = {'name': file.name, 'type': file.type}
         if message:
             file_dict["caption"] = message
         else:
             file_dict["caption"] = ""
         payload = Payload(action=PayloadAction.BOT_REPLY_FILE,
                           message=file_dict)
-        self._send(session.id, payload)
+        return self._send(session.id, payload, data=file.data, wait=wait)
 
-    def reply_image(self, session: Session, file: File, message: str = None) -> None:
+    def reply_image(self, session: Session, file: File, message: str = None, wait: bool = False) -> Future | Any:
         """Send an image reply to a specific user
 
         Args:
             session (Session): the user session
             file (File): the file to send (the image)
             message (str, optional): message to be attached to file, 1024 char limit
+            wait (bool): whether to wait until the image is sent or not
+
+        Returns:
+            Future or Any: if wait is True, the sent Telegram message. Otherwise, its future
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
-        session.save_message(Message(t=MessageType.IMAGE, content=file.get_json_string(), is_user=False, timestamp=datetime.now()))
-        file_dict = file.to_dict()
+        session.save_message(Message(t=MessageType.IMAGE, content=file.get_json_string, is_user=False, timestamp=datetime.now()))
+        # The file is sent as raw bytes, so its base64 representation is not needed in the payload
+        file_dict = {'name': file.name, 'type': file.type}
         if message:
             file_dict["caption"] = message
         else:
             file_dict["caption"] = ""
         payload = Payload(action=PayloadAction.BOT_REPLY_IMAGE,
                           message=file_dict)
-        self._send(session.id, payload)
+        return self._send(session.id, payload, data=file.data, wait=wait)
 
-    def reply_location(self, session: Session, latitude: float, longitude: float) -> None:
+    def reply_location(self, session: Session, latitude: float, longitude: float, wait: bool = False) -> Future | Any:
         """Send a location reply to a specific user.
 
         Args:
             session (Session): the user session
             latitude (str): the latitude of the location
             longitude (str): the longitude of the location
+            wait (bool): whether to wait until the location is sent or not
+
+        Returns:
+            Future or Any: if wait is True, the sent Telegram message. Otherwise, its future
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
@@ -268,7 +332,7 @@ class TelegramPlatform(Platform):
         session.save_message(Message(t=MessageType.LOCATION, content=location_dict, is_user=False, timestamp=datetime.now()))
         payload = Payload(action=PayloadAction.BOT_REPLY_LOCATION,
                           message=location_dict)
-        self._send(session.id, payload)
+        return self._send(session.id, payload, wait=wait)
 
     def add_handler(self, handler: BaseHandler) -> None:
         """
@@ -37,6 +37,156 @@ type: ``int``
 default value: ``None``
 """
 
+WEBSOCKET_ASYNCIO = Property(SECTION_WEBSOCKET, 'websocket.asyncio', bool, False)
+"""
+Whether to run the WebSocket server with asyncio or not. By default, the server dedicates a thread to each connected
+client. In asyncio mode, connections are handled as coroutines in a single event loop, and the bot processing of the
+incoming messages is dispatched to a thread pool of ``websocket.max_workers`` threads, which allows many more
+concurrent users.
+
+name: ``websocket.asyncio``
+
+type: ``bool``
+
+default value: ``False``
+"""
+
+WEBSOCKET_MAX_WORKERS = Property(SECTION_WEBSOCKET, 'websocket.max_workers', int, None)
+"""
+The maximum number of threads processing the incoming messages when the WebSocket server runs in asyncio mode (see
+``websocket.asyncio``). :obj:`None` uses the default size of :class:`concurrent.futures.ThreadPoolExecutor`.
+
+name: ``websocket.max_workers``
+
+type: ``int``
+
+default value: ``None``
+"""
+
+WEBSOCKET_SESSION_GRACE_PERIOD = Property(SECTION_WEBSOCKET, 'websocket.session_grace_period', int, 0)
+"""
+Time, in seconds, a user session is kept after its client disconnects. If greater than 0, the bot sends a session
+token to each new client, and a client that reconnects with this token (in the ``session_token`` query parameter of the
+WebSocket address) within the grace period resumes its session, receiving the replies it missed while disconnected. If
+0, the sessions are deleted as soon as the clients disconnect.
+
+name: ``websocket.session_grace_period``
+
+type: ``int``
+
+default value: ``0``
+"""
+
+WEBSOCKET_REPLAY_BUFFER_SIZE = Property(SECTION_WEBSOCKET, 'websocket.replay_buffer_size', int, 100)
+"""
+The maximum number of replies stored for a disconnected session, to be sent to the client when it resumes the session
+(see ``websocket.session_grace_period``). If more replies are sent, the oldest ones are discarded.
+
+name: ``websocket.replay_buffer_size``
+
+type: ``int``
+
+default value: ``100``
+"""
+
+WEBSOCKET_OUTBOUND_HIGH_WATER_MARK = Property(SECTION_WEBSOCKET, 'websocket.outbound_high_water_mark', int, 1000)
+"""
+The maximum number of replies waiting to be sent to a client. The replies are queued and sent by a writer of each
+connection, so the bot does not wait for slow clients. When a client does not read the replies fast enough and this
+limit is reached, ``websocket.slow_consumer_policy`` is applied. :obj:`None` disables the limit.
+
+name: ``websocket.outbound_high_water_mark``
+
+type: ``int``
+
+default value: ``1000``
+"""
+
+WEBSOCKET_SLOW_CONSUMER_POLICY = Property(SECTION_WEBSOCKET, 'websocket.slow_consumer_policy', str, 'buffer')
+"""
+What to do with the replies to a client whose queue has reached ``websocket.outbound_high_water_mark``: ``buffer``
+(keep queueing them), ``drop`` (discard them) or ``disconnect`` (close the connection; if session resumption is enabled,
+the queued replies are sent when the client resumes its session).
+
+name: ``websocket.slow_consumer_policy``
+
+type: ``str``
+
+default value: ``buffer``
+"""
+
+WEBSOCKET_MAX_BATCH_SIZE = Property(SECTION_WEBSOCKET, 'websocket.max_batch_size', int, 1)
+"""
+The maximum number of queued replies sent together in a single WebSocket message (as a JSON array of payloads). If 1,
+each reply is sent in its own message. The client must support batched payloads to set a greater value (our UIs do).
+
+name: ``websocket.max_batch_size``
+
+type: ``int``
+
+default value: ``1``
+"""
+
+WEBSOCKET_COMPRESSION = Property(SECTION_WEBSOCKET, 'websocket.compression', bool, True)
+"""
+Whether the WebSocket server accepts the permessage-deflate extension or not. With this extension (negotiated with the
+clients that support it, e.g. web browsers), all the messages are compressed.
+
+name: ``websocket.compression``
+
+type: ``bool``
+
+default value: ``True``
+"""
+
+WEBSOCKET_COMPRESSION_THRESHOLD = Property(SECTION_WEBSOCKET, 'websocket.compression_threshold', int, 1024)
+"""
+The minimum size, in bytes, of the payloads compressed in binary frames. It applies to the clients that support binary
+frames (e.g. our Streamlit UI) and do not support permessage-deflate. :obj:`None` disables this compression.
+
+Only the bot compresses binary frames: the compressed frames received from the clients are discarded.
+
+name: ``websocket.compression_threshold``
+
+type: ``int``
+
+default value: ``1024``
+"""
+
+WEBSOCKET_MAX_CONCURRENT_UPLOADS = Property(SECTION_WEBSOCKET, 'websocket.max_concurrent_uploads', int, 2)
+"""
+The maximum number of chunked file uploads a session can have in progress at the same time. :obj:`None` disables the
+limit.
+
+name: ``websocket.max_concurrent_uploads``
+
+type: ``int``
+
+default value: ``2``
+"""
+
+WEBSOCKET_MAX_UPLOAD_BYTES = Property(SECTION_WEBSOCKET, 'websocket.max_upload_bytes', int, 100 * 1024 * 1024)
+"""
+The maximum number of bytes of the chunked file uploads a session has in progress. :obj:`None` disables the limit.
+
+name: ``websocket.max_upload_bytes``
+
+type: ``int``
+
+default value: ``104857600`` (100 MB)
+"""
+
+WEBSOCKET_UPLOAD_SPOOL_DIR = Property(SECTION_WEBSOCKET, 'websocket.upload_spool_dir', str, None)
+"""
+The directory where the chunked file uploads are assembled. If not set, the system temporary directory is used.
+
+name: ``websocket.upload_spool_dir``
+
+type: ``str``
+
+default value: ``None``
+"""
+
 STREAMLIT_HOST = Property(SECTION_WEBSOCKET, 'streamlit.host', str, 'localhost')
 """
 The Streamlit UI host address. If you are using our default UI, you must define its address where you can access and 
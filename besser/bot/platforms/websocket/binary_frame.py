@@ -0,0 +1,64 @@
+import struct
+import zlib
+
+from besser.bot.platforms.codec import dumps_bytes, loads
+
+FLAG_COMPRESSED = 0x01
+"""Flag of the binary frames whose content is compressed with zlib."""
+
+
+def encode_binary_frame(payload_dict: dict, data: bytes = b'', compress: bool = False) -> bytes:
+    """Encode a payload into a binary WebSocket frame.
+
+    Binary frames allow sending the content of files and images as raw bytes, instead of base64 strings embedded in
+    the JSON payload (which are 33% larger). A binary frame is composed of:
+
+    - 1 byte of flags (see :obj:`FLAG_COMPRESSED`)
+    - the frame body (compressed with zlib if the flag is set), composed of:
+
+      - the length of the header, as a 4-byte big-endian unsigned integer
+      - the header: the JSON payload (action and message), encoded in UTF-8
+      - the binary data of the payload
+
+    Args:
+        payload_dict (dict): the payload (action and message)
+        data (bytes): the binary data of the payload
+        compress (bool): whether to compress the frame body or not
+
+    Returns:
+        bytes: the binary frame
+    """
+    header = dumps_bytes(payload_dict)
+    body = struct.pack('>I', len(header)) + header + data
+    flags = 0
+    if compress:
+        body = zlib.compress(body)
+        flags |= FLAG_COMPRESSED
+    return bytes([flags]) + body
+
+
+def decode_binary_frame(frame: bytes, allow_compressed: bool = True) -> tuple[dict, bytes]:
+    """Decode a binary WebSocket frame (see :func:`encode_binary_frame`).
+
+    The frames received from untrusted clients must not be compressed: the decompressed size is not limited, so a
+    small frame could be decompressed into gigabytes (a decompression bomb).
+
+    Args:
+        frame (bytes): the binary frame
+        allow_compressed (bool): whether to accept compressed frames or not
+
+    Returns:
+        tuple[dict, bytes]: the payload (action and message) and its binary data
+
+    Raises:
+        ValueError: if the frame is compressed and compressed frames are not allowed
+    """
+    flags = frame[0]
+    body = memoryview(frame)[1:]
+    if flags & FLAG_COMPRESSED:
+        if not allow_compressed:
+            raise ValueError('Compressed binary frames are not accepted')
+        body = memoryview(zlib.decompress(body))
+    header_length = struct.unpack('>I', body[:4])[0]
+    payload_dict = loads(bytes(body[4:4 + header_length]))
+    return payload_dict, bytes(body[4 + header_length:])
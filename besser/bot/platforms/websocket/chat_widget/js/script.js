@@ -49,8 +49,10 @@ function renderChatWidget(args) {
 
     ws.onmessage = (event) => {
       try {
-        const payload = JSON.parse(event.data);
-        displayMessage(payload, 'bot-message');
+        const data = JSON.parse(event.data);
+        // Multiple payloads can be batched in a single message
+        const payloads = Array.isArray(data) ? data : [data];
+        payloads.forEach((payload) => displayMessage(payload, 'bot-message'));
       } catch (error) {
         console.error('Error parsing message:', error);
       }
@@ -376,6 +378,22 @@ function displayMessage(payload, className) {
     else if (payload.action === 'bot_reply_plotly' && payload.message) {
         messageElement = getMessagePlotly(payload.message);
     }
+    else if (payload.action === 'bot_reply_stream_start' && payload.message) {
+        messageElement = getMessageStr('');
+        messageElement.id = `stream-${payload.message.id}`;
+    }
+    else if (payload.action === 'bot_reply_stream_chunk' && payload.message) {
+        // Append the chunk to the streamed message (ignored if its start was not received)
+        const streamElement = document.getElementById(`stream-${payload.message.id}`);
+        if (streamElement) {
+            streamElement.textContent += payload.message.chunk;
+            chatMessages.scrollTop = chatMessages.scrollHeight;
+        }
+        return;
+    }
+    else if (payload.action === 'bot_reply_stream_end') {
+        return;
+    }
     else {
         console.warn('Received unknown message format:', payload);
     }
@@ -0,0 +1,217 @@
+import hashlib
+import os
+import threading
+from contextlib import suppress
+
+from besser.bot.core.file import File, create_spool_path
+
+
+class FileUploadError(Exception):
+    """Exception raised when a chunked file upload is invalid (e.g. a chunk is missing or a limit is exceeded). The
+    upload is aborted.
+
+    Args:
+        upload_id (str): the upload id
+        reason (str): the reason of the error
+    """
+
+    def __init__(self, upload_id: str, reason: str):
+        self.upload_id: str = upload_id
+        self.reason: str = reason
+        super().__init__(f"File upload '{upload_id}' failed: {reason}")
+
+
+class FileUpload:
+    """A file being uploaded in chunks. The chunks are written to a temporary file in the spool directory.
+
+    Args:
+        upload_id (str): the upload id
+        name (str): the name of the file
+        type (str): the type of the file
+        spool_dir (str or None): the spool directory. If None, the system temporary directory is used
+
+    Attributes:
+        id (str): The upload id
+        name (str): The name of the file
+        type (str): The type of the file
+        size (int): The number of bytes received
+        _path (str): The path of the temporary file
+        _file (BinaryIO): The temporary file, opened for writing
+        _next_seq (int): The sequence number of the next expected chunk
+        _hash (hashlib._Hash): The SHA-256 hash of the received bytes
+    """
+
+    def __init__(self, upload_id: str, name: str, type: str, spool_dir: str = None):
+        self.id: str = upload_id
+        self.name: str = name
+        self.type: str = type
+        self.size: int = 0
+        self._path: str = create_spool_path(spool_dir)
+        self._file = open(self._path, 'wb')
+        self._next_seq: int = 0
+        self._hash = hashlib.sha256()
+
+    def write(self, seq: int, data: bytes) -> None:
+        """Write a chunk of the file.
+
+        Args:
+            seq (int): the sequence number of the chunk (starting at 0)
+            data (bytes): the chunk data
+        """
+        if seq != self._next_seq:
+            raise FileUploadError(self.id, f'expected chunk {self._next_seq}, got chunk {seq}')
+        self._file.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+        self._next_seq += 1
+
+    def finish(self, checksum: str = None) -> File:
+        """Finish the upload.
+
+        Args:
+            checksum (str, optional): the SHA-256 hex digest of the file, to verify its integrity
+
+        Returns:
+            File: the uploaded file. Its temporary file is removed when the File object is garbage collected
+        """
+        self._file.close()
+        if checksum is not None and checksum.lower() != self._hash.hexdigest():
+            self.abort()
+            raise FileUploadError(self.id, 'checksum mismatch')
+        return File(file_name=self.name, file_type=self.type, file_path=self._path, temporary=True)
+
+    def abort(self) -> None:
+        """Abort the upload, removing its temporary file."""
+        self._file.close()
+        with suppress(OSError):
+            os.remove(self._path)
+
+
+class FileUploads:
+    """The chunked file uploads in progress of a session.
+
+    A client uploads a file sending a
+    :obj:`~besser.bot.platforms.payload.PayloadAction.USER_FILE_UPLOAD_BEGIN` payload, then the file chunks in
+    :obj:`~besser.bot.platforms.payload.PayloadAction.USER_FILE_UPLOAD_CHUNK` payloads (with consecutive sequence
+    numbers) and finally a :obj:`~besser.bot.platforms.payload.PayloadAction.USER_FILE_UPLOAD_END` payload.
+
+    Args:
+        max_concurrent_uploads (int or None): the maximum number of uploads in progress. :obj:`None` disables the
+            limit
+        max_upload_bytes (int or None): the maximum number of bytes of the uploads in progress. :obj:`None` disables
+            the limit
+        spool_dir (str or None): the directory where the files are assembled. If None, the system temporary directory
+            is used
+
+    Attributes:
+        _max_concurrent_uploads (int or None): The maximum number of uploads in progress
+        _max_upload_bytes (int or None): The maximum number of bytes of the uploads in progress
+        _spool_dir (str or None): The directory where the files are assembled
+        _uploads (dict[str, FileUpload]): The uploads in progress, indexed by their id
+        _lock (threading.Lock): Lock to access the uploads
+    """
+
+    def __init__(self, max_concurrent_uploads: int = None, max_upload_bytes: int = None, spool_dir: str = None):
+        self._max_concurrent_uploads: int = max_concurrent_uploads
+        self._max_upload_bytes: int = max_upload_bytes
+        self._spool_dir: str = spool_dir
+        self._uploads: dict[str, FileUpload] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get(self, upload_id: str) -> FileUpload:
+        """Get an upload in progress.
+
+        Args:
+            upload_id (str): the upload id
+
+        Returns:
+            FileUpload: the upload
+        """
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise FileUploadError(upload_id, 'unknown upload')
+        return upload
+
+    def begin(self, upload_id: str, name: str, type: str, size: int = None) -> None:
+        """Begin an upload.
+
+        Args:
+            upload_id (str): the upload id, chosen by the client
+            name (str): the name of the file
+            type (str): the type of the file
+            size (int, optional): the announced size of the file, in bytes, to reject it early if it is too large
+        """
+        with self._lock:
+            if upload_id in self._uploads:
+                raise FileUploadError(upload_id, 'duplicated upload id')
+            if self._max_concurrent_uploads is not None and len(self._uploads) >= self._max_concurrent_uploads:
+                raise FileUploadError(upload_id, f'too many concurrent uploads (max {self._max_concurrent_uploads})')
+            if size is not None and self._max_upload_bytes is not None \
+                    and self._uploaded_bytes() + size > self._max_upload_bytes:
+                raise FileUploadError(upload_id, f'upload size limit exceeded (max {self._max_upload_bytes} bytes)')
+            self._uploads[upload_id] = FileUpload(upload_id, name, type, self._spool_dir)
+
+    def write(self, upload_id: str, seq: int, data: bytes) -> None:
+        """Write a chunk of an upload. If the chunk is invalid, the upload is aborted.
+
+        Args:
+            upload_id (str): the upload id
+            seq (int): the sequence number of the chunk (starting at 0)
+            data (bytes): the chunk data
+        """
+        with self._lock:
+            upload = self._get(upload_id)
+            try:
+                if self._max_upload_bytes is not None \
+                        and self._uploaded_bytes() + len(data) > self._max_upload_bytes:
+                    raise FileUploadError(upload_id, f'upload size limit exceeded (max {self._max_upload_bytes} bytes)')
+                upload.write(seq, data)
+            except BaseException:
+                del self._uploads[upload_id]
+                upload.abort()
+                raise
+
+    def end(self, upload_id: str, checksum: str = None) -> File:
+        """End an upload.
+
+        Args:
+            upload_id (str): the upload id
+            checksum (str, optional): the SHA-256 hex digest of the file, to verify its integrity
+
+        Returns:
+            File: the uploaded file
+        """
+        with self._lock:
+            upload = self._get(upload_id)
+            del self._uploads[upload_id]
+        return upload.finish(checksum)
+
+    def abort(self, upload_id: str) -> None:
+        """Abort an upload, if it is in progress.
+
+        Args:
+            upload_id (str): the upload id
+        """
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+        if upload is not None:
+            upload.abort()
+
+    def abort_all(self) -> None:
+        """Abort all the uploads in progress."""
+        with self._lock:
+            uploads = list(self._uploads.values())
+            self._uploads.clear()
+        for upload in uploads:
+            upload.abort()
+
+    def _uploaded_bytes(self) -> int:
+        """Get the number of bytes received by the uploads in progress.
+
+        Returns:
+            int: the number of bytes
+        """
+        return sum(upload.size for upload in self._uploads.values())
+
+    def __len__(self):
+        return len(self._uploads)
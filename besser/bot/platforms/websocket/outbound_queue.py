@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+
+SLOW_CONSUMER_BUFFER = 'buffer'
+"""Slow consumer policy: keep queueing the payloads above the high-water mark."""
+
+SLOW_CONSUMER_DROP = 'drop'
+"""Slow consumer policy: discard the payloads above the high-water mark."""
+
+SLOW_CONSUMER_DISCONNECT = 'disconnect'
+"""Slow consumer policy: close the connection when the high-water mark is exceeded."""
+
+SLOW_CONSUMER_POLICIES = [SLOW_CONSUMER_BUFFER, SLOW_CONSUMER_DROP, SLOW_CONSUMER_DISCONNECT]
+
+
+class OutboundQueue:
+    """The queue of payloads waiting to be sent through a WebSocket connection.
+
+    The bot threads put payloads in the queue without waiting for them to be sent, and a writer (a thread, or a
+    coroutine if the queue is bound to an event loop) gets them in batches and sends them to the client.
+
+    When the number of queued payloads reaches the high-water mark (i.e. the client does not read them fast enough),
+    the slow consumer policy decides what to do with the new payloads: keep them (:obj:`SLOW_CONSUMER_BUFFER`),
+    discard them (:obj:`SLOW_CONSUMER_DROP`) or close the connection (:obj:`SLOW_CONSUMER_DISCONNECT`).
+
+    Args:
+        high_water_mark (int or None): the maximum number of queued payloads. :obj:`None` disables the limit
+        policy (str): the slow consumer policy
+        max_batch_size (int): the maximum number of payloads the writer gets at once
+
+    Attributes:
+        closed (bool): Whether the queue is closed or not. A closed queue does not accept more payloads
+        _high_water_mark (int or None): The maximum number of queued payloads
+        _policy (str): The slow consumer policy
+        _max_batch_size (int): The maximum number of payloads the writer gets at once
+        _payloads (deque[str | bytes]): The queued payloads
+        _lock (threading.Lock): Lock to access the queued payloads
+        _ready (threading.Event): Event set when there are payloads to send (or the queue is closed)
+        _loop (asyncio.AbstractEventLoop or None): The event loop of the writer coroutine, if any
+        _async_ready (asyncio.Event or None): The equivalent of `_ready` for the writer coroutine
+        _overflowed (bool): Whether the high-water mark has been exceeded (to close the connection only once)
+        _warned (bool): Whether the high-water mark warning has been logged (to log it only once per queue)
+    """
+
+    def __init__(self, high_water_mark: int = None, policy: str = SLOW_CONSUMER_BUFFER, max_batch_size: int = 1):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy '{policy}', expected one of {SLOW_CONSUMER_POLICIES}")
+        self.closed: bool = False
+        self._high_water_mark: int = high_water_mark
+        self._policy: str = policy
+        self._max_batch_size: int = max(max_batch_size, 1)
+        self._payloads: deque[str | bytes] = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._ready: threading.Event = threading.Event()
+        self._loop: asyncio.AbstractEventLoop = None
+        self._async_ready: asyncio.Event = None
+        self._overflowed: bool = False
+        self._warned: bool = False
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the queue to an event loop, so the writer can be a coroutine (see :meth:`get_batch_async`). It must
+        be called from the event loop.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): the event loop
+        """
+        self._loop = loop
+        self._async_ready = asyncio.Event()
+
+    def _notify(self) -> None:
+        """Wake up the writer."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._async_ready.set)
+        else:
+            self._ready.set()
+
+    def put(self, payload_str: str | bytes) -> bool:
+        """Add a payload to the queue.
+
+        Args:
+            payload_str (str or bytes): the payload to send, as a JSON string (or a binary frame)
+
+        Returns:
+            bool: False if the high-water mark is exceeded and the connection must be closed (with the
+            :obj:`SLOW_CONSUMER_DISCONNECT` policy), True otherwise
+        """
+        with self._lock:
+            if self.closed:
+                return True
+            if self._high_water_mark is not None and len(self._payloads) >= self._high_water_mark:
+                if self._policy == SLOW_CONSUMER_DISCONNECT:
+                    # The payload is kept, so it can be replayed if the session is resumed
+                    self._payloads.append(payload_str)
+                    disconnect = not self._overflowed
+                    self._overflowed = True
+                    return not disconnect
+                if not self._warned:
+                    self._warned = True
+                    logging.warning(f'WebSocket outbound queue exceeded its high-water mark ({self._high_water_mark} '
+                                    f'payloads), applying the "{self._policy}" policy')
+                if self._policy == SLOW_CONSUMER_DROP:
+                    return True
+            self._payloads.append(payload_str)
+        self._notify()
+        return True
+
+    def requeue(self, batch: list[str | bytes]) -> bool:
+        """Put back a batch of payloads at the beginning of the queue (e.g. if they could not be sent).
+
+        Args:
+            batch (list[str | bytes]): the payloads
+
+        Returns:
+            bool: False if the queue is closed (so the payloads were not requeued), True otherwise
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            self._payloads.extendleft(reversed(batch))
+            return True
+
+    def _pop_batch(self) -> list[str | bytes]:
+        """Get the next batch of payloads, without waiting.
+
+        Returns:
+            list[str | bytes]: the payloads (empty if the queue is empty or closed)
+        """
+        with self._lock:
+            if self.closed:
+                return []
+            if self._payloads and isinstance(self._payloads[0], bytes):
+                # Binary frames are sent alone
+                return [self._payloads.popleft()]
+            batch = []
+            while self._payloads and len(batch) < self._max_batch_size and isinstance(self._payloads[0], str):
+                batch.append(self._payloads.popleft())
+            return batch
+
+    def get_batch(self) -> list[str | bytes]:
+        """Wait for the next batch of payloads.
+
+        Returns:
+            list[str | bytes]: the payloads, or an empty list if the queue has been closed
+        """
+        while not self.closed:
+            batch = self._pop_batch()
+            if batch:
+                return batch
+            self._ready.wait()
+            self._ready.clear()
+        return []
+
+    async def get_batch_async(self) -> list[str | bytes]:
+        """Wait for the next batch of payloads, in the event loop the queue is bound to.
+
+        Returns:
+            list[str | bytes]: the payloads, or an empty list if the queue has been closed
+        """
+        while not self.closed:
+            batch = self._pop_batch()
+            if batch:
+                return batch
+            await self._async_ready.wait()
+            self._async_ready.clear()
+        return []
+
+    def close(self) -> list[str | bytes]:
+        """Close the queue, stopping its writer.
+
+        Returns:
+            list[str | bytes]: the payloads that were not sent
+        """
+        with self._lock:
+            self.closed = True
+            payloads = list(self._payloads)
+            self._payloads.clear()
+        self._notify()
+        return payloads
+
+    def __len__(self):
+        return len(self._payloads)
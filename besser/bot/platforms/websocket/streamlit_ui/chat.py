@@ -1,5 +1,4 @@
-import base64
-import json
+import queue
 import time
 from datetime import datetime
 
@@ -7,9 +6,10 @@ import streamlit as st
 
 from besser.bot.core.file import File
 from besser.bot.core.message import Message, MessageType
-from besser.bot.platforms.payload import Payload, PayloadAction, PayloadEncoder
+from besser.bot.platforms.codec import encode_payload
+from besser.bot.platforms.payload import Payload, PayloadAction
 from besser.bot.platforms.websocket.streamlit_ui.vars import TYPING_TIME, BUTTONS, HISTORY, QUEUE, WEBSOCKET, ASSISTANT, \
-    USER
+    USER, STREAM_CHUNK_TIMEOUT
 
 user_type = {
     0: ASSISTANT,
@@ -25,6 +25,19 @@ def stream_text(text: str):
     return stream_callback
 
 
+def stream_chunks(chunks: queue.Queue):
+    # The bot sends the chunks as they are generated, until the stream finishes (None). If no chunk arrives in time
+    # (e.g. the connection was lost), the stream is ended
+    while True:
+        try:
+            chunk = chunks.get(timeout=STREAM_CHUNK_TIMEOUT)
+        except queue.Empty:
+            return
+        if chunk is None:
+            return
+        yield chunk
+
+
 def write_or_stream(content, stream: bool):
     if stream:
         st.write_stream(stream_text(content))
@@ -42,7 +55,7 @@ def write_message(message: Message, key_count: int, stream: bool = False):
             file: File = File.from_dict(message.content)
             file_name = file.name
             file_type = file.type
-            file_data = base64.b64decode(file.base64.encode('utf-8'))
+            file_data = file.data
             st.download_button(label='Download ' + file_name, file_name=file_name, data=file_data, mime=file_type, key=key)
 
         elif message.type == MessageType.IMAGE:
@@ -55,7 +68,7 @@ def write_message(message: Message, key_count: int, stream: bool = False):
                 st.session_state.history.append(message)
                 payload = Payload(action=PayloadAction.USER_MESSAGE, message=option)
                 ws = st.session_state[WEBSOCKET]
-                ws.send(json.dumps(payload, cls=PayloadEncoder))
+                ws.send(encode_payload(payload))
 
             st.pills(label='Choose an option', options=message.content, selection_mode='single', on_change=send_option, key=key)
 
@@ -96,6 +109,12 @@ def load_chat():
 
     while not st.session_state[QUEUE].empty():
         message = st.session_state[QUEUE].get()
-        st.session_state[HISTORY].append(message)
-        write_message(message, key_count, stream=True)
+        if isinstance(message.content, queue.Queue):
+            # Streamed bot reply
+            with st.chat_message(user_type[message.is_user]):
+                message.content = st.write_stream(stream_chunks(message.content))
+            st.session_state[HISTORY].append(message)
+        else:
+            st.session_state[HISTORY].append(message)
+            write_message(message, key_count, stream=True)
         key_count += 1
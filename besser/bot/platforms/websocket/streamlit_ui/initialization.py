@@ -8,7 +8,7 @@ from streamlit.runtime.scriptrunner_utils.script_run_context import add_script_r
 
 from besser.bot.platforms.websocket.streamlit_ui.session_management import session_monitoring
 from besser.bot.platforms.websocket.streamlit_ui.vars import SESSION_MONITORING_INTERVAL, SUBMIT_TEXT, HISTORY, QUEUE, \
-    WEBSOCKET, SESSION_MONITORING, SUBMIT_AUDIO, SUBMIT_FILE
+    WEBSOCKET, SESSION_MONITORING, SUBMIT_AUDIO, SUBMIT_FILE, RECONNECT_INTERVAL, BINARY_FRAMES, STREAMS
 from besser.bot.platforms.websocket.streamlit_ui.websocket_callbacks import on_open, on_error, on_message, on_close, on_ping, on_pong
 
 
@@ -28,6 +28,9 @@ def initialize():
     if QUEUE not in st.session_state:
         st.session_state[QUEUE] = queue.Queue()
 
+    if STREAMS not in st.session_state:
+        st.session_state[STREAMS] = {}
+
     if WEBSOCKET not in st.session_state:
         try:
             # We get the websocket host and port from the script arguments
@@ -37,14 +40,15 @@ def initialize():
             # If they are not provided, we use default values
             host = 'localhost'
             port = '8765'
-        ws = websocket.WebSocketApp(f"ws://{host}:{port}/",
+        # The bot can send files and images in binary frames
+        ws = websocket.WebSocketApp(f"ws://{host}:{port}/?{BINARY_FRAMES}=true",
                                     on_open=on_open,
                                     on_message=on_message,
                                     on_error=on_error,
                                     on_close=on_close,
                                     on_ping=on_ping,
                                     on_pong=on_pong)
-        websocket_thread = threading.Thread(target=ws.run_forever)
+        websocket_thread = threading.Thread(target=ws.run_forever, kwargs={'reconnect': RECONNECT_INTERVAL})
         add_script_run_ctx(websocket_thread)
         websocket_thread.start()
         st.session_state[WEBSOCKET] = ws
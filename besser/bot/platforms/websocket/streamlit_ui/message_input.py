@@ -1,10 +1,10 @@
-import json
 from datetime import datetime
 
 import streamlit as st
 
 from besser.bot.core.message import Message, MessageType
-from besser.bot.platforms.payload import Payload, PayloadAction, PayloadEncoder
+from besser.bot.platforms.codec import encode_payload
+from besser.bot.platforms.payload import Payload, PayloadAction
 from besser.bot.platforms.websocket.streamlit_ui.vars import BUTTONS, SUBMIT_TEXT, WEBSOCKET, USER
 
 
@@ -27,6 +27,6 @@ def message_input():
                           message=user_input)
         try:
             ws = st.session_state[WEBSOCKET]
-            ws.send(json.dumps(payload, cls=PayloadEncoder))
+            ws.send(encode_payload(payload))
         except Exception as e:
             st.error('Your message could not be sent. The connection is already closed')
@@ -1,14 +1,34 @@
 import base64
-import json
+import hashlib
 import queue
+import uuid
 from datetime import datetime
 
 import streamlit as st
+from websocket import ABNF
 
 from besser.bot.core.file import File
 from besser.bot.core.message import MessageType, Message
-from besser.bot.platforms.payload import PayloadEncoder, PayloadAction, Payload
-from besser.bot.platforms.websocket.streamlit_ui.vars import WEBSOCKET, HISTORY, QUEUE, SUBMIT_AUDIO, SUBMIT_FILE
+from besser.bot.platforms.codec import encode_payload
+from besser.bot.platforms.payload import PayloadAction, Payload
+from besser.bot.platforms.websocket.binary_frame import encode_binary_frame
+from besser.bot.platforms.websocket.streamlit_ui.vars import WEBSOCKET, HISTORY, QUEUE, SUBMIT_AUDIO, SUBMIT_FILE, \
+    FILE_UPLOAD_CHUNK_SIZE
+
+
+def upload_file(ws, file_name: str, file_type: str, data: bytes) -> None:
+    """Upload a file to the bot in chunks, sent in binary frames."""
+    upload_id = uuid.uuid4().hex
+    payload = Payload(action=PayloadAction.USER_FILE_UPLOAD_BEGIN,
+                      message={'id': upload_id, 'name': file_name, 'type': file_type, 'size': len(data)})
+    ws.send(encode_payload(payload))
+    view = memoryview(data)
+    for seq, start in enumerate(range(0, len(data), FILE_UPLOAD_CHUNK_SIZE)):
+        header = {'action': PayloadAction.USER_FILE_UPLOAD_CHUNK.value, 'message': {'id': upload_id, 'seq': seq}}
+        ws.send(encode_binary_frame(header, view[start:start + FILE_UPLOAD_CHUNK_SIZE]), opcode=ABNF.OPCODE_BINARY)
+    payload = Payload(action=PayloadAction.USER_FILE_UPLOAD_END,
+                      message={'id': upload_id, 'checksum': hashlib.sha256(data).hexdigest()})
+    ws.send(encode_payload(payload))
 
 
 def sidebar():
@@ -19,7 +39,7 @@ def sidebar():
             st.session_state[HISTORY] = []
             st.session_state[QUEUE] = queue.Queue()
             payload = Payload(action=PayloadAction.RESET)
-            ws.send(json.dumps(payload, cls=PayloadEncoder))
+            ws.send(encode_payload(payload))
 
         def submit_audio():
             # Necessary callback due to buf after 1.27.0 (https://github.com/streamlit/streamlit/issues/7629)
@@ -36,7 +56,7 @@ def sidebar():
             voice_base64 = base64.b64encode(voice_bytes).decode('utf-8')
             payload = Payload(action=PayloadAction.USER_VOICE, message=voice_base64)
             try:
-                ws.send(json.dumps(payload, cls=PayloadEncoder))
+                ws.send(encode_payload(payload))
             except Exception as e:
                 st.error('Your message could not be sent. The connection is already closed')
 
@@ -49,13 +69,11 @@ def sidebar():
         if st.session_state[SUBMIT_FILE]:
             st.session_state[SUBMIT_FILE] = False
             bytes_data = uploaded_file.read()
-            file_object = File(file_base64=base64.b64encode(bytes_data).decode('utf-8'), file_name=uploaded_file.name,
-                               file_type=uploaded_file.type)
-            payload = Payload(action=PayloadAction.USER_FILE, message=file_object.get_json_string())
+            file_object = File(file_data=bytes_data, file_name=uploaded_file.name, file_type=uploaded_file.type)
             file_message = Message(t=MessageType.FILE, content=file_object.to_dict(), is_user=True,
                                    timestamp=datetime.now())
             st.session_state.history.append(file_message)
             try:
-                ws.send(json.dumps(payload, cls=PayloadEncoder))
+                upload_file(ws, file_object.name, file_object.type, bytes_data)
             except Exception as e:
                 st.error('Your message could not be sent. The connection is already closed')
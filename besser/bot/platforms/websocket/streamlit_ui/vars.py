@@ -4,6 +4,7 @@ BUTTONS = 'buttons'
 HISTORY = 'history'
 QUEUE = 'queue'
 SESSION_MONITORING = 'session_monitoring'
+STREAMS = 'streams'
 SUBMIT_FILE = 'submit_file'
 SUBMIT_TEXT = 'submit_text'
 SUBMIT_AUDIO = 'submit_audio'
@@ -13,6 +14,20 @@ WEBSOCKET = 'websocket'
 # Time interval to check if a streamlit session is still active, in seconds
 SESSION_MONITORING_INTERVAL = 1
 
+# WebSocket address query parameters
+BINARY_FRAMES = 'binary_frames'
+SESSION_TOKEN = 'session_token'
+
+# Time to wait before reconnecting to the bot after the connection is lost, in seconds
+RECONNECT_INTERVAL = 1
+
+# Size of the chunks of the files uploaded to the bot, in bytes
+FILE_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Maximum time to wait for the next chunk of a streamed bot reply before ending it (e.g. if the connection is lost), in
+# seconds
+STREAM_CHUNK_TIMEOUT = 60
+
 # New bot messages are printed with a typing effect. This is the time between words being printed, in seconds
 TYPING_TIME = 0.05
 
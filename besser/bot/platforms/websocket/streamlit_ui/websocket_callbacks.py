@@ -1,7 +1,9 @@
 import base64
 import json
+import queue
 from datetime import datetime
 from io import StringIO
+from urllib.parse import urlencode
 
 import cv2
 import numpy as np
@@ -9,19 +11,59 @@ import pandas as pd
 import plotly
 
 from besser.bot.core.message import MessageType, Message
+from besser.bot.platforms.codec import decode_payload, decode_payloads
 from besser.bot.platforms.payload import PayloadAction, Payload
+from besser.bot.platforms.websocket.binary_frame import decode_binary_frame
 from besser.bot.platforms.websocket.streamlit_ui.session_management import get_streamlit_session
-from besser.bot.platforms.websocket.streamlit_ui.vars import QUEUE
+from besser.bot.platforms.websocket.streamlit_ui.vars import BINARY_FRAMES, QUEUE, SESSION_TOKEN, STREAMS
 
 
 def on_message(ws, payload_str):
     # https://github.com/streamlit/streamlit/issues/2838
     streamlit_session = get_streamlit_session()
-    payload: Payload = Payload.decode(payload_str)
+    if isinstance(payload_str, bytes):
+        # Binary frame, containing a payload and its binary data
+        payload_dict, data = decode_binary_frame(payload_str)
+        rerun = handle_payload(ws, streamlit_session, decode_payload(payload_dict), data)
+    else:
+        rerun = False
+        # Multiple payloads can be batched in a single message
+        for payload in decode_payloads(payload_str):
+            rerun = handle_payload(ws, streamlit_session, payload) or rerun
+    if rerun:
+        streamlit_session._handle_rerun_script_request()
+
+
+def handle_payload(ws, streamlit_session, payload: Payload, data: bytes = None) -> bool:
+    """Handle a payload received from the bot. Returns whether the streamlit script must be rerun or not."""
     content = None
-    if payload.action == PayloadAction.BOT_REPLY_STR.value:
+    if payload.action == PayloadAction.SESSION_TOKEN.value:
+        # Reconnections will resume the bot session
+        ws.url = f"{ws.url.split('?')[0]}?{urlencode({BINARY_FRAMES: 'true', SESSION_TOKEN: payload.message})}"
+        return False
+    if payload.action == PayloadAction.BOT_REPLY_STREAM_CHUNK.value:
+        # The chunks are written by the running script, which is waiting for them. The chunks of unknown streams (e.g.
+        # whose start was dropped or sent before a reconnection) are ignored
+        chunks = streamlit_session._session_state[STREAMS].get(payload.message['id'])
+        if chunks is not None:
+            chunks.put(payload.message['chunk'])
+        return False
+    if payload.action == PayloadAction.BOT_REPLY_STREAM_END.value:
+        chunks = streamlit_session._session_state[STREAMS].pop(payload.message['id'], None)
+        if chunks is not None:
+            chunks.put(None)
+        return False
+    if payload.action == PayloadAction.BOT_REPLY_STREAM_START.value:
+        # The message content is the queue of chunks, replaced by the whole text once it is written
+        content = queue.Queue()
+        streamlit_session._session_state[STREAMS][payload.message['id']] = content
+        t = MessageType.STR
+    elif payload.action == PayloadAction.BOT_REPLY_STR.value:
         content = payload.message
         t = MessageType.STR
+    elif payload.action == PayloadAction.FILE_UPLOAD_ERROR.value:
+        content = f"The file could not be uploaded: {payload.message['error']}"
+        t = MessageType.STR
     elif payload.action == PayloadAction.BOT_REPLY_MARKDOWN.value:
         content = payload.message
         t = MessageType.MARKDOWN
@@ -30,9 +72,11 @@ def on_message(ws, payload_str):
         t = MessageType.HTML
     elif payload.action == PayloadAction.BOT_REPLY_FILE.value:
         content = payload.message
+        if data:
+            content['base64'] = base64.b64encode(data).decode('utf-8')
         t = MessageType.FILE
     elif payload.action == PayloadAction.BOT_REPLY_IMAGE.value:
-        decoded_data = base64.b64decode(payload.message)  # Decode base64 back to bytes
+        decoded_data = data if data else base64.b64decode(payload.message)  # Decode base64 back to bytes
         np_data = np.frombuffer(decoded_data, np.uint8)  # Convert bytes to numpy array
         img = cv2.imdecode(np_data, cv2.IMREAD_COLOR)  # Decode numpy array back to image
         content = img
@@ -61,8 +105,7 @@ def on_message(ws, payload_str):
     if content is not None:
         message = Message(t=t, content=content, is_user=False, timestamp=datetime.now())
         streamlit_session._session_state[QUEUE].put(message)
-
-    streamlit_session._handle_rerun_script_request()
+    return True
 
 
 def on_error(ws, error):
@@ -1,33 +1,43 @@
+import asyncio
 import base64
-import inspect
 import json
 import logging
 import os
+import secrets
+from collections import deque
 from datetime import datetime
 
-import cv2
-import numpy as np
-import plotly
 import subprocess
 import threading
-from typing import TYPE_CHECKING
-
-from pandas import DataFrame
-from websockets.exceptions import ConnectionClosedError
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+
+from websockets.exceptions import ConnectionClosed, ConnectionClosedError
+from websockets.extensions.permessage_deflate import PerMessageDeflate
+from websockets.server import WebSocketServerProtocol, serve as serve_async
 from websockets.sync.server import ServerConnection, WebSocketServer, serve
 
 from besser.bot.core.message import Message, MessageType
 from besser.bot.core.session import Session
 from besser.bot.exceptions.exceptions import PlatformMismatchError
-from besser.bot.nlp.rag.rag import RAGMessage
 from besser.bot.platforms import websocket
-from besser.bot.platforms.payload import Payload, PayloadAction, PayloadEncoder
+from besser.bot.platforms.codec import decode_payload, encode_payload
+from besser.bot.platforms.payload import Payload, PayloadAction
 from besser.bot.platforms.platform import Platform
-from besser.bot.platforms.websocket.streamlit_ui import streamlit_ui
+from besser.bot.platforms.websocket.binary_frame import decode_binary_frame, encode_binary_frame
+from besser.bot.platforms.websocket.file_upload import FileUploadError, FileUploads
+from besser.bot.platforms.websocket.outbound_queue import OutboundQueue
 from besser.bot.core.file import File
 
 if TYPE_CHECKING:
+    import numpy as np
+    import plotly
+    from pandas import DataFrame
+
     from besser.bot.core.bot import Bot
+    from besser.bot.nlp.rag.rag import RAGMessage
 
 
 class WebSocketPlatform(Platform):
@@ -37,6 +47,10 @@ class WebSocketPlatform(Platform):
     This platform implements the WebSocket server, and it can establish connection with a client, allowing the
     bidirectional communication between server and client (i.e. sending and receiving messages).
 
+    The server can run in 2 modes (see the :obj:`~besser.bot.platforms.websocket.WEBSOCKET_ASYNCIO` property): by
+    default, each connection is handled in a dedicated thread. In asyncio mode, connections are coroutines running in a
+    single event loop, and the bot processing of the incoming messages is dispatched to a bounded thread pool.
+
     Note:
         We provide different interfaces implementing a WebSocket client to communicate with the bot, though you
         can use or create your own UI as long as it has a WebSocket client that connects to the bot's WebSocket server.
@@ -50,10 +64,32 @@ class WebSocketPlatform(Platform):
         _host (str): The WebSocket host address (e.g. `localhost`)
         _port (int): The WebSocket port (e.g. `8765`)
         _use_ui (bool): Whether to use the built-in UI or not
-        _connections (dict[str, ServerConnection]): The list of active connections (i.e. users connected to the bot)
-        _websocket_server (WebSocketServer or None): The WebSocket server instance
+        _use_asyncio (bool): Whether the WebSocket server runs in asyncio mode or not
+        _connections (dict[str, ServerConnection or WebSocketServerProtocol]): The list of active connections (i.e.
+            users connected to the bot)
+        _websocket_server (WebSocketServer or None): The WebSocket server instance (only in the default mode)
+        _event_loop (asyncio.AbstractEventLoop or None): The event loop running the WebSocket server (only in asyncio
+            mode)
+        _executor (ThreadPoolExecutor or None): The thread pool where the bot processes the incoming messages (only in
+            asyncio mode)
+        _stop_event (asyncio.Event or None): The event that stops the WebSocket server (only in asyncio mode)
+        _session_grace_period (int): Time, in seconds, a session is kept after its client disconnects
+        _session_tokens (dict[str, str]): The session ids of the session tokens sent to the clients
+        _tokens (dict[str, str]): The session token of each session id
+        _replay_buffers (dict[str, deque[str or bytes]]): The replies sent to disconnected sessions, to be sent when the
+            sessions are resumed
+        _expiration_timers (dict[str, threading.Timer or concurrent.futures.Future]): The timers that delete the
+            disconnected sessions when their grace period ends
+        _outbound_queues (dict[str, OutboundQueue]): The queue of replies waiting to be sent to each session
+        _binary_frames (dict[str, bool]): The sessions whose client supports binary frames, and whether the large
+            payloads sent to them must be compressed (i.e. whether the connection does not use permessage-deflate)
+        _file_uploads (dict[str, FileUploads]): The chunked file uploads in progress of each session
+        _sessions_lock (threading.Lock): Lock to access the connections, the outbound queues and the session
+            resumption data
         _message_handler (Callable[[ServerConnection], None]): The function that handles the user connections
             (sessions) and incoming messages
+        _async_message_handler (Callable[[WebSocketServerProtocol], Awaitable[None]]): The coroutine that handles the
+            user connections (sessions) and incoming messages in asyncio mode
     """
 
     def __init__(self, bot: 'Bot', use_ui: bool = True):
@@ -62,8 +98,21 @@ class WebSocketPlatform(Platform):
         self._host: str = None
         self._port: int = None
         self._use_ui: bool = use_ui
-        self._connections: dict[str, ServerConnection] = {}
+        self._use_asyncio: bool = False
+        self._connections: dict[str, ServerConnection | WebSocketServerProtocol] = {}
         self._websocket_server: WebSocketServer = None
+        self._event_loop: asyncio.AbstractEventLoop = None
+        self._executor: ThreadPoolExecutor = None
+        self._stop_event: asyncio.Event = None
+        self._session_grace_period: int = 0
+        self._session_tokens: dict[str, str] = {}
+        self._tokens: dict[str, str] = {}
+        self._replay_buffers: dict[str, deque[str | bytes]] = {}
+        self._expiration_timers: dict[str, threading.Timer | Future] = {}
+        self._outbound_queues: dict[str, OutboundQueue] = {}
+        self._binary_frames: dict[str, bool] = {}
+        self._file_uploads: dict[str, FileUploads] = {}
+        self._sessions_lock: threading.Lock = threading.Lock()
 
         def message_handler(conn: ServerConnection) -> None:
             """This method is run on each user connection to handle incoming messages and the bot sessions.
@@ -71,24 +120,15 @@ class WebSocketPlatform(Platform):
             Args:
                 conn (ServerConnection): the user connection
             """
-            self._connections[str(conn.id)] = conn
-            session = self._bot.get_or_create_session(str(conn.id), self)
+            queue = self._new_outbound_queue()
+            session = None
             try:
+                session = self._open_session(conn, queue)
+                threading.Thread(target=self._write, args=(conn, queue, session.id), daemon=True).start()
                 for payload_str in conn:
                     if not self.running:
                         raise ConnectionClosedError(None, None)
-                    payload: Payload = Payload.decode(payload_str)
-                    if payload.action == PayloadAction.USER_MESSAGE.value:
-                        self._bot.receive_message(session.id, payload.message)
-                    elif payload.action == PayloadAction.USER_VOICE.value:
-                        # Decode the base64 string to get audio bytes
-                        audio_bytes = base64.b64decode(payload.message.encode('utf-8'))
-                        message = self._bot.nlp_engine.speech2text(audio_bytes)
-                        self._bot.receive_message(session.id, message)
-                    elif payload.action == PayloadAction.USER_FILE.value:
-                        self._bot.receive_file(session.id, File.decode(payload.message))
-                    elif payload.action == PayloadAction.RESET.value:
-                        self._bot.reset(session.id)
+                    self._handle_payload(session, payload_str)
             except ConnectionClosedError:
                 pass
                 # logging.error(f'The client closed unexpectedly')
@@ -97,19 +137,384 @@ class WebSocketPlatform(Platform):
                 # logging.error("Server Error:", e)
             finally:
                 # logging.info(f'Session finished')
-                self._bot.delete_session(session.id)
-                del self._connections[session.id]
+                if session is not None:
+                    self._close_session(session.id, conn)
+                else:
+                    queue.close()
         self._message_handler = message_handler
 
+        async def async_message_handler(conn: WebSocketServerProtocol) -> None:
+            """This coroutine is run on each user connection to handle incoming messages and the bot sessions, when
+            the WebSocket server runs in asyncio mode.
+
+            The bot processing is run in the platform's thread pool, one message at a time for each connection, so
+            the messages of a user are processed in order.
+
+            Args:
+                conn (WebSocketServerProtocol): the user connection
+            """
+            loop = asyncio.get_running_loop()
+            queue = self._new_outbound_queue()
+            queue.bind_loop(loop)
+            session = None
+            writer = None
+            try:
+                session = await loop.run_in_executor(self._executor, self._open_session, conn, queue)
+                writer = asyncio.create_task(self._write_async(conn, queue, session.id))
+                async for payload_str in conn:
+                    if not self.running:
+                        raise ConnectionClosedError(None, None)
+                    await loop.run_in_executor(self._executor, self._handle_payload, session, payload_str)
+            except ConnectionClosedError:
+                pass
+            except Exception as e:
+                pass
+            finally:
+                if session is not None:
+                    await loop.run_in_executor(self._executor, self._close_session, session.id, conn)
+                else:
+                    queue.close()
+                if writer is not None:
+                    await writer
+        self._async_message_handler = async_message_handler
+
+    def _new_outbound_queue(self) -> OutboundQueue:
+        """Create the outbound queue of a new connection.
+
+        Returns:
+            OutboundQueue: the outbound queue
+        """
+        return OutboundQueue(
+            high_water_mark=self._bot.get_property(websocket.WEBSOCKET_OUTBOUND_HIGH_WATER_MARK),
+            policy=self._bot.get_property(websocket.WEBSOCKET_SLOW_CONSUMER_POLICY),
+            max_batch_size=self._bot.get_property(websocket.WEBSOCKET_MAX_BATCH_SIZE)
+        )
+
+    @staticmethod
+    def _get_frame(batch: list[str | bytes]) -> str | bytes:
+        """Get the WebSocket message of a batch of payloads: the payload itself if there is only 1, or a JSON array
+        of payloads otherwise.
+
+        Args:
+            batch (list[str or bytes]): the payloads, as JSON strings (or a single binary frame)
+
+        Returns:
+            str or bytes: the message to send
+        """
+        if len(batch) == 1:
+            return batch[0]
+        return '[' + ','.join(batch) + ']'
+
+    def _new_replay_buffer(self) -> deque[str | bytes]:
+        """Create the replay buffer of a disconnected session, which keeps the most recent replies up to
+        :obj:`~besser.bot.platforms.websocket.WEBSOCKET_REPLAY_BUFFER_SIZE`.
+
+        Returns:
+            deque[str or bytes]: the replay buffer
+        """
+        return deque(maxlen=self._bot.get_property(websocket.WEBSOCKET_REPLAY_BUFFER_SIZE))
+
+    def _save_unsent(self, session_id: str, queue: OutboundQueue, batch: list[str | bytes]) -> None:
+        """Keep a batch of payloads that could not be sent because the connection was closed, so they are sent if
+        the session is resumed.
+
+        Args:
+            session_id (str): the session id
+            queue (OutboundQueue): the outbound queue the payloads were taken from
+            batch (list[str or bytes]): the payloads
+        """
+        if queue.requeue(batch):
+            # The payloads are moved to the replay buffer when the connection is detached from its session
+            return
+        with self._sessions_lock:
+            current_queue = self._outbound_queues.get(session_id)
+            if current_queue is not None and current_queue.requeue(batch):
+                # The session has already been resumed by another connection
+                return
+            replay_buffer = self._replay_buffers.get(session_id)
+            if replay_buffer is not None:
+                # The payloads are older than the ones already in the replay buffer
+                self._replay_buffers[session_id] = deque([*batch, *replay_buffer], maxlen=replay_buffer.maxlen)
+
+    def _write(self, conn: ServerConnection, queue: OutboundQueue, session_id: str) -> None:
+        """Send the payloads of an outbound queue through its connection until the queue is closed. It is run in a
+        dedicated thread.
+
+        Args:
+            conn (ServerConnection): the user connection
+            queue (OutboundQueue): the outbound queue of the connection
+            session_id (str): the session id of the connection
+        """
+        while batch := queue.get_batch():
+            try:
+                conn.send(self._get_frame(batch))
+            except ConnectionClosed:
+                self._save_unsent(session_id, queue, batch)
+                break
+
+    async def _write_async(self, conn: WebSocketServerProtocol, queue: OutboundQueue, session_id: str) -> None:
+        """Send the payloads of an outbound queue through its connection until the queue is closed, when the
+        WebSocket server runs in asyncio mode.
+
+        Args:
+            conn (WebSocketServerProtocol): the user connection
+            queue (OutboundQueue): the outbound queue of the connection
+            session_id (str): the session id of the connection
+        """
+        while batch := await queue.get_batch_async():
+            try:
+                await conn.send(self._get_frame(batch))
+            except ConnectionClosed:
+                self._save_unsent(session_id, queue, batch)
+                break
+
+    def _open_session(self, conn: ServerConnection | WebSocketServerProtocol, queue: OutboundQueue) -> Session:
+        """Attach a new connection to its session.
+
+        If the client provides the token of a session in its grace period, the session is resumed and the replies the
+        client missed are sent. Otherwise, a new session is created (and, if session resumption is enabled, its token
+        is sent to the client).
+
+        Args:
+            conn (ServerConnection or WebSocketServerProtocol): the user connection
+            queue (OutboundQueue): the outbound queue of the connection
+
+        Returns:
+            Session: the session of the connection
+        """
+        path = conn.path if self._use_asyncio else conn.request.path
+        query = parse_qs(urlparse(path).query)
+        token = query.get('session_token', [None])[0]
+        binary_frames = query.get('binary_frames', ['false'])[0].lower() == 'true'
+        extensions = conn.extensions if self._use_asyncio else conn.protocol.extensions
+        deflate = any(isinstance(extension, PerMessageDeflate) for extension in extensions)
+        with self._sessions_lock:
+            session_id = self._session_tokens.get(token)
+            if session_id is None:
+                session_id = str(conn.id)
+                if self._session_grace_period > 0:
+                    token = secrets.token_urlsafe(32)
+                    self._session_tokens[token] = session_id
+                    self._tokens[session_id] = token
+                    payload = Payload(action=PayloadAction.SESSION_TOKEN, message=token)
+                    queue.put(encode_payload(payload))
+            else:
+                timer = self._expiration_timers.pop(session_id, None)
+                if timer is not None:
+                    timer.cancel()
+                if session_id in self._outbound_queues:
+                    # The previous connection is not closed yet, its pending replies are sent to the new one
+                    self._replay_buffers.setdefault(session_id, self._new_replay_buffer()).extend(
+                        self._outbound_queues.pop(session_id).close()
+                    )
+                logging.info(f'Session {session_id} resumed')
+            for payload_str in self._replay_buffers.pop(session_id, []):
+                queue.put(payload_str)
+            self._connections[session_id] = conn
+            self._outbound_queues[session_id] = queue
+            if binary_frames:
+                self._binary_frames[session_id] = not deflate
+            else:
+                self._binary_frames.pop(session_id, None)
+        try:
+            return self._bot.get_or_create_session(session_id, self)
+        except Exception:
+            # Detach the connection (its outbound queue is closed by the connection handler)
+            with self._sessions_lock:
+                if self._connections.get(session_id) is conn:
+                    del self._connections[session_id]
+                    del self._outbound_queues[session_id]
+            raise
+
+    def _close_session(self, session_id: str, conn: ServerConnection | WebSocketServerProtocol) -> None:
+        """Detach a closed connection from its session.
+
+        If session resumption is enabled, the session is kept during the grace period. Otherwise, it is deleted.
+
+        Args:
+            session_id (str): the session id
+            conn (ServerConnection or WebSocketServerProtocol): the closed user connection
+        """
+        with self._sessions_lock:
+            if self._connections.get(session_id) is not conn:
+                # The session has already been resumed by another connection
+                return
+            del self._connections[session_id]
+            pending = self._outbound_queues.pop(session_id).close()
+            if self.running and session_id in self._tokens:
+                self._replay_buffers.setdefault(session_id, self._new_replay_buffer()).extend(pending)
+                if self._use_asyncio:
+                    async def expire_later() -> None:
+                        await asyncio.sleep(self._session_grace_period)
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._executor, self._expire_session, session_id
+                        )
+                    timer = asyncio.run_coroutine_threadsafe(expire_later(), self._event_loop)
+                else:
+                    timer = threading.Timer(self._session_grace_period, self._expire_session, args=(session_id,))
+                    timer.daemon = True
+                    timer.start()
+                self._expiration_timers[session_id] = timer
+                return
+            token = self._tokens.pop(session_id, None)
+            self._session_tokens.pop(token, None)
+            self._replay_buffers.pop(session_id, None)
+            self._binary_frames.pop(session_id, None)
+            uploads = self._file_uploads.pop(session_id, None)
+        if uploads is not None:
+            uploads.abort_all()
+        self._bot.delete_session(session_id)
+
+    def _expire_session(self, session_id: str) -> None:
+        """Delete a disconnected session whose grace period has ended.
+
+        Args:
+            session_id (str): the session id
+        """
+        with self._sessions_lock:
+            timer = self._expiration_timers.pop(session_id, None)
+            if timer is None:
+                # The session has been resumed
+                return
+            timer.cancel()
+            token = self._tokens.pop(session_id, None)
+            self._session_tokens.pop(token, None)
+            self._replay_buffers.pop(session_id, None)
+            self._binary_frames.pop(session_id, None)
+            uploads = self._file_uploads.pop(session_id, None)
+        if uploads is not None:
+            uploads.abort_all()
+        logging.info(f'Session {session_id} expired')
+        self._bot.delete_session(session_id)
+
+    def _disconnect(self, conn: ServerConnection | WebSocketServerProtocol) -> None:
+        """Close a connection whose client does not read the replies fast enough.
+
+        Args:
+            conn (ServerConnection or WebSocketServerProtocol): the user connection
+        """
+        logging.warning(f'Closing the WebSocket connection {conn.id}: the client is too slow')
+        if self._use_asyncio:
+            asyncio.run_coroutine_threadsafe(conn.close(code=1008, reason='Slow consumer'), self._event_loop)
+        else:
+            # A closing handshake could block on the slow client
+            conn.close_socket()
+
+    def _handle_payload(self, session: Session, payload_str: str | bytes) -> None:
+        """Process a payload received from a user.
+
+        Args:
+            session (Session): the user session
+            payload_str (str or bytes): the received payload, as a JSON string (or a binary frame)
+        """
+        data = None
+        if isinstance(payload_str, bytes):
+            try:
+                # The client frames are never compressed (see WEBSOCKET_COMPRESSION_THRESHOLD)
+                payload_str, data = decode_binary_frame(payload_str, allow_compressed=False)
+            except ValueError as e:
+                logging.warning(f'Binary frame of session {session.id} discarded: {e}')
+                return
+        payload: Payload = decode_payload(payload_str)
+        if payload is None:
+            return
+        if payload.action == PayloadAction.USER_MESSAGE.value:
+            self._bot.receive_message(session.id, payload.message)
+        elif payload.action == PayloadAction.USER_VOICE.value:
+            # Decode the base64 string to get audio bytes
+            audio_bytes = base64.b64decode(payload.message.encode('utf-8'))
+            message = self._bot.nlp_engine.speech2text(audio_bytes)
+            self._bot.receive_message(session.id, message)
+        elif payload.action == PayloadAction.USER_FILE.value:
+            self._bot.receive_file(session.id, File.decode(payload.message))
+        elif payload.action in (PayloadAction.USER_FILE_UPLOAD_BEGIN.value, PayloadAction.USER_FILE_UPLOAD_CHUNK.value,
+                                PayloadAction.USER_FILE_UPLOAD_END.value):
+            self._handle_file_upload(session, payload, data)
+        elif payload.action == PayloadAction.RESET.value:
+            self._bot.reset(session.id)
+
+    def _get_file_uploads(self, session_id: str) -> FileUploads:
+        """Get the chunked file uploads of a session.
+
+        Args:
+            session_id (str): the session id
+
+        Returns:
+            FileUploads: the file uploads of the session
+        """
+        with self._sessions_lock:
+            uploads = self._file_uploads.get(session_id)
+            if uploads is None:
+                uploads = FileUploads(
+                    max_concurrent_uploads=self._bot.get_property(websocket.WEBSOCKET_MAX_CONCURRENT_UPLOADS),
+                    max_upload_bytes=self._bot.get_property(websocket.WEBSOCKET_MAX_UPLOAD_BYTES),
+                    spool_dir=self._bot.get_property(websocket.WEBSOCKET_UPLOAD_SPOOL_DIR)
+                )
+                self._file_uploads[session_id] = uploads
+            return uploads
+
+    def _handle_file_upload(self, session: Session, payload: Payload, data: bytes = None) -> None:
+        """Process a payload of a chunked file upload. When the upload ends, the file is sent to the bot.
+
+        If the upload fails, a :obj:`~besser.bot.platforms.payload.PayloadAction.FILE_UPLOAD_ERROR` payload is sent
+        to the user.
+
+        Args:
+            session (Session): the user session
+            payload (Payload): the received payload
+            data (bytes, optional): the chunk data, if it was received in a binary frame
+        """
+        uploads = self._get_file_uploads(session.id)
+        upload_id = payload.message['id']
+        try:
+            if payload.action == PayloadAction.USER_FILE_UPLOAD_BEGIN.value:
+                uploads.begin(upload_id, payload.message['name'], payload.message['type'], payload.message.get('size'))
+                return
+            if payload.action == PayloadAction.USER_FILE_UPLOAD_CHUNK.value:
+                if data is None:
+                    data = base64.b64decode(payload.message['data'])
+                uploads.write(upload_id, payload.message['seq'], data)
+                return
+            file = uploads.end(upload_id, payload.message.get('checksum'))
+        except FileUploadError as e:
+            logging.warning(e)
+            self._enqueue(session.id, Payload(action=PayloadAction.FILE_UPLOAD_ERROR,
+                                              message={'id': upload_id, 'error': e.reason}))
+            return
+        self._bot.receive_file(session.id, file)
+
     def initialize(self) -> None:
         self._host = self._bot.get_property(websocket.WEBSOCKET_HOST)
         self._port = self._bot.get_property(websocket.WEBSOCKET_PORT)
-        self._websocket_server = serve(
-            handler=self._message_handler,
-            host=self._host,
-            port=self._port,
-            max_size=self._bot.get_property(websocket.WEBSOCKET_MAX_SIZE)
-        )
+        self._use_asyncio = self._bot.get_property(websocket.WEBSOCKET_ASYNCIO)
+        self._session_grace_period = self._bot.get_property(websocket.WEBSOCKET_SESSION_GRACE_PERIOD)
+        if self._use_asyncio:
+            self._event_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._event_loop)
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._bot.get_property(websocket.WEBSOCKET_MAX_WORKERS),
+                thread_name_prefix=f'{self._bot.name}_websocket'
+            )
+        else:
+            self._websocket_server = serve(
+                handler=self._message_handler,
+                host=self._host,
+                port=self._port,
+                max_size=self._bot.get_property(websocket.WEBSOCKET_MAX_SIZE),
+                compression='deflate' if self._bot.get_property(websocket.WEBSOCKET_COMPRESSION) else None
+            )
+
+    async def _serve(self) -> None:
+        """Run the asyncio WebSocket server until the platform is stopped."""
+        self._stop_event = asyncio.Event()
+        async with serve_async(
+                self._async_message_handler,
+                host=self._host,
+                port=self._port,
+                max_size=self._bot.get_property(websocket.WEBSOCKET_MAX_SIZE),
+                compression='deflate' if self._bot.get_property(websocket.WEBSOCKET_COMPRESSION) else None
+        ):
+            await self._stop_event.wait()
 
     def start(self) -> None:
         if self._use_ui:
@@ -119,7 +524,8 @@ class WebSocketPlatform(Platform):
                     "streamlit", "run",
                     "--server.address", self._bot.get_property(websocket.STREAMLIT_HOST),
                     "--server.port", str(self._bot.get_property(websocket.STREAMLIT_PORT)),
-                    os.path.abspath(inspect.getfile(streamlit_ui)),
+                    # The path is resolved without importing the UI module (and Streamlit) in the bot process
+                    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_ui', 'streamlit_ui.py'),
                     self._bot.name,
                     self._bot.get_property(websocket.WEBSOCKET_HOST),
                     str(self._bot.get_property(websocket.WEBSOCKET_PORT))
@@ -132,22 +538,87 @@ class WebSocketPlatform(Platform):
             self._use_ui = False
         logging.info(f'{self._bot.name}\'s WebSocketPlatform starting at ws://{self._host}:{self._port}')
         self.running = True
-        self._websocket_server.serve_forever()
+        if self._use_asyncio:
+            self._event_loop.run_until_complete(self._serve())
+            # The connection handlers have finished, so there are no more messages to process
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._websocket_server.serve_forever()
 
     def stop(self):
-        self.running = False
-        for conn_id in list(self._connections.keys()):
-            conn = self._connections[conn_id]
-            conn.close_socket()
-        self._websocket_server.shutdown()
+        with self._sessions_lock:
+            self.running = False
+        for session_id in list(self._expiration_timers.keys()):
+            self._expire_session(session_id)
+        if self._use_asyncio:
+            # Closing the server closes all the connections
+            self._event_loop.call_soon_threadsafe(self._stop_event.set)
+        else:
+            for conn_id in list(self._connections.keys()):
+                conn = self._connections[conn_id]
+                conn.close_socket()
+            self._websocket_server.shutdown()
         logging.info(f'{self._bot.name}\'s WebSocketPlatform stopped')
 
-    def _send(self, session_id, payload: Payload) -> None:
+    def _supports_binary_frames(self, session_id: str) -> bool:
+        """Check if the client of a session supports binary frames (see
+        :func:`~besser.bot.platforms.websocket.binary_frame.encode_binary_frame`). Clients enable them with the
+        ``binary_frames=true`` query parameter of the WebSocket address.
+
+        Args:
+            session_id (str): the session id
+
+        Returns:
+            bool: whether the client supports binary frames or not
+        """
+        return session_id in self._binary_frames
+
+    def _send(self, session_id, payload: Payload, data: bytes = None) -> None:
+        """Send a payload message to a specific user.
+
+        Payloads with binary data are sent in binary frames, so the client must support them (see
+        :meth:`_supports_binary_frames`). Large payloads sent to clients supporting binary frames but not
+        permessage-deflate are compressed (see :obj:`~besser.bot.platforms.websocket.WEBSOCKET_COMPRESSION_THRESHOLD`).
+
+        Args:
+            session_id (str): the user to send the response to
+            payload (Payload): the payload message to send to the user
+            data (bytes or None): the binary data of the payload
+        """
         session = self._bot.get_or_create_session(session_id=session_id, platform=self)
         payload.message = self._bot.process(session=session, message=payload.message, is_user_message=False)
-        if session_id in self._connections:
-            conn = self._connections[session_id]
-            conn.send(json.dumps(payload, cls=PayloadEncoder))
+        self._enqueue(session_id, payload, data)
+
+    def _enqueue(self, session_id: str, payload: Payload, data: bytes = None) -> None:
+        """Serialize a payload and put it in the outbound queue of a session (without running the bot processors).
+
+        Args:
+            session_id (str): the user to send the payload to
+            payload (Payload): the payload message to send to the user
+            data (bytes or None): the binary data of the payload
+        """
+        compress = self._binary_frames.get(session_id, False)
+        threshold = self._bot.get_property(websocket.WEBSOCKET_COMPRESSION_THRESHOLD)
+        if data is not None:
+            payload_str = encode_binary_frame(
+                {'action': payload.action, 'message': payload.message},
+                data,
+                compress=compress and threshold is not None and len(data) >= threshold
+            )
+        else:
+            payload_str = encode_payload(payload)
+            if compress and threshold is not None and len(payload_str) >= threshold:
+                payload_str = encode_binary_frame({'action': payload.action, 'message': payload.message}, compress=True)
+        with self._sessions_lock:
+            queue = self._outbound_queues.get(session_id)
+            if queue is None:
+                # If the session is in its grace period, the reply is sent when the session is resumed
+                if session_id in self._replay_buffers:
+                    self._replay_buffers[session_id].append(payload_str)
+                return
+            # The reply is sent by the connection writer, without waiting for the client
+            if not queue.put(payload_str):
+                self._disconnect(self._connections[session_id])
 
     def reply(self, session: Session, message: str) -> None:
         if session.platform is not self:
@@ -157,6 +628,36 @@ class WebSocketPlatform(Platform):
                           message=message)
         self._send(session.id, payload)
 
+    def reply_stream(self, session: Session, stream: Iterable[str]) -> str:
+        """Send a bot reply to a specific user as a stream of text chunks, which are shown to the user as they are
+        generated (e.g. by an LLM, see :meth:`~besser.bot.nlp.llm.llm.LLM.predict_stream`).
+
+        The bot processors are not applied to the chunks. The whole message is saved in the chat history once the
+        stream finishes.
+
+        Args:
+            session (Session): the user session
+            stream (Iterable[str]): the message chunks to send to the user
+
+        Returns:
+            str: the whole message
+        """
+        if session.platform is not self:
+            raise PlatformMismatchError(self, session)
+        stream_id = uuid.uuid4().hex
+        chunks = []
+        self._enqueue(session.id, Payload(action=PayloadAction.BOT_REPLY_STREAM_START, message={'id': stream_id}))
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                payload = Payload(action=PayloadAction.BOT_REPLY_STREAM_CHUNK, message={'id': stream_id, 'chunk': chunk})
+                self._enqueue(session.id, payload)
+        finally:
+            self._enqueue(session.id, Payload(action=PayloadAction.BOT_REPLY_STREAM_END, message={'id': stream_id}))
+        message = ''.join(chunks)
+        session.save_message(Message(t=MessageType.STR, content=message, is_user=False, timestamp=datetime.now()))
+        return message
+
     def reply_markdown(self, session: Session, message: str) -> None:
         """Send a bot reply to a specific user, containing text in Markdown format.
 
@@ -194,16 +695,22 @@ class WebSocketPlatform(Platform):
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
-        session.save_message(Message(t=MessageType.FILE, content=file.get_json_string(), is_user=False, timestamp=datetime.now()))
-        payload = Payload(action=PayloadAction.BOT_REPLY_FILE,
-                          message=file.to_dict())
-        self._send(session.id, payload)
-
-    def reply_image(self, session: Session, img: np.ndarray) -> None:
+        session.save_message(Message(t=MessageType.FILE, content=file.get_json_string, is_user=False, timestamp=datetime.now()))
+        if self._supports_binary_frames(session.id):
+            # The file content is sent as raw bytes
+            payload = Payload(action=PayloadAction.BOT_REPLY_FILE,
+                              message={'name': file.name, 'type': file.type})
+            self._send(session.id, payload, data=file.data)
+        else:
+            payload = Payload(action=PayloadAction.BOT_REPLY_FILE,
+                              message=file.to_dict())
+            self._send(session.id, payload)
+
+    def reply_image(self, session: Session, img: 'np.ndarray') -> None:
         """Send an image reply to a specific user.
 
-        Before being sent, the image is encoded as jpg and then as a base64 string. This must be known before dedocing
-        the image on the client side.
+        Before being sent, the image is encoded as jpg and then as a base64 string (or sent as raw bytes in a binary
+        frame, if the client supports them). This must be known before dedocing the image on the client side.
 
         Args:
             session (Session): the user session
@@ -211,14 +718,19 @@ class WebSocketPlatform(Platform):
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
+        import cv2
         retval, buffer = cv2.imencode('.jpg', img)  # Encode as JPEG
-        base64_img = base64.b64encode(buffer).decode('utf-8')
-        session.save_message(Message(t=MessageType.FILE, content=base64_img, is_user=False, timestamp=datetime.now()))
-        payload = Payload(action=PayloadAction.BOT_REPLY_IMAGE,
-                          message=base64_img)
-        self._send(session.id, payload)
-
-    def reply_dataframe(self, session: Session, df: DataFrame) -> None:
+        session.save_message(Message(t=MessageType.FILE, content=lambda: base64.b64encode(buffer).decode('utf-8'),
+                                     is_user=False, timestamp=datetime.now()))
+        if self._supports_binary_frames(session.id):
+            payload = Payload(action=PayloadAction.BOT_REPLY_IMAGE)
+            self._send(session.id, payload, data=buffer.tobytes())
+        else:
+            payload = Payload(action=PayloadAction.BOT_REPLY_IMAGE,
+                              message=base64.b64encode(buffer).decode('utf-8'))
+            self._send(session.id, payload)
+
+    def reply_dataframe(self, session: Session, df: 'DataFrame') -> None:
         """Send a DataFrame bot reply, i.e. a table, to a specific user.
 
         Args:
@@ -253,7 +765,7 @@ class WebSocketPlatform(Platform):
                           message=message)
         self._send(session.id, payload)
 
-    def reply_plotly(self, session: Session, plot: plotly.graph_objs.Figure) -> None:
+    def reply_plotly(self, session: Session, plot: 'plotly.graph_objs.Figure') -> None:
         """Send a Plotly figure as a bot reply, to a specific user.
 
         Args:
@@ -262,6 +774,7 @@ class WebSocketPlatform(Platform):
         """
         if session.platform is not self:
             raise PlatformMismatchError(self, session)
+        import plotly
         message = plotly.io.to_json(plot)
         session.save_message(Message(t=MessageType.PLOTLY, content=message, is_user=False, timestamp=datetime.now()))
         payload = Payload(action=PayloadAction.BOT_REPLY_PLOTLY,
@@ -284,7 +797,7 @@ class WebSocketPlatform(Platform):
                           message=location_dict)
         self._send(session.id, payload)
 
-    def reply_rag(self, session: Session, rag_message: RAGMessage) -> None:
+    def reply_rag(self, session: Session, rag_message: 'RAGMessage') -> None:
         """Send a rag reply to a specific user.
 
         Args:
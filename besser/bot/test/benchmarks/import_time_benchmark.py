@@ -0,0 +1,72 @@
+"""Benchmark of the time and memory needed to import the bot core.
+
+Each module is imported in a fresh Python process, which reports the import time, its peak memory (RSS) and the
+heavy backends that were imported with it. The heavy backends (e.g. TensorFlow/Keras, Transformers, the platform
+libraries) must only be imported when the bot uses a component that needs them, so the benchmark fails if importing
+:mod:`besser.bot.core.bot` loads any of them.
+
+Run it with ``python -m besser.bot.test.benchmarks.import_time_benchmark``.
+"""
+
+import json
+import subprocess
+import sys
+
+MODULES = [
+    'besser.bot.core.bot',
+    'besser.bot.nlp.nlp_engine',
+    'besser.bot.platforms.websocket.websocket_platform',
+]
+
+HEAVY_MODULES = [
+    'cv2', 'keras', 'langchain_core', 'librosa', 'nltk', 'pandas', 'plotly', 'sqlalchemy', 'speech_recognition',
+    'streamlit', 'telegram', 'tensorflow', 'torch', 'transformers',
+]
+
+GUARDED_MODULE = 'besser.bot.core.bot'
+
+REPETITIONS = 3
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == 'darwin':
+        rss /= 1024
+except ImportError:
+    rss = None
+print(json.dumps({{'seconds': seconds, 'rss': rss, 'heavy': [m for m in {heavy} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    probe = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    failed = False
+    for module in MODULES:
+        results = [measure(module) for _ in range(REPETITIONS)]
+        seconds = min(result['seconds'] for result in results)
+        rss = results[-1]['rss']
+        heavy = results[-1]['heavy']
+        print(module)
+        print(f'  import time (best of {REPETITIONS}){seconds * 1000:>14,.0f} ms')
+        if rss is not None:
+            print(f'  peak RSS{rss:>31,.0f} MB')
+        print(f'  heavy modules imported            {", ".join(heavy) or "none"}')
+        if module == GUARDED_MODULE and heavy:
+            failed = True
+    if failed:
+        print(f'\nImporting {GUARDED_MODULE} must not import any heavy backend')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
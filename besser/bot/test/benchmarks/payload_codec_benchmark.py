@@ -0,0 +1,42 @@
+"""Benchmark of the payload encoding and decoding paths.
+
+Compares the throughput (payloads per second) of :class:`~besser.bot.platforms.payload.PayloadEncoder` and
+:meth:`~besser.bot.platforms.payload.Payload.decode` with the :mod:`~besser.bot.platforms.codec` module, which uses
+orjson if it is installed.
+
+Run it with ``python -m besser.bot.test.benchmarks.payload_codec_benchmark``.
+"""
+
+import json
+import timeit
+
+from besser.bot.platforms import codec
+from besser.bot.platforms.payload import Payload, PayloadAction, PayloadEncoder
+
+ITERATIONS = 100_000
+
+PAYLOADS = {
+    'small': Payload(action=PayloadAction.BOT_REPLY_STR, message='Hello! How can I help you?'),
+    'large': Payload(action=PayloadAction.BOT_REPLY_DF, message=json.dumps({str(i): 'x' * 32 for i in range(500)})),
+}
+
+
+def run(name: str, function, iterations: int) -> None:
+    seconds = timeit.timeit(function, number=iterations)
+    print(f'  {name:<32}{iterations / seconds:>14,.0f} payloads/s')
+
+
+def main():
+    print(f'orjson: {"enabled" if codec.orjson is not None else "not installed"}')
+    for size, payload in PAYLOADS.items():
+        iterations = ITERATIONS if size == 'small' else ITERATIONS // 20
+        payload_str = json.dumps(payload, cls=PayloadEncoder)
+        print(f'{size} payload ({len(payload_str)} bytes)')
+        run('PayloadEncoder', lambda: json.dumps(payload, cls=PayloadEncoder), iterations)
+        run('codec.encode_payload', lambda: codec.encode_payload(payload), iterations)
+        run('Payload.decode', lambda: Payload.decode(payload_str), iterations)
+        run('codec.decode_payload', lambda: codec.decode_payload(payload_str), iterations)
+
+
+if __name__ == '__main__':
+    main()